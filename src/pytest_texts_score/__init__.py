@@ -11,6 +11,7 @@ for recall, which can be more intuitive in certain testing contexts.
 """
 
 from pytest_texts_score.api import (
+    texts_agg_ci,
     texts_agg_f1_max,
     texts_agg_f1_mean,
     texts_agg_f1_median,
@@ -23,12 +24,15 @@ from pytest_texts_score.api import (
     texts_agg_recall_mean,
     texts_agg_recall_median,
     texts_agg_recall_min,
+    texts_agg_runs,
+    texts_agg_scores,
     texts_expect_f1_equal,
     texts_expect_f1_range,
     texts_expect_precision_equal,
     texts_expect_precision_range,
     texts_expect_recall_equal,
     texts_expect_recall_range,
+    texts_expect_scores,
 )
 from pytest_texts_score.api_wrappers import (
     texts_agg_f1_average,
@@ -49,8 +53,12 @@ from pytest_texts_score.api_wrappers import (
     texts_expect_correctness_equal,
     texts_expect_correctness_range,
 )
+from pytest_texts_score.question_bank import use_question_bank
+from pytest_texts_score.results import AggregatedScores
 
 __all__ = [
+    "AggregatedScores",
+    "texts_agg_ci",
     "texts_agg_completeness_average",
     "texts_agg_completeness_mean",
     "texts_agg_completeness_max",
@@ -76,6 +84,8 @@ __all__ = [
     "texts_agg_recall_mean",
     "texts_agg_recall_median",
     "texts_agg_recall_min",
+    "texts_agg_runs",
+    "texts_agg_scores",
     "texts_expect_completeness_equal",
     "texts_expect_completeness_range",
     "texts_expect_correctness_equal",
@@ -86,4 +96,6 @@ __all__ = [
     "texts_expect_precision_range",
     "texts_expect_recall_equal",
     "texts_expect_recall_range",
+    "texts_expect_scores",
+    "use_question_bank",
 ]
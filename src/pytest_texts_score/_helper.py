@@ -184,3 +184,36 @@ def test_score(score: float, max_score: float, min_score: float, expected: str,
         pytest.fail(
             f"Text {score_type} above maximum: {score:.2f} > {max_score}.\n"
             f"`expected`: '{expected}'\n`given`: '{given}'")
+
+
+def test_scores(scores: dict[ScoreType, float],
+                ranges: dict[ScoreType, tuple[float, float]], expected: str,
+                given: str) -> None:
+    """
+    Assert that several calculated scores fall within their expected ranges.
+
+    Unlike :func:`test_score`, all scores are checked before failing, and
+    ``pytest.fail`` reports every violated range together.
+
+    :param scores: The calculated scores by type.
+    :type scores: dict[ScoreType, float]
+    :param ranges: The acceptable ``(min_score, max_score)`` range by type.
+    :type ranges: dict[ScoreType, tuple[float, float]]
+    :param expected: The reference text, used for the failure message.
+    :type expected: str
+    :param given: The evaluated text, used for the failure message.
+    :type given: str
+    """
+    violations = []
+    for score_type, (min_score, max_score) in ranges.items():
+        score_type = ScoreType(score_type)
+        score = scores[score_type]
+        if score < min_score:
+            violations.append(f"Text {score_type} below minimum: "
+                              f"{score:.2f} < {min_score}.")
+        elif score > max_score:
+            violations.append(f"Text {score_type} above maximum: "
+                              f"{score:.2f} > {max_score}.")
+    if violations:
+        pytest.fail("\n".join(violations) +
+                    f"\n`expected`: '{expected}'\n`given`: '{given}'")
@@ -0,0 +1,235 @@
+"""
+Vectorized analysis of repeated evaluations.
+
+Nightly runs with hundreds of runs per text pair need more than one
+aggregated score. :func:`texts_analyze_one_side` keeps every answer of every
+run in an answer runs × questions matrix per question set and
+:class:`ScoreAnalysis` computes all aggregates, bootstrap confidence
+intervals and per-question variance in vectorized form, surfacing the
+questions whose answers are least stable.
+
+The analysis requires NumPy (``pip install pytest-texts-score[analysis]``);
+the rest of the plugin does not.
+"""
+from collections import Counter
+from typing import Any, Optional, Sequence
+
+from pytest_texts_score.communication import evaluate_questions, make_questions
+from pytest_texts_score.evaluate_score import RetryBudget
+from pytest_texts_score.questions import normalize_question
+from pytest_texts_score.records import QuestionAnswers, mean_answer
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
+
+def _require_numpy() -> None:
+    """Raise a helpful error if NumPy is not installed."""
+    if numpy is None:
+        raise ImportError(
+            "NumPy is required for the analysis; install it with "
+            "`pip install pytest-texts-score[analysis]`.")
+
+
+class ScoreAnalysis:
+    """
+    Answers of repeated one-sided evaluations, as one matrix per question set.
+
+    Every question run generates a new question set, so questions are only
+    aligned between the answer runs of one set: each set has an answer runs
+    × questions matrix. A question asked several times in a run has one
+    column per occurrence, so that the mean of a matrix row is the score of
+    its run.
+
+    :param runs: The answers of every run.
+    :type runs: list[QuestionAnswers]
+    :param question_runs: The question run of every run; runs of the same
+                          question run answered the same question set.
+                          Defaults to one question run per run.
+    :type question_runs: Optional[Sequence[int]]
+    :raises ImportError: If NumPy is not installed.
+    :raises ValueError: If there are no runs, or not one question run per
+                        run.
+    """
+
+    def __init__(self,
+                 runs: list[QuestionAnswers],
+                 question_runs: Optional[Sequence[int]] = None) -> None:
+        _require_numpy()
+        if not runs:
+            raise ValueError("At least one run is required.")
+        if question_runs is None:
+            question_runs = range(len(runs))
+        if len(question_runs) != len(runs):
+            raise ValueError("Every run needs its question run.")
+        #: The one-sided score of every run (mean of its answers).
+        self.run_scores = numpy.array([mean_answer(run) for run in runs])
+        groups: dict[int, list[QuestionAnswers]] = {}
+        for question_run, answers in zip(question_runs, runs):
+            groups.setdefault(question_run, []).append(answers)
+        #: The text of every question column, across all question sets.
+        self.questions: list[str] = []
+        #: One answer runs × questions matrix per question set, ``NaN`` where
+        #: a run did not answer a question of its set.
+        self.matrices: list[Any] = [
+            self._set_matrix(group) for group in groups.values()
+        ]
+
+    def _set_matrix(self, runs: list[QuestionAnswers]) -> Any:
+        """Build the matrix of one question set and record its questions."""
+        columns: dict[tuple[str, int], int] = {}
+        cells = []
+        for row, answers in enumerate(runs):
+            occurrences: Counter[str] = Counter()
+            for item in answers:
+                key = normalize_question(item["question"])
+                column = (key, occurrences[key])
+                occurrences[key] += 1
+                if column not in columns:
+                    columns[column] = len(columns)
+                    self.questions.append(item["question"])
+                cells.append((row, columns[column], float(item["answer"])))
+        matrix = numpy.full((len(runs), len(columns)), numpy.nan)
+        for row, column, value in cells:
+            matrix[row, column] = value
+        return matrix
+
+    def aggregates(self,
+                   percentiles: tuple[float, ...] = (5, 25, 75, 95)
+                   ) -> dict[str, float]:
+        """
+        Return all aggregates of the run scores.
+
+        :param percentiles: Percentiles to include, as ``p<N>`` keys.
+        :type percentiles: tuple[float, ...]
+        :return: ``minimum``, ``maximum``, ``median``, ``mean``, ``std`` and
+                 the requested percentiles.
+        :rtype: dict[str, float]
+        """
+        scores = self.run_scores
+        result = {
+            "minimum": float(numpy.min(scores)),
+            "maximum": float(numpy.max(scores)),
+            "median": float(numpy.median(scores)),
+            "mean": float(numpy.mean(scores)),
+            "std": float(numpy.std(scores)),
+        }
+        if percentiles:
+            values = numpy.percentile(scores, percentiles)
+            result.update({
+                f"p{percentile:g}": float(value)
+                for percentile, value in zip(percentiles, values)
+            })
+        return result
+
+    def bootstrap_ci(self,
+                     confidence: float = 0.95,
+                     resamples: int = 2000,
+                     seed: Optional[int] = None) -> tuple[float, float]:
+        """
+        Return a percentile bootstrap confidence interval of the mean score.
+
+        :param confidence: Confidence level of the interval. Defaults to 0.95.
+        :type confidence: float
+        :param resamples: Number of bootstrap resamples. Defaults to 2000.
+        :type resamples: int
+        :param seed: Seed of the random generator, for reproducible intervals.
+        :type seed: Optional[int]
+        :return: The lower and upper bound of the interval.
+        :rtype: tuple[float, float]
+        """
+        scores = self.run_scores
+        rng = numpy.random.default_rng(seed)
+        samples = rng.integers(0, len(scores), size=(resamples, len(scores)))
+        means = scores[samples].mean(axis=1)
+        tail = (1 - confidence) / 2 * 100
+        low, high = numpy.percentile(means, [tail, 100 - tail])
+        return float(low), float(high)
+
+    def question_variance(self) -> Any:
+        """
+        Return the variance of the answers to each question across the answer
+        runs of its question set.
+
+        Questions answered in fewer than two runs have no variance (``NaN``).
+
+        :return: One variance per question, in the order of :attr:`questions`.
+        :rtype: numpy.ndarray
+        """
+        variances = []
+        for matrix in self.matrices:
+            answered = numpy.sum(~numpy.isnan(matrix), axis=0)
+            with numpy.errstate(invalid="ignore", divide="ignore"):
+                variance = numpy.nanvar(matrix, axis=0)
+            variances.append(numpy.where(answered > 1, variance, numpy.nan))
+        return numpy.concatenate(variances)
+
+    def unstable_questions(self,
+                           top: int = 10) -> list[tuple[str, float, float]]:
+        """
+        Return the questions whose answers vary most across answer runs.
+
+        :param top: Maximum number of questions returned. Defaults to 10.
+        :type top: int
+        :return: ``(question, variance, mean answer)`` tuples, most unstable
+                 first; questions with stable answers or answered in fewer
+                 than two runs are left out.
+        :rtype: list[tuple[str, float, float]]
+        """
+        variance = self.question_variance()
+        with numpy.errstate(invalid="ignore"):
+            means = numpy.concatenate(
+                [numpy.nanmean(matrix, axis=0) for matrix in self.matrices])
+        unstable = numpy.nan_to_num(variance, nan=0.0)
+        order = numpy.argsort(-unstable, kind="stable")[:top]
+        return [(self.questions[i], float(variance[i]), float(means[i]))
+                for i in order if unstable[i] > 0]
+
+
+def texts_analyze_one_side(base_text: str,
+                           answer_text: str,
+                           generate_questions: int,
+                           generate_answers_per_questions: int,
+                           retry_on_error: bool = True) -> ScoreAnalysis:
+    """
+    Run repeated one-sided evaluations and analyze all their answers.
+
+    Questions are generated from ``base_text`` ``generate_questions`` times
+    and each set is answered with ``answer_text``
+    ``generate_answers_per_questions`` times, as in ``texts_multiple_*``. Use
+    ``(given, expected)`` for precision and ``(expected, given)`` for recall.
+
+    :param base_text: The text to generate questions from.
+    :type base_text: str
+    :param answer_text: The text to answer the questions with.
+    :type answer_text: str
+    :param generate_questions: The number of times to generate a new set of questions.
+    :type generate_questions: int
+    :param generate_answers_per_questions: The number of times to evaluate answers for each set of questions.
+    :type generate_answers_per_questions: int
+    :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
+    :type retry_on_error: bool
+    :return: The analysis of all runs.
+    :rtype: ScoreAnalysis
+    :raises ImportError: If NumPy is not installed.
+    :raises Exception: If the operation fails after the maximum number of retries.
+    """
+    _require_numpy()
+    runs = []
+    question_runs = []
+    budget = RetryBudget(retry_on_error)
+    for q_i in range(generate_questions):
+
+        def question_run() -> list[QuestionAnswers]:
+            questions_text = make_questions(base_text)
+            return [
+                evaluate_questions(answer_text, questions_text)
+                for _ in range(generate_answers_per_questions)
+            ]
+
+        answers = budget.run(question_run, f"question_run={q_i}")
+        runs.extend(answers)
+        question_runs.extend([q_i] * len(answers))
+    return ScoreAnalysis(runs, question_runs)
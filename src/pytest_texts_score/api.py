@@ -1,14 +1,25 @@
-from pytest_texts_score._helper import check_input_range, check_input_runs, check_input_target, test_score
+from typing import Literal, Optional
+
+import pytest
+
+from pytest_texts_score._helper import check_input_range, check_input_runs, check_input_target, test_score, test_scores
 from pytest_texts_score.evaluate_score import (
     AggType,
     ScoreType,
+    scores_agg,
+    texts_agg_auto,
     texts_agg_f1,
     texts_agg_precision,
     texts_agg_recall,
     texts_evaluate_f1,
     texts_evaluate_precision,
     texts_evaluate_recall,
+    texts_evaluate_scores,
+    texts_multiple_scores,
 )
+from pytest_texts_score.confidence import CIMethod
+from pytest_texts_score.incremental import incremental
+from pytest_texts_score.results import AggregatedScores
 
 #: A recommended minimum value for the `max_delta` or range width.
 #: Used to warn users if their test's acceptance criteria are very strict,
@@ -16,6 +27,7 @@ from pytest_texts_score.evaluate_score import (
 MINIMAL_EXPECTED_MAX_DELTA = 0.05
 
 
+@incremental
 def texts_expect_f1_equal(
     expected: str,
     given: str,
@@ -23,6 +35,7 @@ def texts_expect_f1_equal(
     max_delta: float = 0.2,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """
     Assert that the F1 score is close to a target value.
@@ -43,6 +56,9 @@ def texts_expect_f1_equal(
     :type skip_warnings: bool
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     """
     check_input_target(target, max_delta, MINIMAL_EXPECTED_MAX_DELTA,
                        skip_warnings)
@@ -55,9 +71,11 @@ def texts_expect_f1_equal(
                           min_score,
                           max_score,
                           skip_warnings=True,
-                          retry_on_error=retry_on_error)
+                          retry_on_error=retry_on_error,
+                          fresh=fresh)
 
 
+@incremental
 def texts_expect_f1_range(
     expected: str,
     given: str,
@@ -65,6 +83,7 @@ def texts_expect_f1_range(
     max_score: float,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """
     Assert that the F1 score falls within a specified range.
@@ -85,15 +104,22 @@ def texts_expect_f1_range(
     :type skip_warnings: bool
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     """
     check_input_range(max_score, min_score, MINIMAL_EXPECTED_MAX_DELTA,
                       skip_warnings)
 
-    score = texts_evaluate_f1(expected, given, retry_on_error=retry_on_error)
+    score = texts_evaluate_f1(expected,
+                              given,
+                              retry_on_error=retry_on_error,
+                              fresh=fresh)
 
     test_score(score, max_score, min_score, expected, given, ScoreType.F1)
 
 
+@incremental
 def texts_expect_precision_equal(
     expected: str,
     given: str,
@@ -101,6 +127,7 @@ def texts_expect_precision_equal(
     max_delta: float = 0.2,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """
     Assert that the precision score is close to a target value.
@@ -121,6 +148,9 @@ def texts_expect_precision_equal(
     :type skip_warnings: bool
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     """
     check_input_target(target, max_delta, MINIMAL_EXPECTED_MAX_DELTA,
                        skip_warnings)
@@ -133,9 +163,11 @@ def texts_expect_precision_equal(
                                  min_score,
                                  max_score,
                                  skip_warnings=True,
-                                 retry_on_error=retry_on_error)
+                                 retry_on_error=retry_on_error,
+                                 fresh=fresh)
 
 
+@incremental
 def texts_expect_precision_range(
     expected: str,
     given: str,
@@ -143,6 +175,7 @@ def texts_expect_precision_range(
     max_score: float,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """
     Assert that the precision score falls within a specified range.
@@ -163,18 +196,23 @@ def texts_expect_precision_range(
     :type skip_warnings: bool
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     """
     check_input_range(max_score, min_score, MINIMAL_EXPECTED_MAX_DELTA,
                       skip_warnings)
 
     score = texts_evaluate_precision(expected,
                                      given,
-                                     retry_on_error=retry_on_error)
+                                     retry_on_error=retry_on_error,
+                                     fresh=fresh)
 
     test_score(score, max_score, min_score, expected, given,
                ScoreType.PRECISION)
 
 
+@incremental
 def texts_expect_recall_equal(
     expected: str,
     given: str,
@@ -182,6 +220,7 @@ def texts_expect_recall_equal(
     max_delta: float = 0.2,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """
     Assert that the recall score is close to a target value.
@@ -202,6 +241,9 @@ def texts_expect_recall_equal(
     :type skip_warnings: bool
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     """
     check_input_target(target, max_delta, MINIMAL_EXPECTED_MAX_DELTA,
                        skip_warnings)
@@ -214,9 +256,11 @@ def texts_expect_recall_equal(
                               min_score,
                               max_score,
                               skip_warnings=True,
-                              retry_on_error=retry_on_error)
+                              retry_on_error=retry_on_error,
+                              fresh=fresh)
 
 
+@incremental
 def texts_expect_recall_range(
     expected: str,
     given: str,
@@ -224,6 +268,7 @@ def texts_expect_recall_range(
     max_score: float,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """
     Assert that the recall score falls within a specified range.
@@ -244,20 +289,264 @@ def texts_expect_recall_range(
     :type skip_warnings: bool
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     """
     check_input_range(max_score, min_score, MINIMAL_EXPECTED_MAX_DELTA,
                       skip_warnings)
 
     score = texts_evaluate_recall(expected,
                                   given,
-                                  retry_on_error=retry_on_error)
+                                  retry_on_error=retry_on_error,
+                                  fresh=fresh)
 
     test_score(score, max_score, min_score, expected, given, ScoreType.RECALL)
 
 
+def _score_ranges(
+    precision: Optional[tuple[float, float]],
+    recall: Optional[tuple[float, float]],
+    f1: Optional[tuple[float, float]],
+) -> dict[ScoreType, tuple[float, float]]:
+    """Collect the requested ``(min_score, max_score)`` ranges by score type."""
+    ranges = {
+        score_type: score_range
+        for score_type, score_range in ((ScoreType.PRECISION, precision),
+                                        (ScoreType.RECALL, recall),
+                                        (ScoreType.F1, f1))
+        if score_range is not None
+    }
+    if not ranges:
+        raise pytest.UsageError(
+            "At least one of `precision`, `recall` or `f1` must be given.")
+    return ranges
+
+
+@incremental
+def texts_expect_scores(
+    expected: str,
+    given: str,
+    precision: Optional[tuple[float, float]] = None,
+    recall: Optional[tuple[float, float]] = None,
+    f1: Optional[tuple[float, float]] = None,
+    skip_warnings: bool = False,
+    retry_on_error: bool = True,
+    fresh: bool = False,
+) -> None:
+    """
+    Assert that several scores of a pair of texts fall within their ranges.
+
+    Each side (precision and recall) is evaluated once and shared by all
+    requested checks; F1 is derived from both sides. Checking all three
+    scores therefore costs as much as a single F1 evaluation. All violated
+    ranges are reported together.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param precision: The acceptable ``(min_score, max_score)`` precision range.
+    :type precision: Optional[tuple[float, float]]
+    :param recall: The acceptable ``(min_score, max_score)`` recall range.
+    :type recall: Optional[tuple[float, float]]
+    :param f1: The acceptable ``(min_score, max_score)`` F1 range.
+    :type f1: Optional[tuple[float, float]]
+    :param skip_warnings: If ``True``, suppresses input validation warnings.
+    :type skip_warnings: bool
+    :param retry_on_error: If ``True``, retries LLM calls on failure.
+    :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute new scores
+                  instead of reusing stored ones. Defaults to ``False``.
+    :type fresh: bool
+    :raises pytest.UsageError: If no range or an invalid range is given.
+    """
+    ranges = _score_ranges(precision, recall, f1)
+    for min_score, max_score in ranges.values():
+        check_input_range(max_score, min_score, MINIMAL_EXPECTED_MAX_DELTA,
+                          skip_warnings)
+
+    scores = texts_evaluate_scores(expected,
+                                   given,
+                                   list(ranges),
+                                   retry_on_error=retry_on_error,
+                                   fresh=fresh)
+
+    test_scores(scores, ranges, expected, given)
+
+
+@incremental
+def texts_agg_scores(
+    expected: str,
+    given: str,
+    agg_type: AggType |
+    Literal["minimum", "maximum", "median", "average", "mean"],
+    precision: Optional[tuple[float, float]] = None,
+    recall: Optional[tuple[float, float]] = None,
+    f1: Optional[tuple[float, float]] = None,
+    full_runs: int = 5,
+    each_question_runs: int = 1,
+    skip_warnings: bool = False,
+    retry_on_error: bool = True,
+) -> None:
+    """
+    Assert that several aggregated scores fall within their ranges.
+
+    One set of evaluation runs serves all requested scores: every run
+    evaluates each needed side once. The run scores of each requested score
+    are aggregated with ``agg_type`` and all violated ranges are reported
+    together.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param agg_type: The aggregation method applied to the run scores.
+    :type agg_type: AggType | Literal["minimum", "maximum", "median", "average", "mean"]
+    :param precision: The acceptable ``(min_score, max_score)`` range of the
+                      aggregated precision.
+    :type precision: Optional[tuple[float, float]]
+    :param recall: The acceptable ``(min_score, max_score)`` range of the
+                   aggregated recall.
+    :type recall: Optional[tuple[float, float]]
+    :param f1: The acceptable ``(min_score, max_score)`` range of the
+               aggregated F1 score.
+    :type f1: Optional[tuple[float, float]]
+    :param full_runs: Number of times to generate new questions. Defaults to 5.
+    :type full_runs: int
+    :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
+    :type each_question_runs: int
+    :param skip_warnings: If ``True``, suppresses input validation warnings.
+    :type skip_warnings: bool
+    :param retry_on_error: If ``True``, retries LLM calls on failure.
+    :type retry_on_error: bool
+    :raises pytest.UsageError: If no range or an invalid range is given.
+    """
+    ranges = _score_ranges(precision, recall, f1)
+    for min_score, max_score in ranges.values():
+        check_input_range(max_score, min_score, MINIMAL_EXPECTED_MAX_DELTA,
+                          skip_warnings)
+    check_input_runs(full_runs, each_question_runs)
+
+    runs = texts_multiple_scores(expected, given, full_runs,
+                                 each_question_runs, list(ranges),
+                                 retry_on_error)
+    scores = {
+        score_type: scores_agg(runs[score_type], agg_type)
+        for score_type in ranges
+    }
+
+    test_scores(scores, ranges, expected, given)
+
+
+def texts_agg_runs(
+    expected: str,
+    given: str,
+    score_type: ScoreType | Literal["f1", "precision", "recall"] = ScoreType.F1,
+    full_runs: int = 5,
+    each_question_runs: int = 1,
+    retry_on_error: bool = True,
+) -> AggregatedScores:
+    """
+    Run an aggregated evaluation and return its run scores.
+
+    Unlike the ``texts_agg_*`` assertions, which reduce the runs with a
+    single aggregation, the returned object keeps every run score and can be
+    checked against several aggregations without running the LLM again::
+
+        texts_agg_runs(expected, given).expect(mean=(0.8, 1.0), minimum=(0.6, 1.0))
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param score_type: The score to evaluate. Defaults to F1.
+    :type score_type: ScoreType | Literal["f1", "precision", "recall"]
+    :param full_runs: Number of times to generate new questions. Defaults to 5.
+    :type full_runs: int
+    :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
+    :type each_question_runs: int
+    :param retry_on_error: If ``True``, retries LLM calls on failure.
+    :type retry_on_error: bool
+    :return: The run scores of the evaluation.
+    :rtype: AggregatedScores
+    """
+    check_input_runs(full_runs, each_question_runs)
+    score_type = ScoreType(score_type)
+    runs = texts_multiple_scores(expected, given, full_runs,
+                                 each_question_runs, [score_type],
+                                 retry_on_error)
+    scores = runs[score_type]
+    # The runs are listed question run by question run.
+    question_runs = [run // each_question_runs for run in range(len(scores))]
+    return AggregatedScores(scores, score_type, expected, given, question_runs)
+
+
+def texts_agg_ci(
+    expected: str,
+    given: str,
+    lower_bound: Optional[float] = None,
+    upper_bound: Optional[float] = None,
+    score_type: ScoreType | Literal["f1", "precision", "recall"] = ScoreType.F1,
+    confidence: float = 0.95,
+    method: CIMethod | Literal["t", "bootstrap"] = CIMethod.T,
+    full_runs: int = 5,
+    each_question_runs: int = 1,
+    retry_on_error: bool = True,
+) -> AggregatedScores:
+    """
+    Assert that the confidence interval of the mean score lies within bounds.
+
+    Unlike ``texts_agg_*_mean``, which compares a noisy point estimate with a
+    range, this passes only if the runs show with the given confidence that
+    the mean score is at least ``lower_bound`` (and at most ``upper_bound``).
+    Clear results therefore pass or fail reliably with few runs. The interval
+    is computed over the mean score of every question run, so additional
+    ``each_question_runs`` make each question run more precise but do not
+    count as independent runs.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param lower_bound: Minimum lower bound of the interval.
+    :type lower_bound: Optional[float]
+    :param upper_bound: Maximum upper bound of the interval.
+    :type upper_bound: Optional[float]
+    :param score_type: The score to evaluate. Defaults to F1.
+    :type score_type: ScoreType | Literal["f1", "precision", "recall"]
+    :param confidence: Confidence level, between 0 and 1. Defaults to 0.95.
+    :type confidence: float
+    :param method: ``"t"`` or ``"bootstrap"``. Defaults to ``"t"``.
+    :type method: CIMethod | Literal["t", "bootstrap"]
+    :param full_runs: Number of times to generate new questions. Defaults to 5.
+    :type full_runs: int
+    :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
+    :type each_question_runs: int
+    :param retry_on_error: If ``True``, retries LLM calls on failure.
+    :type retry_on_error: bool
+    :return: The run scores of the evaluation.
+    :rtype: AggregatedScores
+    :raises pytest.UsageError: If no bound is given or there are fewer than
+                               two question runs.
+    """
+    if lower_bound is None and upper_bound is None:
+        raise pytest.UsageError(
+            "At least one of `lower_bound` or `upper_bound` is required.")
+    check_input_runs(full_runs, each_question_runs)
+    if full_runs < 2:
+        raise pytest.UsageError(
+            "A confidence interval requires at least two question runs "
+            "(`full_runs`).")
+    result = texts_agg_runs(expected, given, score_type, full_runs,
+                            each_question_runs, retry_on_error)
+    return result.expect_ci(lower_bound, upper_bound, confidence, method)
+
+
 # F1 Score Aggregation Functions
 
 
+@incremental
 def texts_agg_f1_min(expected: str,
                      given: str,
                      lower_bound: float,
@@ -292,6 +581,7 @@ def texts_agg_f1_min(expected: str,
     test_score(score, 1.0, lower_bound, expected, given, ScoreType.F1)
 
 
+@incremental
 def texts_agg_f1_max(expected: str,
                      given: str,
                      upper_bound: float,
@@ -326,11 +616,12 @@ def texts_agg_f1_max(expected: str,
     test_score(score, upper_bound, 0.0, expected, given, ScoreType.F1)
 
 
+@incremental
 def texts_agg_f1_median(expected: str,
                         given: str,
                         target: float,
                         max_delta: float = 0.1,
-                        full_runs: int = 5,
+                        full_runs: int | Literal["auto"] = 5,
                         each_question_runs: int = 1,
                         retry_on_error: bool = True) -> None:
     """
@@ -348,15 +639,22 @@ def texts_agg_f1_median(expected: str,
     :param max_delta: The allowed deviation from the target. Defaults to 0.1.
     :type max_delta: float
     :param full_runs: Number of times to generate new questions. Defaults to 5.
-    :type full_runs: int
+                      ``"auto"`` chooses both run counts from the score variance
+                      of earlier runs, so that the estimate is within
+                      ``max_delta`` at the ``llm_auto_confidence`` confidence.
+    :type full_runs: int | Literal["auto"]
     :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
     :type each_question_runs: int
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
     """
-    check_input_runs(full_runs, each_question_runs)
-    score = texts_agg_f1(expected, given, full_runs, each_question_runs,
-                         AggType.MEDIAN, retry_on_error)
+    if full_runs == "auto":
+        score = texts_agg_auto(expected, given, ScoreType.F1, AggType.MEDIAN,
+                               max_delta, retry_on_error)
+    else:
+        check_input_runs(full_runs, each_question_runs)
+        score = texts_agg_f1(expected, given, full_runs, each_question_runs,
+                             AggType.MEDIAN, retry_on_error)
 
     min_score = max(0.0, target - max_delta)
     max_score = min(1.0, target + max_delta)
@@ -364,11 +662,12 @@ def texts_agg_f1_median(expected: str,
     test_score(score, max_score, min_score, expected, given, ScoreType.F1)
 
 
+@incremental
 def texts_agg_f1_mean(expected: str,
                       given: str,
                       target: float,
                       max_delta: float = 0.1,
-                      full_runs: int = 5,
+                      full_runs: int | Literal["auto"] = 5,
                       each_question_runs: int = 1,
                       retry_on_error: bool = True) -> None:
     """
@@ -386,15 +685,22 @@ def texts_agg_f1_mean(expected: str,
     :param max_delta: The allowed deviation from the target. Defaults to 0.1.
     :type max_delta: float
     :param full_runs: Number of times to generate new questions. Defaults to 5.
-    :type full_runs: int
+                      ``"auto"`` chooses both run counts from the score variance
+                      of earlier runs, so that the estimate is within
+                      ``max_delta`` at the ``llm_auto_confidence`` confidence.
+    :type full_runs: int | Literal["auto"]
     :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
     :type each_question_runs: int
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
     """
-    check_input_runs(full_runs, each_question_runs)
-    score = texts_agg_f1(expected, given, full_runs, each_question_runs,
-                         AggType.MEAN, retry_on_error)
+    if full_runs == "auto":
+        score = texts_agg_auto(expected, given, ScoreType.F1, AggType.MEAN,
+                               max_delta, retry_on_error)
+    else:
+        check_input_runs(full_runs, each_question_runs)
+        score = texts_agg_f1(expected, given, full_runs, each_question_runs,
+                             AggType.MEAN, retry_on_error)
 
     min_score = max(0.0, target - max_delta)
     max_score = min(1.0, target + max_delta)
@@ -405,6 +711,7 @@ def texts_agg_f1_mean(expected: str,
 # Precision Score Aggregation Functions
 
 
+@incremental
 def texts_agg_precision_min(expected: str,
                             given: str,
                             lower_bound: float,
@@ -439,6 +746,7 @@ def texts_agg_precision_min(expected: str,
     test_score(score, 1.0, lower_bound, expected, given, ScoreType.PRECISION)
 
 
+@incremental
 def texts_agg_precision_max(expected: str,
                             given: str,
                             upper_bound: float,
@@ -473,11 +781,12 @@ def texts_agg_precision_max(expected: str,
     test_score(score, upper_bound, 0.0, expected, given, ScoreType.PRECISION)
 
 
+@incremental
 def texts_agg_precision_median(expected: str,
                                given: str,
                                target: float,
                                max_delta: float = 0.1,
-                               full_runs: int = 5,
+                               full_runs: int | Literal["auto"] = 5,
                                each_question_runs: int = 1,
                                retry_on_error: bool = True) -> None:
     """
@@ -495,15 +804,23 @@ def texts_agg_precision_median(expected: str,
     :param max_delta: The allowed deviation from the target. Defaults to 0.1.
     :type max_delta: float
     :param full_runs: Number of times to generate new questions. Defaults to 5.
-    :type full_runs: int
+                      ``"auto"`` chooses both run counts from the score variance
+                      of earlier runs, so that the estimate is within
+                      ``max_delta`` at the ``llm_auto_confidence`` confidence.
+    :type full_runs: int | Literal["auto"]
     :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
     :type each_question_runs: int
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
     """
-    check_input_runs(full_runs, each_question_runs)
-    score = texts_agg_precision(expected, given, full_runs, each_question_runs,
-                                AggType.MEDIAN, retry_on_error)
+    if full_runs == "auto":
+        score = texts_agg_auto(expected, given, ScoreType.PRECISION,
+                               AggType.MEDIAN, max_delta, retry_on_error)
+    else:
+        check_input_runs(full_runs, each_question_runs)
+        score = texts_agg_precision(expected, given, full_runs,
+                                    each_question_runs, AggType.MEDIAN,
+                                    retry_on_error)
 
     min_score = max(0.0, target - max_delta)
     max_score = min(1.0, target + max_delta)
@@ -512,11 +829,12 @@ def texts_agg_precision_median(expected: str,
                ScoreType.PRECISION)
 
 
+@incremental
 def texts_agg_precision_mean(expected: str,
                              given: str,
                              target: float,
                              max_delta: float = 0.1,
-                             full_runs: int = 5,
+                             full_runs: int | Literal["auto"] = 5,
                              each_question_runs: int = 1,
                              retry_on_error: bool = True) -> None:
     """
@@ -534,15 +852,23 @@ def texts_agg_precision_mean(expected: str,
     :param max_delta: The allowed deviation from the target. Defaults to 0.1.
     :type max_delta: float
     :param full_runs: Number of times to generate new questions. Defaults to 5.
-    :type full_runs: int
+                      ``"auto"`` chooses both run counts from the score variance
+                      of earlier runs, so that the estimate is within
+                      ``max_delta`` at the ``llm_auto_confidence`` confidence.
+    :type full_runs: int | Literal["auto"]
     :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
     :type each_question_runs: int
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
     """
-    check_input_runs(full_runs, each_question_runs)
-    score = texts_agg_precision(expected, given, full_runs, each_question_runs,
-                                AggType.MEAN, retry_on_error)
+    if full_runs == "auto":
+        score = texts_agg_auto(expected, given, ScoreType.PRECISION,
+                               AggType.MEAN, max_delta, retry_on_error)
+    else:
+        check_input_runs(full_runs, each_question_runs)
+        score = texts_agg_precision(expected, given, full_runs,
+                                    each_question_runs, AggType.MEAN,
+                                    retry_on_error)
 
     min_score = max(0.0, target - max_delta)
     max_score = min(1.0, target + max_delta)
@@ -554,6 +880,7 @@ def texts_agg_precision_mean(expected: str,
 # Recall Score Aggregation Functions
 
 
+@incremental
 def texts_agg_recall_min(expected: str,
                          given: str,
                          lower_bound: float,
@@ -588,6 +915,7 @@ def texts_agg_recall_min(expected: str,
     test_score(score, 1.0, lower_bound, expected, given, ScoreType.RECALL)
 
 
+@incremental
 def texts_agg_recall_max(expected: str,
                          given: str,
                          upper_bound: float,
@@ -622,11 +950,12 @@ def texts_agg_recall_max(expected: str,
     test_score(score, upper_bound, 0.0, expected, given, ScoreType.RECALL)
 
 
+@incremental
 def texts_agg_recall_median(expected: str,
                             given: str,
                             target: float,
                             max_delta: float = 0.1,
-                            full_runs: int = 5,
+                            full_runs: int | Literal["auto"] = 5,
                             each_question_runs: int = 1,
                             retry_on_error: bool = True) -> None:
     """
@@ -644,15 +973,23 @@ def texts_agg_recall_median(expected: str,
     :param max_delta: The allowed deviation from the target. Defaults to 0.1.
     :type max_delta: float
     :param full_runs: Number of times to generate new questions. Defaults to 5.
-    :type full_runs: int
+                      ``"auto"`` chooses both run counts from the score variance
+                      of earlier runs, so that the estimate is within
+                      ``max_delta`` at the ``llm_auto_confidence`` confidence.
+    :type full_runs: int | Literal["auto"]
     :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
     :type each_question_runs: int
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
     """
-    check_input_runs(full_runs, each_question_runs)
-    score = texts_agg_recall(expected, given, full_runs, each_question_runs,
-                             AggType.MEDIAN, retry_on_error)
+    if full_runs == "auto":
+        score = texts_agg_auto(expected, given, ScoreType.RECALL,
+                               AggType.MEDIAN, max_delta, retry_on_error)
+    else:
+        check_input_runs(full_runs, each_question_runs)
+        score = texts_agg_recall(expected, given, full_runs,
+                                 each_question_runs, AggType.MEDIAN,
+                                 retry_on_error)
 
     min_score = max(0.0, target - max_delta)
     max_score = min(1.0, target + max_delta)
@@ -660,11 +997,12 @@ def texts_agg_recall_median(expected: str,
     test_score(score, max_score, min_score, expected, given, ScoreType.RECALL)
 
 
+@incremental
 def texts_agg_recall_mean(expected: str,
                           given: str,
                           target: float,
                           max_delta: float = 0.1,
-                          full_runs: int = 5,
+                          full_runs: int | Literal["auto"] = 5,
                           each_question_runs: int = 1,
                           retry_on_error: bool = True) -> None:
     """
@@ -682,15 +1020,23 @@ def texts_agg_recall_mean(expected: str,
     :param max_delta: The allowed deviation from the target. Defaults to 0.1.
     :type max_delta: float
     :param full_runs: Number of times to generate new questions. Defaults to 5.
-    :type full_runs: int
+                      ``"auto"`` chooses both run counts from the score variance
+                      of earlier runs, so that the estimate is within
+                      ``max_delta`` at the ``llm_auto_confidence`` confidence.
+    :type full_runs: int | Literal["auto"]
     :param each_question_runs: Number of times to evaluate answers per question set. Defaults to 1.
     :type each_question_runs: int
     :param retry_on_error: If ``True``, retries LLM calls on failure.
     :type retry_on_error: bool
     """
-    check_input_runs(full_runs, each_question_runs)
-    score = texts_agg_recall(expected, given, full_runs, each_question_runs,
-                             AggType.MEAN, retry_on_error)
+    if full_runs == "auto":
+        score = texts_agg_auto(expected, given, ScoreType.RECALL,
+                               AggType.MEAN, max_delta, retry_on_error)
+    else:
+        check_input_runs(full_runs, each_question_runs)
+        score = texts_agg_recall(expected, given, full_runs,
+                                 each_question_runs, AggType.MEAN,
+                                 retry_on_error)
 
     min_score = max(0.0, target - max_delta)
     max_score = min(1.0, target + max_delta)
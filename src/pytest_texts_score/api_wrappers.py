@@ -3,6 +3,8 @@ This module provides wrapper functions for the public API, offering alternative
 names for existing functionality. For example, functions using 'mean' are
 aliased with 'average'.
 """
+from typing import Literal
+
 from pytest_texts_score.api import (
     texts_agg_f1_mean,
     texts_agg_precision_max,
@@ -24,7 +26,7 @@ def texts_agg_f1_average(expected: str,
                          given: str,
                          target: float,
                          max_delta: float = 0.1,
-                         full_runs: int = 5,
+                         full_runs: int | Literal["auto"] = 5,
                          each_question_runs: int = 1,
                          retry_on_error: bool = True) -> None:
     """Alias for texts_agg_f1_mean."""
@@ -36,7 +38,7 @@ def texts_agg_precision_average(expected: str,
                                 given: str,
                                 target: float,
                                 max_delta: float = 0.1,
-                                full_runs: int = 5,
+                                full_runs: int | Literal["auto"] = 5,
                                 each_question_runs: int = 1,
                                 retry_on_error: bool = True) -> None:
     """Alias for texts_agg_precision_mean."""
@@ -48,7 +50,7 @@ def texts_agg_recall_average(expected: str,
                              given: str,
                              target: float,
                              max_delta: float = 0.1,
-                             full_runs: int = 5,
+                             full_runs: int | Literal["auto"] = 5,
                              each_question_runs: int = 1,
                              retry_on_error: bool = True) -> None:
     """Alias for texts_agg_recall_mean."""
@@ -66,10 +68,11 @@ def texts_expect_completeness_equal(
     max_delta: float = 0.2,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """Alias for texts_expect_precision_equal."""
     texts_expect_precision_equal(expected, given, target, max_delta,
-                                 skip_warnings, retry_on_error)
+                                 skip_warnings, retry_on_error, fresh)
 
 
 def texts_expect_completeness_range(
@@ -79,10 +82,11 @@ def texts_expect_completeness_range(
     max_score: float,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """Alias for texts_expect_precision_range."""
     texts_expect_precision_range(expected, given, min_score, max_score,
-                                 skip_warnings, retry_on_error)
+                                 skip_warnings, retry_on_error, fresh)
 
 
 def texts_agg_completeness_min(expected: str,
@@ -111,7 +115,7 @@ def texts_agg_completeness_median(expected: str,
                                   given: str,
                                   target: float,
                                   max_delta: float = 0.1,
-                                  full_runs: int = 5,
+                                  full_runs: int | Literal["auto"] = 5,
                                   each_question_runs: int = 1,
                                   retry_on_error: bool = True) -> None:
     """Alias for texts_agg_precision_median."""
@@ -123,7 +127,7 @@ def texts_agg_completeness_average(expected: str,
                                    given: str,
                                    target: float,
                                    max_delta: float = 0.1,
-                                   full_runs: int = 5,
+                                   full_runs: int | Literal["auto"] = 5,
                                    each_question_runs: int = 1,
                                    retry_on_error: bool = True) -> None:
     """Alias for texts_agg_precision_average."""
@@ -135,7 +139,7 @@ def texts_agg_completeness_mean(expected: str,
                                 given: str,
                                 target: float,
                                 max_delta: float = 0.1,
-                                full_runs: int = 5,
+                                full_runs: int | Literal["auto"] = 5,
                                 each_question_runs: int = 1,
                                 retry_on_error: bool = True) -> None:
     """Alias for texts_agg_precision_mean."""
@@ -153,10 +157,11 @@ def texts_expect_correctness_equal(
     max_delta: float = 0.2,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """Alias for texts_expect_recall_equal."""
     texts_expect_recall_equal(expected, given, target, max_delta, skip_warnings,
-                              retry_on_error)
+                              retry_on_error, fresh)
 
 
 def texts_expect_correctness_range(
@@ -166,10 +171,11 @@ def texts_expect_correctness_range(
     max_score: float,
     skip_warnings: bool = False,
     retry_on_error: bool = True,
+    fresh: bool = False,
 ) -> None:
     """Alias for texts_expect_recall_range."""
     texts_expect_recall_range(expected, given, min_score, max_score,
-                              skip_warnings, retry_on_error)
+                              skip_warnings, retry_on_error, fresh)
 
 
 def texts_agg_correctness_min(expected: str,
@@ -198,7 +204,7 @@ def texts_agg_correctness_median(expected: str,
                                  given: str,
                                  target: float,
                                  max_delta: float = 0.1,
-                                 full_runs: int = 5,
+                                 full_runs: int | Literal["auto"] = 5,
                                  each_question_runs: int = 1,
                                  retry_on_error: bool = True) -> None:
     """Alias for texts_agg_recall_median."""
@@ -210,7 +216,7 @@ def texts_agg_correctness_average(expected: str,
                                   given: str,
                                   target: float,
                                   max_delta: float = 0.1,
-                                  full_runs: int = 5,
+                                  full_runs: int | Literal["auto"] = 5,
                                   each_question_runs: int = 1,
                                   retry_on_error: bool = True) -> None:
     """Alias for texts_agg_recall_average."""
@@ -222,7 +228,7 @@ def texts_agg_correctness_mean(expected: str,
                                given: str,
                                target: float,
                                max_delta: float = 0.1,
-                               full_runs: int = 5,
+                               full_runs: int | Literal["auto"] = 5,
                                each_question_runs: int = 1,
                                retry_on_error: bool = True) -> None:
     """Alias for texts_agg_recall_mean."""
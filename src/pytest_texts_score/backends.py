@@ -0,0 +1,265 @@
+"""
+LLM backends used by pytest-texts-score.
+
+A backend turns a list of chat messages into the text of the model's reply.
+The plugin ships with backends for Azure OpenAI, for any server exposing the
+OpenAI-compatible ``/v1/chat/completions`` API (vLLM, llama.cpp, ...), and for
+an arbitrary user supplied callable. The backend is selected with the
+``llm_backend`` option and created by :func:`create_backend`.
+"""
+from abc import ABC, abstractmethod
+from enum import Enum
+import importlib
+from typing import Callable, Optional
+
+from openai import AzureOpenAI, OpenAI
+import pytest
+
+
+class BackendType(str, Enum):
+    """Supported LLM backend types."""
+
+    AZURE = "azure"
+    OPENAI = "openai"
+    CALLABLE = "callable"
+
+
+class LLMBackend(ABC):
+    """
+    Base class of all LLM backends.
+
+    Subclasses implement :meth:`complete`. Backends also describe their
+    capabilities: ``supports_batching`` tells whether :meth:`complete` may be
+    called from several threads at once and ``max_concurrency`` bounds how
+    many calls are in flight at the same time.
+
+    :param max_concurrency: Maximum number of concurrent requests. ``None``
+                            uses the backend default.
+    :type max_concurrency: Optional[int]
+    """
+
+    #: Whether :meth:`complete` may be called concurrently.
+    supports_batching: bool = False
+    #: Concurrency used when ``llm_max_concurrency`` is not configured.
+    default_max_concurrency: int = 1
+
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        self.max_concurrency = max_concurrency or self.default_max_concurrency
+
+    @abstractmethod
+    def complete(self,
+                 messages: list[dict[str, str]],
+                 model: Optional[str],
+                 max_tokens: int,
+                 temperature: float = 0) -> str:
+        """
+        Send one chat request and return the content of the reply.
+
+        :param messages: The chat messages (``role`` and ``content`` pairs).
+        :type messages: list[dict[str, str]]
+        :param model: The model (or Azure deployment) identifier.
+        :type model: Optional[str]
+        :param max_tokens: Maximum number of tokens of the reply.
+        :type max_tokens: int
+        :param temperature: Sampling temperature. Defaults to 0.
+        :type temperature: float
+        :return: The reply content, or an empty string if there is none.
+        :rtype: str
+        """
+        raise NotImplementedError
+
+
+class OpenAIChatBackend(LLMBackend):
+    """
+    Backend calling ``chat.completions.create`` of an ``openai`` client.
+
+    :param client: An ``OpenAI`` or ``AzureOpenAI`` client instance.
+    :type client: OpenAI | AzureOpenAI
+    :param max_concurrency: Maximum number of concurrent requests.
+    :type max_concurrency: Optional[int]
+    """
+
+    supports_batching = True
+    default_max_concurrency = 4
+
+    def __init__(self,
+                 client: OpenAI | AzureOpenAI,
+                 max_concurrency: Optional[int] = None) -> None:
+        super().__init__(max_concurrency)
+        self.client = client
+
+    def complete(self,
+                 messages: list[dict[str, str]],
+                 model: Optional[str],
+                 max_tokens: int,
+                 temperature: float = 0) -> str:
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        return response.choices[0].message.content or ""
+
+
+class AzureBackend(OpenAIChatBackend):
+    """
+    Backend for an Azure OpenAI deployment.
+
+    :param api_key: Azure OpenAI API key.
+    :type api_key: str
+    :param endpoint: Azure OpenAI resource endpoint.
+    :type endpoint: str
+    :param api_version: Azure OpenAI API version.
+    :type api_version: str
+    :param deployment: Name of the deployment serving the model.
+    :type deployment: str
+    :param max_concurrency: Maximum number of concurrent requests.
+    :type max_concurrency: Optional[int]
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 endpoint: str,
+                 api_version: str,
+                 deployment: str,
+                 max_concurrency: Optional[int] = None) -> None:
+        super().__init__(
+            AzureOpenAI(
+                api_key=api_key,
+                azure_endpoint=endpoint,
+                api_version=api_version,
+                azure_deployment=deployment,
+            ),
+            max_concurrency,
+        )
+
+
+class OpenAICompatibleBackend(OpenAIChatBackend):
+    """
+    Backend for a server exposing the OpenAI-compatible chat API.
+
+    Self-hosted servers such as vLLM or llama.cpp batch concurrent requests
+    internally, so this backend defaults to a higher concurrency.
+
+    :param base_url: Base URL of the API, e.g. ``http://localhost:8000/v1``.
+    :type base_url: str
+    :param api_key: API key; local servers usually accept any value.
+    :type api_key: Optional[str]
+    :param max_concurrency: Maximum number of concurrent requests.
+    :type max_concurrency: Optional[int]
+    """
+
+    default_max_concurrency = 16
+
+    def __init__(self,
+                 base_url: str,
+                 api_key: Optional[str] = None,
+                 max_concurrency: Optional[int] = None) -> None:
+        super().__init__(
+            OpenAI(base_url=base_url, api_key=api_key or "EMPTY"),
+            max_concurrency,
+        )
+
+
+class CallableBackend(LLMBackend):
+    """
+    Backend delegating to a user supplied callable.
+
+    The callable is invoked with the keyword arguments of :meth:`complete`
+    and must return the reply content as a string. It is treated as
+    thread-safe only when ``supports_batching`` is ``True``.
+
+    :param function: The callable producing completions.
+    :type function: Callable[..., str]
+    :param max_concurrency: Maximum number of concurrent requests.
+    :type max_concurrency: Optional[int]
+    :param supports_batching: Whether the callable may run concurrently.
+    :type supports_batching: bool
+    """
+
+    def __init__(self,
+                 function: Callable[..., str],
+                 max_concurrency: Optional[int] = None,
+                 supports_batching: bool = False) -> None:
+        super().__init__(max_concurrency)
+        self.function = function
+        self.supports_batching = supports_batching
+
+    def complete(self,
+                 messages: list[dict[str, str]],
+                 model: Optional[str],
+                 max_tokens: int,
+                 temperature: float = 0) -> str:
+        return self.function(messages=messages,
+                             model=model,
+                             max_tokens=max_tokens,
+                             temperature=temperature) or ""
+
+
+def load_callable(path: str) -> Callable[..., str]:
+    """
+    Import a callable given as ``"package.module:function"``.
+
+    :param path: The import path of the callable.
+    :type path: str
+    :return: The imported callable.
+    :rtype: Callable[..., str]
+    :raises pytest.UsageError: If the path is malformed or cannot be imported.
+    """
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise pytest.UsageError(
+            f"`llm_backend_callable` must look like 'module:function'; "
+            f"{path!r} given.")
+    try:
+        function = getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as e:
+        raise pytest.UsageError(
+            f"Cannot import `llm_backend_callable` {path!r}: {e}") from e
+    if not callable(function):
+        raise pytest.UsageError(
+            f"`llm_backend_callable` {path!r} is not callable.")
+    return function
+
+
+def create_backend(config: pytest.Config,
+                   deployment: Optional[str] = None) -> LLMBackend:
+    """
+    Create the backend selected by the resolved pytest configuration.
+
+    :param config: The pytest config object containing LLM settings.
+    :type config: pytest.Config
+    :param deployment: Azure deployment to use instead of
+                       ``config._llm_deployment``.
+    :type deployment: Optional[str]
+    :return: The configured backend.
+    :rtype: LLMBackend
+    :raises pytest.UsageError: If the backend type is unknown.
+    """
+    try:
+        backend_type = BackendType(config._llm_backend)
+    except ValueError as e:
+        raise pytest.UsageError(
+            f"Unknown LLM backend: {config._llm_backend}") from e
+    match backend_type:
+        case BackendType.AZURE:
+            return AzureBackend(
+                api_key=config._llm_api_key,
+                endpoint=config._llm_endpoint,
+                api_version=config._llm_api_version,
+                deployment=deployment or config._llm_deployment,
+                max_concurrency=config._llm_max_concurrency,
+            )
+        case BackendType.OPENAI:
+            return OpenAICompatibleBackend(
+                base_url=config._llm_base_url,
+                api_key=config._llm_api_key,
+                max_concurrency=config._llm_max_concurrency,
+            )
+        case BackendType.CALLABLE:
+            return CallableBackend(
+                load_callable(config._llm_backend_callable),
+                max_concurrency=config._llm_max_concurrency,
+                supports_batching=(config._llm_max_concurrency or 1) > 1,
+            )
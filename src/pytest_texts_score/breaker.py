@@ -0,0 +1,246 @@
+"""
+Session-wide circuit breaker around LLM calls.
+
+During an endpoint outage every test would otherwise spend all of its retries
+(each regenerating questions) before failing. The breaker watches the outcome
+of recent LLM calls; once the error rate over the window reaches the
+configured threshold it *opens* and every further LLM call fails (or skips)
+the running test immediately. After a cooldown the breaker becomes
+*half-open* and lets a single probe call through: success closes it again,
+failure re-opens it for another cooldown.
+
+Only errors that indicate an unavailable endpoint count towards the error
+rate: timeouts, connection errors, rate limits (HTTP 429) and server errors
+(HTTP 5xx). Client errors such as a bad request, failed authentication or a
+prompt that is too long are raised without affecting the breaker.
+"""
+from collections import deque
+from enum import Enum
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import pytest
+
+from pytest_texts_score.tokens import PromptTooLongError
+
+T = TypeVar("T")
+
+
+class BreakerState(str, Enum):
+    """States of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class BreakerAction(str, Enum):
+    """What happens to a test calling the LLM while the breaker is open."""
+
+    FAIL = "fail"
+    SKIP = "skip"
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Return the HTTP status code carried by an API error, if any."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Return whether an LLM call error indicates an unavailable endpoint.
+
+    Errors carrying an HTTP status are transient for 408, 429 and 5xx.
+    Errors without a status (timeouts, connection errors, errors of callable
+    backends) are transient, except :class:`PromptTooLongError`.
+
+    :param error: The error raised by the call.
+    :type error: BaseException
+    :return: ``True`` if the error counts towards the error rate.
+    :rtype: bool
+    """
+    if isinstance(error, PromptTooLongError):
+        return False
+    status = _status_code(error)
+    if status is None:
+        return True
+    return status in (408, 429) or status >= 500
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker tracking the error rate of recent LLM calls.
+
+    :param error_rate: Error rate (0 to 1) over the window that opens the
+                       breaker. ``0`` disables the breaker.
+    :type error_rate: float
+    :param window: Number of most recent calls the error rate is computed over.
+    :type window: int
+    :param min_calls: Minimum number of calls in the window before the breaker
+                      may open.
+    :type min_calls: int
+    :param cooldown: Seconds the breaker stays open before a probe call.
+    :type cooldown: float
+    :param action: Whether rejected tests fail or are skipped.
+    :type action: BreakerAction | str
+    """
+
+    def __init__(self,
+                 error_rate: float = 0.5,
+                 window: int = 20,
+                 min_calls: int = 10,
+                 cooldown: float = 60.0,
+                 action: BreakerAction | str = BreakerAction.FAIL) -> None:
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.action = BreakerAction(action)
+        self.state = BreakerState.CLOSED
+        self.last_error: Optional[BaseException] = None
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the breaker is active."""
+        return self.error_rate > 0
+
+    def current_error_rate(self) -> float:
+        """Return the error rate over the current window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def before_call(self) -> bool:
+        """
+        Check whether an LLM call may proceed.
+
+        :return: Whether the call is the probe of a half-open breaker; the
+                 caller must then call :meth:`end_probe` when it finishes.
+        :rtype: bool
+        :raises pytest.fail.Exception: If the breaker is open and the action is ``fail``.
+        :raises pytest.skip.Exception: If the breaker is open and the action is ``skip``.
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self.state == BreakerState.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    self._reject()
+                self.state = BreakerState.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == BreakerState.HALF_OPEN:
+                if self._probe_in_flight:
+                    self._reject()
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def end_probe(self) -> None:
+        """Let the next call probe a breaker that is still half-open."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful LLM call."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self.state == BreakerState.HALF_OPEN:
+                self.state = BreakerState.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self, error: BaseException) -> None:
+        """
+        Record a failed LLM call and open the breaker if needed.
+
+        :param error: The error raised by the call.
+        :type error: BaseException
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.last_error = error
+            self._outcomes.append(False)
+            if self.state == BreakerState.HALF_OPEN or (
+                    len(self._outcomes) >= self.min_calls and
+                    self.current_error_rate() >= self.error_rate):
+                self.state = BreakerState.OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, function: Callable[[], T]) -> T:
+        """
+        Run ``function`` through the breaker.
+
+        Errors that are not transient (see :func:`is_transient_error`) are
+        raised without being recorded.
+
+        :param function: The LLM call to run.
+        :type function: Callable[[], T]
+        :return: The result of ``function``.
+        :rtype: T
+        """
+        probe = self.before_call()
+        try:
+            result = function()
+        except Exception as e:
+            if is_transient_error(e):
+                self.record_failure(e)
+            raise
+        finally:
+            if probe:
+                self.end_probe()
+        self.record_success()
+        return result
+
+    def _reject(self) -> None:
+        reason = (
+            "[pytest-texts-score] LLM circuit breaker is open: "
+            f"{self.current_error_rate():.0%} of the last "
+            f"{len(self._outcomes)} LLM calls failed; retrying in at most "
+            f"{max(0.0, self.cooldown - (time.monotonic() - self._opened_at)):.0f}s. "
+            f"Last error: {self.last_error}")
+        if self.action == BreakerAction.SKIP:
+            pytest.skip(reason)
+        pytest.fail(reason, pytrace=False)
+
+
+# The session-wide breaker, replaced by `init_breaker` from the plugin.
+_breaker_instance = CircuitBreaker(error_rate=0)
+
+
+def init_breaker(config: pytest.Config) -> CircuitBreaker:
+    """
+    Create the session-wide circuit breaker from the pytest configuration.
+
+    :param config: The pytest config object containing the breaker settings.
+    :type config: pytest.Config
+    :return: The new breaker.
+    :rtype: CircuitBreaker
+    """
+    global _breaker_instance
+    _breaker_instance = CircuitBreaker(
+        error_rate=config._llm_breaker_error_rate,
+        window=config._llm_breaker_window,
+        min_calls=config._llm_breaker_min_calls,
+        cooldown=config._llm_breaker_cooldown,
+        action=config._llm_breaker_action,
+    )
+    return _breaker_instance
+
+
+def get_breaker() -> CircuitBreaker:
+    """
+    Return the session-wide circuit breaker.
+
+    :return: The breaker instance.
+    :rtype: CircuitBreaker
+    """
+    return _breaker_instance
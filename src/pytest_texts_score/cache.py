@@ -0,0 +1,246 @@
+"""
+Caches reusing LLM results within an evaluation.
+
+In ``texts_multiple_*`` every question run generates a new question set that
+largely overlaps the previous ones. An :class:`AnswerCache` remembers the
+answer to each question per answer text, so that only questions not seen
+before are sent to the LLM. The session-wide :data:`score_store` remembers
+one-sided scores, so that a directed comparison needed for both precision
+and recall (or for F1) is computed once. The session-wide
+:data:`paragraph_questions` keeps generated questions per paragraph in the
+pytest cache, so that only edited paragraphs of a document need new
+questions.
+"""
+from collections import Counter
+import threading
+from typing import Any, Optional
+
+from pytest_texts_score.questions import normalize_question
+
+
+class AnswerCache:
+    """
+    Answers to questions, keyed by answer text, question and answer run.
+
+    Questions are compared after :func:`normalize_question`. The answer run
+    is part of the key, so that repeated answer runs over the same question
+    set still sample the LLM independently; the cache only saves requests
+    across regenerated question sets.
+    """
+
+    def __init__(self) -> None:
+        self._answers: dict[tuple[str, str, int], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._answers)
+
+    def get(self,
+            answer_text: str,
+            question: str,
+            run: int = 0) -> Optional[dict[str, Any]]:
+        """
+        Return the cached answer to ``question``.
+
+        :param answer_text: The text the question was answered with.
+        :type answer_text: str
+        :param question: The question.
+        :type question: str
+        :param run: Index of the answer run. Defaults to 0.
+        :type run: int
+        :return: The answer item (with ``question`` and ``answer`` keys), or
+                 ``None`` if the question was not answered yet.
+        :rtype: Optional[dict[str, Any]]
+        """
+        with self._lock:
+            return self._answers.get(
+                (answer_text, normalize_question(question), run))
+
+    def put(self,
+            answer_text: str,
+            questions: list[str],
+            answers: list[dict[str, Any]],
+            run: int = 0) -> int:
+        """
+        Store the answers to a list of questions.
+
+        Answers are matched to ``questions`` by position when the LLM answered
+        every question, and by their ``question`` field otherwise. Answers
+        that cannot be matched are not stored.
+
+        :param answer_text: The text the questions were answered with.
+        :type answer_text: str
+        :param questions: The questions sent to the LLM.
+        :type questions: list[str]
+        :param answers: The answer items returned for them.
+        :type answers: list[dict[str, Any]]
+        :param run: Index of the answer run. Defaults to 0.
+        :type run: int
+        :return: The number of stored answers.
+        :rtype: int
+        """
+        if len(answers) == len(questions):
+            pairs = list(zip(questions, answers))
+        else:
+            asked = {normalize_question(q) for q in questions}
+            pairs = [(str(a.get("question", "")), a) for a in answers
+                     if normalize_question(str(a.get("question", ""))) in asked]
+        with self._lock:
+            for question, answer in pairs:
+                self._answers[(answer_text, normalize_question(question),
+                               run)] = answer
+        return len(pairs)
+
+
+class ScoreStore:
+    """
+    One-sided scores keyed by the directed ``(base_text, answer_text)`` pair.
+
+    The precision of two texts equals the recall with the texts swapped, as
+    both are the one-sided score of the same directed pair, so a session-wide
+    store lets every directed comparison be computed once. Scores whose
+    questions come from a different source (a question bank instead of
+    generated questions) are kept apart.
+    """
+
+    def __init__(self) -> None:
+        self._scores: dict[tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._scores)
+
+    def get(self,
+            base_text: str,
+            answer_text: str,
+            source: str = "") -> Optional[float]:
+        """
+        Return the stored score of a directed pair.
+
+        :param base_text: The text questions were generated from.
+        :type base_text: str
+        :param answer_text: The text the questions were answered with.
+        :type answer_text: str
+        :param source: The source of the questions; empty for generated
+                       questions.
+        :type source: str
+        :return: The stored score, or ``None`` if the pair was not scored.
+        :rtype: Optional[float]
+        """
+        with self._lock:
+            return self._scores.get((base_text, answer_text, source))
+
+    def put(self,
+            base_text: str,
+            answer_text: str,
+            score: float,
+            source: str = "") -> None:
+        """
+        Store the score of a directed pair, replacing an older one.
+
+        :param base_text: The text questions were generated from.
+        :type base_text: str
+        :param answer_text: The text the questions were answered with.
+        :type answer_text: str
+        :param score: The one-sided score.
+        :type score: float
+        :param source: The source of the questions; empty for generated
+                       questions.
+        :type source: str
+        """
+        with self._lock:
+            self._scores[(base_text, answer_text, source)] = score
+
+    def clear(self) -> None:
+        """Remove all stored scores."""
+        with self._lock:
+            self._scores.clear()
+
+
+#: Session-wide store of one-sided scores, cleared when pytest is configured.
+score_store = ScoreStore()
+
+
+class ParagraphQuestions:
+    """
+    Question sets per paragraph, kept across sessions in the pytest cache.
+
+    Every draw of a paragraph within a session takes the next slot, so that
+    the question runs of ``texts_multiple_*`` still get independently
+    generated question sets: the first draw of a session reuses the first
+    stored set, the second draw the second set, and so on. Slots without a
+    stored set are generated and stored.
+    """
+
+    #: Key prefix of the question sets in the pytest cache.
+    CACHE_PREFIX = "texts_score/paragraph_questions"
+
+    def __init__(self) -> None:
+        self._sets: dict[str, dict[str, list[str]]] = {}
+        self._draws: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def draw(self, key: str,
+             store: Optional[Any] = None) -> tuple[int, Optional[list[str]]]:
+        """
+        Take the next slot of a paragraph.
+
+        :param key: The key of the paragraph, see ``paragraph_key``.
+        :type key: str
+        :param store: The pytest cache (``config.cache``), or ``None`` to
+                      keep the sets for this session only.
+        :type store: Optional[Any]
+        :return: The slot and its stored questions, or ``None`` if the slot
+                 has no questions yet.
+        :rtype: tuple[int, Optional[list[str]]]
+        """
+        with self._lock:
+            slot = self._draws[key]
+            self._draws[key] += 1
+            sets = self._load(key, store)
+            return slot, sets.get(str(slot))
+
+    def put(self,
+            key: str,
+            slot: int,
+            questions: list[str],
+            store: Optional[Any] = None) -> None:
+        """
+        Store the questions generated for a slot of a paragraph.
+
+        :param key: The key of the paragraph.
+        :type key: str
+        :param slot: The slot returned by :meth:`draw`.
+        :type slot: int
+        :param questions: The generated questions.
+        :type questions: list[str]
+        :param store: The pytest cache, or ``None``.
+        :type store: Optional[Any]
+        """
+        with self._lock:
+            sets = self._load(key, store)
+            sets[str(slot)] = questions
+            if store is not None:
+                store.set(f"{self.CACHE_PREFIX}/{key}", sets)
+
+    def clear(self) -> None:
+        """Forget the draws and the sets loaded in this session."""
+        with self._lock:
+            self._sets.clear()
+            self._draws.clear()
+
+    def _load(self, key: str, store: Optional[Any]) -> dict[str, list[str]]:
+        """Return the sets of a paragraph, loading them on first use."""
+        sets = self._sets.get(key)
+        if sets is None:
+            stored = (store.get(f"{self.CACHE_PREFIX}/{key}", None)
+                      if store is not None else None)
+            sets = dict(stored) if isinstance(stored, dict) else {}
+            self._sets[key] = sets
+        return sets
+
+
+#: Session-wide question sets per paragraph; draws restart every session.
+paragraph_questions = ParagraphQuestions()
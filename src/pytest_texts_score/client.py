@@ -1,48 +1,99 @@
+from enum import Enum
 import pytest
-from openai import AzureOpenAI
 from typing import Optional
 
+from pytest_texts_score.backends import BackendType, LLMBackend, create_backend
+from pytest_texts_score.pool import create_pool
+
+
+class LLMStage(str, Enum):
+    """Stages of the scoring pipeline that can be routed to separate models."""
+
+    QUESTIONS = "questions"
+    ANSWERS = "answers"
+
+
 # This global variable holds the singleton-like client instance.
 # It's initialized once by `init_client` and then retrieved by `get_client`.
-_client_instance: Optional[AzureOpenAI] = None
+_client_instance: Optional[LLMBackend] = None
+
+# Backends of the individual stages. A stage configured with its own Azure
+# deployment gets a dedicated backend, otherwise it shares `_client_instance`.
+_stage_instances: dict[LLMStage, LLMBackend] = {}
 
 
-def init_client(config: pytest.Config) -> AzureOpenAI:
+def init_client(config: pytest.Config) -> LLMBackend:
     """
-    Initialize and store the global AzureOpenAI client.
+    Initialize and store the global LLM backend.
 
-    This function uses the provided pytest configuration object to instantiate
-    the ``AzureOpenAI`` client. The created client instance is stored in a
-    global variable for later retrieval via ``get_client()``.
+    This function uses the provided pytest configuration object to create the
+    backend selected by the ``llm_backend`` option (Azure OpenAI by default).
+    The created backend is stored in a global variable for later retrieval via
+    ``get_client()``. Stages configured with their own deployment
+    (``llm_questions_deployment``, ``llm_answers_deployment``) get a separate
+    backend. When ``llm_pool`` lists several endpoints or deployments, a
+    :class:`~pytest_texts_score.pool.BackendPool` is created instead and
+    shared by all stages.
+
+    Stage deployments are Azure deployments of the single configured
+    endpoint; they cannot be combined with ``llm_pool``, whose members serve
+    every stage, or with another backend. The ``openai`` and ``callable``
+    backends route the stages by the per-stage model sent with each request
+    (``llm_questions_model``, ``llm_answers_model``) instead.
 
     :param config: The pytest config object containing LLM settings.
     :type config: pytest.Config
-    :return: The newly created ``AzureOpenAI`` client instance.
-    :rtype: AzureOpenAI
+    :return: The newly created backend instance.
+    :rtype: LLMBackend
+    :raises pytest.UsageError: If a stage deployment is configured together
+                               with ``llm_pool`` or a backend other than
+                               ``azure``.
     """
 
     global _client_instance
-    _client_instance = AzureOpenAI(
-        api_key=config._llm_api_key,
-        azure_endpoint=config._llm_endpoint,
-        api_version=config._llm_api_version,
-        azure_deployment=config._llm_deployment,
-    )
+    for stage in LLMStage:
+        deployment = getattr(config, f"_llm_{stage.value}_deployment")
+        if deployment == config._llm_deployment:
+            continue
+        if config._llm_pool:
+            raise pytest.UsageError(
+                f"llm_{stage.value}_deployment cannot be combined with "
+                "`llm_pool`, whose members serve every stage.")
+        if config._llm_backend != BackendType.AZURE:
+            raise pytest.UsageError(
+                f"llm_{stage.value}_deployment requires the `azure` backend; "
+                f"route stages with llm_{stage.value}_model instead.")
+    if config._llm_pool:
+        _client_instance = create_pool(config)
+    else:
+        _client_instance = create_backend(config)
+    _stage_instances.clear()
+    for stage in LLMStage:
+        deployment = getattr(config, f"_llm_{stage.value}_deployment")
+        if deployment == config._llm_deployment:
+            _stage_instances[stage] = _client_instance
+        else:
+            _stage_instances[stage] = create_backend(config, deployment)
     return _client_instance
 
 
-def get_client() -> AzureOpenAI:
+def get_client(stage: Optional[LLMStage] = None) -> LLMBackend:
     """
-    Return the initialized AzureOpenAI client.
+    Return the initialized LLM backend.
 
-    Retrieves the globally stored ``AzureOpenAI`` client instance. It is
-    designed to be called after ``init_client()`` has been executed,
-    typically within a pytest fixture.
+    Retrieves the globally stored backend instance. It is designed to be
+    called after ``init_client()`` has been executed, typically within a
+    pytest fixture.
 
-    :return: The initialized ``AzureOpenAI`` client instance.
-    :rtype: AzureOpenAI
+    :param stage: The pipeline stage the backend is used for. ``None``
+                  returns the default backend.
+    :type stage: Optional[LLMStage]
+    :return: The initialized backend instance.
+    :rtype: LLMBackend
     :raises RuntimeError: If the client has not been initialized by calling ``init_client()`` first.
     """
     if _client_instance is None:
         raise RuntimeError("Client not initialized. Call init_client() first.")
-    return _client_instance
+    if stage is None:
+        return _client_instance
+    return _stage_instances.get(stage, _client_instance)
@@ -1,92 +1,459 @@
-from pytest_texts_score.client import get_client
+from pytest_texts_score.breaker import get_breaker
+from pytest_texts_score.cache import paragraph_questions
+from pytest_texts_score.client import LLMStage, get_client
 from pytest_texts_score.plugin import get_config
 from pytest_texts_score.prompts import (
     get_system_answers_prompt,
     get_system_questions_prompt,
     get_user_answers_prompt,
+    get_prompts_version,
     get_user_questions_prompt,
 )
+from pytest_texts_score.hedging import LatencyTracker, hedged_complete
+from pytest_texts_score.records import QuestionAnswers, question_table
+from pytest_texts_score.retrieval import get_index, split_paragraphs
+from pytest_texts_score.questions import (
+    deduplicate_questions,
+    dump_questions,
+    merge_question_sets,
+    parse_questions,
+    question_budget,
+    split_evenly,
+    split_into_chunks,
+    subsample_questions,
+)
+from pytest_texts_score.singleflight import SingleFlight
+from pytest_texts_score.stats import session_stats
+from pytest_texts_score.tokens import (
+    count_message_tokens,
+    count_tokens,
+    estimate_answers_output_tokens,
+    estimate_questions_output_tokens,
+    fit_max_tokens,
+)
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import pytest
-from typing import Any
+from typing import Any, Callable, Optional, TypeVar
+import hashlib
 import json
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Latencies are tracked per stage, as questions and answers differ in length.
+_latency_trackers = {stage: LatencyTracker() for stage in LLMStage}
+# Identical requests in flight at the same time share one request.
+_in_flight = SingleFlight()
+
+
+def complete(stage: LLMStage, system_prompt: str, user_prompt: str,
+             max_tokens: int) -> str:
+    """
+    Send one chat request for a pipeline stage and return the reply content.
+
+    The request is routed to the backend and model configured for ``stage``
+    and passes through the session-wide circuit breaker, so that tests fail
+    (or are skipped) immediately while the LLM endpoint is known to be down.
+    With ``llm_hedge`` enabled, requests slower than the configured latency
+    percentile of the stage are hedged.
+
+    The prompt is measured locally before sending. ``max_tokens`` is lowered
+    to what is left of the ``llm_context_window``; a prompt that leaves no
+    room for the expected output fails immediately instead of after a round
+    trip.
+
+    Identical requests issued concurrently (e.g. by tests running in
+    parallel that generate questions for the same text) share one in-flight
+    request unless ``llm_coalesce_requests`` is disabled.
+
+    :param stage: The pipeline stage issuing the request.
+    :type stage: LLMStage
+    :param system_prompt: The system prompt.
+    :type system_prompt: str
+    :param user_prompt: The user prompt.
+    :type user_prompt: str
+    :param max_tokens: Maximum number of tokens of the reply.
+    :type max_tokens: int
+    :return: The reply content, or an empty string if there is none.
+    :rtype: str
+    :raises PromptTooLongError: If the prompt does not fit into the context window.
+    :raises openai.APIError: If the API call to the LLM fails.
+    """
+    if not get_config()._llm_coalesce_requests:
+        return _send(stage, system_prompt, user_prompt, max_tokens)
+    return _in_flight.call(
+        (stage, system_prompt, user_prompt, max_tokens),
+        lambda: _send(stage, system_prompt, user_prompt, max_tokens))
+
+
+async def acomplete(stage: LLMStage, system_prompt: str, user_prompt: str,
+                    max_tokens: int) -> str:
+    """
+    Asynchronous variant of :func:`complete` for use from asyncio tasks.
+
+    The request is sent from a worker thread. Tasks and threads issuing the
+    identical request concurrently share one in-flight request; waiting for
+    it does not block the event loop.
+
+    :param stage: The pipeline stage issuing the request.
+    :type stage: LLMStage
+    :param system_prompt: The system prompt.
+    :type system_prompt: str
+    :param user_prompt: The user prompt.
+    :type user_prompt: str
+    :param max_tokens: Maximum number of tokens of the reply.
+    :type max_tokens: int
+    :return: The reply content, or an empty string if there is none.
+    :rtype: str
+    :raises PromptTooLongError: If the prompt does not fit into the context window.
+    :raises openai.APIError: If the API call to the LLM fails.
+    """
+    if not get_config()._llm_coalesce_requests:
+        return await asyncio.to_thread(_send, stage, system_prompt,
+                                       user_prompt, max_tokens)
+    return await _in_flight.acall(
+        (stage, system_prompt, user_prompt, max_tokens),
+        lambda: asyncio.to_thread(_send, stage, system_prompt, user_prompt,
+                                  max_tokens))
+
+
+def _send(stage: LLMStage, system_prompt: str, user_prompt: str,
+          max_tokens: int) -> str:
+    """Send one chat request for ``stage``; see :func:`complete`."""
+    config = get_config()
+    client = get_client(stage)
+    model = getattr(config, f"_llm_{stage.value}_model")
+    messages = [
+        {
+            "role": "system",
+            "content": system_prompt
+        },
+        {
+            "role": "user",
+            "content": user_prompt
+        },
+    ]
+    # With adaptive sizing `max_tokens` is the expected output, which has to
+    # fit; otherwise it is only an upper bound lowered to the space left.
+    max_tokens = fit_max_tokens(
+        count_message_tokens(messages, model), max_tokens,
+        config._llm_context_window,
+        max_tokens if config._llm_adaptive_max_tokens else 1)
+    request = {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": 0,
+    }
+    if not config._llm_hedge:
+        return get_breaker().call(lambda: client.complete(**request))
+    return get_breaker().call(lambda: hedged_complete(
+        client,
+        request,
+        _latency_trackers[stage],
+        percentile=config._llm_hedge_percentile,
+        min_samples=config._llm_hedge_min_samples,
+    ))
+
+
+def output_tokens(stage: LLMStage, expected_tokens: int) -> int:
+    """
+    Return ``max_tokens`` for a request of ``stage``.
+
+    With ``llm_adaptive_max_tokens`` enabled, requests reserve only their
+    expected output (capped by the configured maximum) instead of the full
+    configured maximum.
+
+    :param stage: The pipeline stage issuing the request.
+    :type stage: LLMStage
+    :param expected_tokens: The expected number of output tokens.
+    :type expected_tokens: int
+    :return: The ``max_tokens`` value of the request.
+    :rtype: int
+    """
+    config = get_config()
+    configured = getattr(config, f"_llm_{stage.value}_max_tokens")
+    if not config._llm_adaptive_max_tokens:
+        return configured
+    return min(configured, expected_tokens)
+
+
+def map_concurrent(stage: LLMStage, function: Callable[[T], R],
+                   items: list[T]) -> list[R]:
+    """
+    Apply ``function`` to ``items`` concurrently, as the stage backend allows.
+
+    Backends supporting batching run up to their ``max_concurrency`` calls at
+    once; other backends run them one after another.
+
+    :param stage: The pipeline stage whose backend ``function`` calls.
+    :type stage: LLMStage
+    :param function: The function issuing one LLM request per item.
+    :type function: Callable[[T], R]
+    :param items: The items to process.
+    :type items: list[T]
+    :return: The results, in the order of ``items``.
+    :rtype: list[R]
+    """
+    client = get_client(stage)
+    workers = min(client.max_concurrency, len(items))
+    if not client.supports_batching or workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
 
 def make_questions(base_text: str) -> str:
     """
     Generate questions from a given text using the LLM.
 
-    This function sends the ``base_text`` to the configured Azure OpenAI model
+    This function sends the ``base_text`` to the configured LLM backend
     with a system prompt designed to elicit factual yes/no questions. It
     retrieves the global configuration and client instance to make the API call.
 
+    With ``llm_questions_dedupe_threshold`` set, questions too similar to an
+    earlier question (e.g. "Does the text state X?" and "Does the text say
+    X?") are dropped locally before the set is returned.
+
+    With ``llm_questions_max`` or ``llm_questions_per_100_tokens`` set, the
+    number of questions is limited to a budget: the prompt asks for at most
+    that many questions and a larger reply is reduced to evenly spaced
+    questions, which bounds the cost of every later answer call.
+
+    With ``llm_questions_by_paragraph`` enabled, questions are generated per
+    paragraph and kept in the pytest cache, so that after an edit only the
+    changed paragraphs need new questions.
+
     :param base_text: The text from which to generate questions.
     :type base_text: str
     :return: A JSON string containing the generated questions. Returns an empty
              string if the model response content is empty.
     :rtype: str
+    :raises ValueError: If a question set to de-duplicate or limit is not
+                        valid JSON.
     :raises openai.APIError: If the API call to the LLM fails.
     """
     config = get_config()
-    client = get_client()
-    response = client.chat.completions.create(
-        model=config._llm_model,
-        messages=[
-            {
-                "role": "system",
-                "content": get_system_questions_prompt()
-            },
-            {
-                "role": "user",
-                "content": get_user_questions_prompt(base_text)
-            },
-        ],
-        max_tokens=config._llm_max_tokens,
-        temperature=0,
+    chunk_tokens = config._llm_questions_chunk_tokens
+    if config._llm_questions_by_paragraph:
+        questions_text = _make_questions_by_paragraph(base_text)
+    elif chunk_tokens and count_tokens(
+            base_text, config._llm_questions_model) > chunk_tokens:
+        questions_text = _make_questions_chunked(
+            base_text, chunk_tokens, config._llm_questions_chunk_overlap)
+    else:
+        questions_text = _generate_questions(base_text)
+    threshold = config._llm_questions_dedupe_threshold
+    budget = _question_budget(base_text)
+    if not threshold and budget is None:
+        return questions_text
+    questions = parse_questions(questions_text)
+    kept = questions
+    if threshold:
+        kept = deduplicate_questions(kept, threshold)
+        session_stats.increment("questions_deduplicated",
+                                len(questions) - len(kept))
+    if budget is not None and len(kept) > budget:
+        session_stats.increment("questions_subsampled", len(kept) - budget)
+        kept = subsample_questions(kept, budget)
+    if len(kept) == len(questions):
+        return questions_text
+    return dump_questions(kept)
+
+
+def _question_budget(text: str) -> Optional[int]:
+    """Return the question budget of ``text``, or ``None`` if unlimited."""
+    config = get_config()
+    return question_budget(count_tokens(text, config._llm_questions_model),
+                           config._llm_questions_max,
+                           config._llm_questions_per_100_tokens)
+
+
+def _generate_questions(text: str) -> str:
+    """Send one question generation request for ``text``."""
+    config = get_config()
+    budget = _question_budget(text)
+    expected = estimate_questions_output_tokens(
+        count_tokens(text, config._llm_questions_model), budget)
+    return complete(LLMStage.QUESTIONS, get_system_questions_prompt(budget),
+                    get_user_questions_prompt(text),
+                    output_tokens(LLMStage.QUESTIONS, expected))
+
+
+def _make_questions_chunked(base_text: str, chunk_tokens: int,
+                            overlap_tokens: int) -> str:
+    """
+    Generate questions for a long text chunk by chunk and merge them.
+
+    The text is split into overlapping chunks, questions are generated for
+    the chunks in parallel and the resulting sets are merged into one, with
+    duplicates (e.g. from the overlaps) removed.
+
+    :param base_text: The text from which to generate questions.
+    :type base_text: str
+    :param chunk_tokens: Maximum number of tokens per chunk.
+    :type chunk_tokens: int
+    :param overlap_tokens: Number of tokens repeated between chunks.
+    :type overlap_tokens: int
+    :return: A JSON string containing the merged questions.
+    :rtype: str
+    :raises ValueError: If a chunk's question set is not valid JSON.
+    """
+    chunks = split_into_chunks(base_text, chunk_tokens, overlap_tokens,
+                               get_config()._llm_questions_model)
+    question_sets = map_concurrent(
+        LLMStage.QUESTIONS,
+        lambda chunk: parse_questions(_generate_questions(chunk)),
+        chunks,
     )
-    questions_text = response.choices[0].message.content
-    return questions_text or ""
+    return dump_questions(merge_question_sets(question_sets))
+
+
+def _make_questions_by_paragraph(base_text: str) -> str:
+    """
+    Generate questions paragraph by paragraph, reusing cached paragraphs.
+
+    Questions of unchanged paragraphs come from :data:`paragraph_questions`;
+    only paragraphs without stored questions are sent to the LLM, in
+    parallel. The sets are merged in paragraph order.
+
+    :param base_text: The text from which to generate questions.
+    :type base_text: str
+    :return: A JSON string containing the merged questions.
+    :rtype: str
+    :raises ValueError: If a paragraph's question set is not valid JSON.
+    """
+    store = getattr(get_config(), "cache", None)
+    paragraphs = split_paragraphs(base_text) or [base_text]
+    draws = []
+    for paragraph in paragraphs:
+        key = paragraph_key(paragraph)
+        draws.append((key, *paragraph_questions.draw(key, store)))
+    missing = [(index, paragraph)
+               for index, (paragraph, (_, _, questions)) in enumerate(
+                   zip(paragraphs, draws)) if questions is None]
+    session_stats.increment("paragraphs_reused",
+                            len(paragraphs) - len(missing))
+    generated = map_concurrent(
+        LLMStage.QUESTIONS,
+        lambda item: parse_questions(_generate_questions(item[1])),
+        missing,
+    )
+    question_sets = [questions for _, _, questions in draws]
+    for (index, _), questions in zip(missing, generated):
+        key, slot, _ = draws[index]
+        paragraph_questions.put(key, slot, questions, store)
+        question_sets[index] = questions
+    return dump_questions(merge_question_sets(question_sets))
+
+
+def paragraph_key(paragraph: str) -> str:
+    """
+    Return the cache key of the questions of a paragraph.
+
+    The key covers everything the questions depend on: the paragraph, the
+    prompt templates, the question model and the question budget.
+
+    :param paragraph: The paragraph.
+    :type paragraph: str
+    :return: A hex SHA-256 digest.
+    :rtype: str
+    """
+    config = get_config()
+    parts = (paragraph, get_prompts_version(), str(config._llm_questions_model),
+             str(_question_budget(paragraph)))
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
 
 
 def evaluate_questions(answer_text: str,
-                       questions_text: str) -> list[dict[str, Any]]:
+                       questions_text: str) -> QuestionAnswers:
     """
     Evaluate how well a text answers a list of questions using the LLM.
 
     This function sends the ``answer_text`` and a JSON string of
-    ``questions_text`` to the configured Azure OpenAI model. The model is
+    ``questions_text`` to the configured LLM backend. The model is
     prompted to answer each question based on the text and provide a numeric
     score. The function parses the JSON response and returns the list of
     answers. It also handles and warns about responses that might include
     markdown ```json tags.
 
+    Large question sets can be split into shards answered concurrently and
+    merged afterwards. With ``llm_answers_shards`` greater than 1, the
+    questions are split into that many shards, each answered against the
+    whole ``answer_text``. With ``llm_answers_retrieval_top_k`` set and an
+    ``answer_text`` of more paragraphs than that, the questions are answered
+    in shards of ``llm_answers_retrieval_shard_size`` instead, each against
+    only the ``top_k`` paragraphs most relevant to it according to a local
+    BM25 index.
+
     :param answer_text: The text to use for answering the questions.
     :type answer_text: str
     :param questions_text: A JSON string representing the list of questions.
     :type questions_text: str
-    :return: A list of dictionaries, where each dictionary contains a
-             'question' and its corresponding 'answer' score.
-    :rtype: list[dict[str, Any]]
+    :return: The answers, indexable like a list of dictionaries that each
+             contain a 'question' and its corresponding 'answer' score.
+    :rtype: QuestionAnswers
     :raises ValueError: If the LLM response is not valid JSON or cannot be parsed.
+    :raises TypeError: If an answer in the LLM response is not numeric.
     :raises openai.APIError: If the API call to the LLM fails.
     """
     config = get_config()
-    client = get_client()
-    response = client.chat.completions.create(
-        model=config._llm_model,
-        messages=[
-            {
-                "role": "system",
-                "content": get_system_answers_prompt()
-            },
-            {
-                "role": "user",
-                "content": get_user_answers_prompt(answer_text, questions_text),
-            },
-        ],
-        max_tokens=config._llm_max_tokens,
-        temperature=0,
-    )
-    response_content = response.choices[0].message.content or ""
+    top_k = config._llm_answers_retrieval_top_k
+    shards = config._llm_answers_shards
+    jobs = []
+    if top_k and len(get_index(answer_text).passages) > top_k:
+        index = get_index(answer_text)
+        questions = parse_questions(questions_text)
+        shard_size = config._llm_answers_retrieval_shard_size
+        for start in range(0, len(questions), shard_size):
+            shard = questions[start:start + shard_size]
+            passages = index.search(" ".join(shard), top_k)
+            jobs.append(("\n\n".join(index.passages[i] for i in passages),
+                         dump_questions(shard)))
+    elif shards > 1:
+        questions = parse_questions(questions_text)
+        jobs = [(answer_text, dump_questions(shard))
+                for shard in split_evenly(questions, shards)]
+    if len(jobs) <= 1:
+        answers = _answer_questions(answer_text, questions_text)
+    else:
+        answers_lists = map_concurrent(LLMStage.ANSWERS,
+                                       lambda job: _answer_questions(*job),
+                                       jobs)
+        answers = [answer for answers in answers_lists for answer in answers]
+    return QuestionAnswers.from_items(question_table(questions_text), answers)
+
+
+def _answer_questions(answer_text: str,
+                      questions_text: str) -> list[dict[str, Any]]:
+    """
+    Answer a JSON question set with one LLM request.
+
+    :param answer_text: The text to use for answering the questions.
+    :type answer_text: str
+    :param questions_text: A JSON string representing the list of questions.
+    :type questions_text: str
+    :return: A list of dictionaries with 'question' and 'answer' keys.
+    :rtype: list[dict[str, Any]]
+    :raises ValueError: If the LLM response is not valid JSON or cannot be parsed.
+    """
+    config = get_config()
+    max_tokens = config._llm_answers_max_tokens
+    if config._llm_adaptive_max_tokens:
+        try:
+            max_tokens = output_tokens(
+                LLMStage.ANSWERS,
+                estimate_answers_output_tokens(
+                    parse_questions(questions_text),
+                    config._llm_answers_model))
+        except ValueError:
+            # Malformed question sets are left to the model; reserve the
+            # configured maximum for them.
+            pass
+    response_content = complete(
+        LLMStage.ANSWERS, get_system_answers_prompt(),
+        get_user_answers_prompt(answer_text, questions_text), max_tokens)
 
     # Some models, especially when instructed to return JSON, may wrap the output
     # in markdown code blocks (e.g., ```json ... ```). This block of code
@@ -1,14 +1,75 @@
 from enum import Enum
-from typing import Literal
+from typing import Any, Callable, Literal, Optional, TypeVar
+from pytest_texts_score.cache import AnswerCache, score_store
 from pytest_texts_score.communication import (
     evaluate_questions,
     make_questions,
 )
+from pytest_texts_score.planning import (
+    DEFAULT_AUTO_RUNS,
+    history_key,
+    load_history,
+    plan_runs,
+    update_history,
+    variance_components,
+)
+from pytest_texts_score.plugin import get_config
+from pytest_texts_score.prompts import get_prompts_version
+from pytest_texts_score.question_bank import active_question_bank
+from pytest_texts_score.questions import dump_questions, parse_questions
+from pytest_texts_score.records import RunScores, mean_answer
+from pytest_texts_score.stats import session_stats
+from pytest_texts_score.streaming import StreamingAggregator
+from pytest_texts_score.tokens import PromptTooLongError
 from statistics import median, mean
 
 #: The maximum number of times to retry an LLM call upon failure before raising an exception.
 MAXIMAL_RETRY_ON_ERROR = 5
 
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """
+    Retries shared by the LLM calls of one evaluation.
+
+    :param retry_on_error: Whether failed attempts are retried at all.
+    :type retry_on_error: bool
+    """
+
+    def __init__(self, retry_on_error: bool = True) -> None:
+        self.retry_on_error = retry_on_error
+        self.retries = 0
+
+    def run(self, attempt: Callable[[], T], label: str) -> T:
+        """
+        Call ``attempt`` until it succeeds or the retries are used up.
+
+        :param attempt: The LLM calls to try, repeated as a whole on failure.
+        :type attempt: Callable[[], T]
+        :param label: Where the error occurred, for the retry message.
+        :type label: str
+        :return: The result of ``attempt``.
+        :rtype: T
+        :raises PromptTooLongError: Without retrying, as retrying cannot make
+                                    a prompt fit into the context window.
+        :raises Exception: If the operation fails after the maximum number of retries.
+        """
+        while True:
+            try:
+                return attempt()
+            except PromptTooLongError:
+                raise
+            except Exception as e:
+                if not self.retry_on_error:
+                    raise
+                print(f"Error on {label}; retrying: {e}")
+                self.retries += 1
+                if self.retries > MAXIMAL_RETRY_ON_ERROR:
+                    raise Exception(
+                        f"Operation failed after {self.retries} retries. Last error: {e}"
+                    ) from e
+
 
 class AggType(str, Enum):
     """Aggregation types for recall scores."""
@@ -28,7 +89,8 @@ class ScoreType(str, Enum):
 
 def texts_evaluate_f1(expected: str,
                       given: str,
-                      retry_on_error: bool = True) -> float:
+                      retry_on_error: bool = True,
+                      fresh: bool = False) -> float:
     """
     Calculate the F1 score between two texts.
 
@@ -42,17 +104,22 @@ def texts_evaluate_f1(expected: str,
     :type given: str
     :param retry_on_error: Whether to retry the LLM call on failure. Defaults to ``True``.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     :return: The calculated F1 score.
     :rtype: float
     """
-    precision = texts_evaluate_precision(expected, given, retry_on_error)
-    recall = texts_evaluate_recall(expected, given, retry_on_error)
+    precision = texts_evaluate_precision(expected, given, retry_on_error,
+                                         fresh)
+    recall = texts_evaluate_recall(expected, given, retry_on_error, fresh)
     return f1_score(precision, recall)
 
 
 def texts_evaluate_precision(expected: str,
                              given: str,
-                             retry_on_error: bool = True) -> float:
+                             retry_on_error: bool = True,
+                             fresh: bool = False) -> float:
     """
     Evaluate the precision score of the given text against the expected text.
 
@@ -67,15 +134,19 @@ def texts_evaluate_precision(expected: str,
     :type given: str
     :param retry_on_error: Whether to retry the LLM call on failure. Defaults to ``True``.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     :return: The calculated precision score.
     :rtype: float
     """
-    return score_one_side(given, expected, retry_on_error=retry_on_error)
+    return _stored_score_one_side(given, expected, retry_on_error, fresh)
 
 
 def texts_evaluate_recall(expected: str,
                           given: str,
-                          retry_on_error: bool = True) -> float:
+                          retry_on_error: bool = True,
+                          fresh: bool = False) -> float:
     """
     Evaluate the recall score of the given text against the expected text.
 
@@ -90,10 +161,17 @@ def texts_evaluate_recall(expected: str,
     :type given: str
     :param retry_on_error: Whether to retry the LLM call on failure. Defaults to ``True``.
     :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute a new score
+                  instead of reusing a stored one. Defaults to ``False``.
+    :type fresh: bool
     :return: The calculated recall score.
     :rtype: float
     """
-    return score_one_side(expected, given, retry_on_error=retry_on_error)
+    return _stored_score_one_side(expected,
+                                  given,
+                                  retry_on_error,
+                                  fresh,
+                                  reference=True)
 
 
 def texts_multiple_f1(
@@ -103,7 +181,8 @@ def texts_multiple_f1(
     generate_answers_per_questions: int,
     score_only: bool = True,
     retry_on_error: bool = True,
-) -> list[float] | list[tuple[int, int, float, float, float]]:
+    aggregator: Optional[StreamingAggregator] = None,
+) -> list[float] | RunScores | StreamingAggregator:
     """
     Perform multiple evaluation runs to get a list of F1 scores.
 
@@ -112,6 +191,10 @@ def texts_multiple_f1(
     precision and recall in each ``generate_questions`` loop, and for each set,
     it evaluates answers ``generate_answers_per_questions`` times.
 
+    With ``llm_answer_cache`` enabled, questions repeated in a regenerated
+    question set reuse the answer of the same answer run instead of being
+    sent to the LLM again.
+
     :param expected: The reference text.
     :type expected: str
     :param given: The text to evaluate.
@@ -124,53 +207,42 @@ def texts_multiple_f1(
     :type score_only: bool
     :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
     :type retry_on_error: bool
-    :return: A list of F1 scores, or a list of tuples ``(question_run, answer_run, precision, recall, f1_score)``.
-    :rtype: list[float] | list[tuple[int, int, float, float, float]]
+    :param aggregator: If given, every score is added to it instead of being stored, so that memory stays constant regardless of the number of runs.
+    :type aggregator: Optional[StreamingAggregator]
+    :return: A list of F1 scores, or the run scores, indexable like a list of tuples ``(question_run, answer_run, precision, recall, f1_score)``, or ``aggregator`` if given.
+    :rtype: list[float] | RunScores | StreamingAggregator
     :raises Exception: If the operation fails after the maximum number of retries.
     """
-    # This function contains a retry mechanism. The outer loop iterates through `generate_questions`,
-    # creating new question sets. The inner `while True` loop handles retries for LLM calls
-    # within a single question set generation, providing resilience against transient network or API errors.
-    results = []
-    retries = 0
+    # Each question run is retried as a whole, providing resilience against
+    # transient network or API errors; its scores are kept once it succeeds.
+    results = RunScores(("precision", "recall", "f1"))
+    budget = RetryBudget(retry_on_error)
+    cache = _new_answer_cache()
     for q_i in range(generate_questions):
-        while True:
-            try:
-                question_text_precision = make_questions(given)
-                question_text_recall = make_questions(expected)
-                for a_i in range(generate_answers_per_questions):
-                    answers_list_precision = evaluate_questions(
-                        expected, question_text_precision)
-                    score_value_counts = [
-                        j.get("answer") for j in answers_list_precision
-                    ]
-                    precision = sum(score_value_counts) / len(
-                        score_value_counts)
-
-                    answers_list_recall = evaluate_questions(
-                        given, question_text_recall)
-                    score_value_counts = [
-                        j.get("answer") for j in answers_list_recall
-                    ]
-                    recall = sum(score_value_counts) / len(score_value_counts)
-                    if score_only:
-                        results.append(f1_score(precision, recall))
-                    else:
-                        results.append((q_i, a_i, precision, recall,
-                                        f1_score(precision, recall)))
-                break
 
-            except Exception as e:
-                if not retry_on_error:
-                    raise
-                print(f"Error on question_run={q_i}; retrying: {e}")
-                retries += 1
-                if retries > MAXIMAL_RETRY_ON_ERROR:
-                    raise Exception(
-                        f"Operation failed after {retries} retries. Last error: {e}"
-                    ) from e
-                continue
-    return results
+        def question_run() -> list[tuple[float, float]]:
+            question_text_precision = make_questions(given)
+            question_text_recall = _reference_questions(expected)
+            scores = []
+            for a_i in range(generate_answers_per_questions):
+                answers_list_precision = _answer_questions(
+                    expected, question_text_precision, cache, a_i)
+                answers_list_recall = _answer_questions(
+                    given, question_text_recall, cache, a_i)
+                scores.append((mean_answer(answers_list_precision),
+                               mean_answer(answers_list_recall)))
+            return scores
+
+        for a_i, (precision, recall) in enumerate(
+                budget.run(question_run, f"question_run={q_i}")):
+            if aggregator is not None:
+                aggregator.update(f1_score(precision, recall))
+            else:
+                results.append(q_i, a_i, precision, recall,
+                               f1_score(precision, recall))
+    if aggregator is not None:
+        return aggregator
+    return list(results.column("f1")) if score_only else results
 
 
 def texts_multiple_precision(
@@ -180,7 +252,8 @@ def texts_multiple_precision(
     generate_answers_per_questions: int,
     score_only: bool = True,
     retry_on_error: bool = True,
-) -> list[float] | list[tuple[int, int, float]]:
+    aggregator: Optional[StreamingAggregator] = None,
+) -> list[float] | RunScores | StreamingAggregator:
     """
     Perform multiple evaluation runs to get a list of precision scores.
 
@@ -189,6 +262,10 @@ def texts_multiple_precision(
     ``generate_questions`` loop, and for each set, it evaluates answers
     ``generate_answers_per_questions`` times using the ``expected`` text.
 
+    With ``llm_answer_cache`` enabled, questions repeated in a regenerated
+    question set reuse the answer of the same answer run instead of being
+    sent to the LLM again.
+
     :param expected: The reference text for answering.
     :type expected: str
     :param given: The text to generate questions from.
@@ -201,45 +278,37 @@ def texts_multiple_precision(
     :type score_only: bool
     :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
     :type retry_on_error: bool
-    :return: A list of precision scores, or a list of tuples ``(question_run, answer_run, precision)``.
-    :rtype: list[float] | list[tuple[int, int, float]]
+    :param aggregator: If given, every score is added to it instead of being stored, so that memory stays constant regardless of the number of runs.
+    :type aggregator: Optional[StreamingAggregator]
+    :return: A list of precision scores, or the run scores, indexable like a list of tuples ``(question_run, answer_run, precision)``, or ``aggregator`` if given.
+    :rtype: list[float] | RunScores | StreamingAggregator
     :raises Exception: If the operation fails after the maximum number of retries.
     """
-    # This function contains a retry mechanism. The outer loop iterates through `generate_questions`,
-    # creating new question sets. The inner `while True` loop handles retries for LLM calls
-    # within a single question set generation.
-    results = []
-    retries = 0
+    # Each question run is retried as a whole; its scores are kept once it
+    # succeeds.
+    results = RunScores(("precision",))
+    budget = RetryBudget(retry_on_error)
+    cache = _new_answer_cache()
     for q_i in range(generate_questions):
-        while True:
-            try:
-                question_text_precision = make_questions(given)
-                for a_i in range(generate_answers_per_questions):
-                    answers_list_precision = evaluate_questions(
-                        expected, question_text_precision)
-                    score_value_counts = [
-                        j.get("answer") for j in answers_list_precision
-                    ]
-                    precision = sum(score_value_counts) / len(
-                        score_value_counts)
-
-                    if score_only:
-                        results.append(precision)
-                    else:
-                        results.append((q_i, a_i, precision))
-                break
 
-            except Exception as e:
-                if not retry_on_error:
-                    raise
-                print(f"Error on question_run={q_i}; retrying: {e}")
-                retries += 1
-                if retries > MAXIMAL_RETRY_ON_ERROR:
-                    raise Exception(
-                        f"Operation failed after {retries} retries. Last error: {e}"
-                    ) from e
-                continue
-    return results
+        def question_run() -> list[float]:
+            question_text_precision = make_questions(given)
+            return [
+                mean_answer(
+                    _answer_questions(expected, question_text_precision,
+                                      cache, a_i))
+                for a_i in range(generate_answers_per_questions)
+            ]
+
+        for a_i, precision in enumerate(
+                budget.run(question_run, f"question_run={q_i}")):
+            if aggregator is not None:
+                aggregator.update(precision)
+            else:
+                results.append(q_i, a_i, precision)
+    if aggregator is not None:
+        return aggregator
+    return list(results.column("precision")) if score_only else results
 
 
 def texts_multiple_recall(
@@ -249,7 +318,8 @@ def texts_multiple_recall(
     generate_answers_per_questions: int,
     score_only: bool = True,
     retry_on_error: bool = True,
-) -> list[float] | list[tuple[int, int, float]]:
+    aggregator: Optional[StreamingAggregator] = None,
+) -> list[float] | RunScores | StreamingAggregator:
     """
     Perform multiple evaluation runs to get a list of recall scores.
 
@@ -258,6 +328,10 @@ def texts_multiple_recall(
     ``generate_questions`` loop, and for each set, it evaluates answers
     ``generate_answers_per_questions`` times using the ``given`` text.
 
+    With ``llm_answer_cache`` enabled, questions repeated in a regenerated
+    question set reuse the answer of the same answer run instead of being
+    sent to the LLM again.
+
     :param expected: The reference text to generate questions from.
     :type expected: str
     :param given: The text for answering.
@@ -270,48 +344,255 @@ def texts_multiple_recall(
     :type score_only: bool
     :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
     :type retry_on_error: bool
-    :return: A list of recall scores, or a list of tuples ``(question_run, answer_run, recall)``.
-    :rtype: list[float] | list[tuple[int, int, float]]
+    :param aggregator: If given, every score is added to it instead of being stored, so that memory stays constant regardless of the number of runs.
+    :type aggregator: Optional[StreamingAggregator]
+    :return: A list of recall scores, or the run scores, indexable like a list of tuples ``(question_run, answer_run, recall)``, or ``aggregator`` if given.
+    :rtype: list[float] | RunScores | StreamingAggregator
     :raises Exception: If the operation fails after the maximum number of retries.
     """
-    # This function contains a retry mechanism. The outer loop iterates through `generate_questions`,
-    # creating new question sets. The inner `while True` loop handles retries for LLM calls
-    # within a single question set generation.
-    results = []
-    retries = 0
+    # Each question run is retried as a whole; its scores are kept once it
+    # succeeds.
+    results = RunScores(("recall",))
+    budget = RetryBudget(retry_on_error)
+    cache = _new_answer_cache()
     for q_i in range(generate_questions):
-        while True:
-            try:
-                question_text_recall = make_questions(expected)
-                for a_i in range(generate_answers_per_questions):
-                    answers_list_recall = evaluate_questions(
-                        given, question_text_recall)
-                    score_value_counts = [
-                        j.get("answer") for j in answers_list_recall
-                    ]
-                    recall = sum(score_value_counts) / len(score_value_counts)
-                    if score_only:
-                        results.append(recall)
-                    else:
-                        results.append((q_i, a_i, recall))
-                break
 
-            except Exception as e:
-                if not retry_on_error:
-                    raise
-                print(f"Error on question_run={q_i}; retrying: {e}")
-                retries += 1
-                if retries > MAXIMAL_RETRY_ON_ERROR:
-                    raise Exception(
-                        f"Operation failed after {retries} retries. Last error: {e}"
-                    ) from e
-                continue
-    return results
+        def question_run() -> list[float]:
+            question_text_recall = _reference_questions(expected)
+            return [
+                mean_answer(
+                    _answer_questions(given, question_text_recall, cache,
+                                      a_i))
+                for a_i in range(generate_answers_per_questions)
+            ]
+
+        for a_i, recall in enumerate(
+                budget.run(question_run, f"question_run={q_i}")):
+            if aggregator is not None:
+                aggregator.update(recall)
+            else:
+                results.append(q_i, a_i, recall)
+    if aggregator is not None:
+        return aggregator
+    return list(results.column("recall")) if score_only else results
+
+
+def texts_evaluate_scores(expected: str,
+                          given: str,
+                          score_types: list[ScoreType],
+                          retry_on_error: bool = True,
+                          fresh: bool = False) -> dict[ScoreType, float]:
+    """
+    Evaluate several scores of a pair of texts, scoring each side once.
+
+    Precision and recall are computed only if requested or needed for F1;
+    F1 is derived from them without further LLM calls.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param score_types: The scores to evaluate.
+    :type score_types: list[ScoreType]
+    :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
+    :type retry_on_error: bool
+    :param fresh: With ``llm_score_store`` enabled, compute new scores
+                  instead of reusing stored ones. Defaults to ``False``.
+    :type fresh: bool
+    :return: The requested scores (and the sides needed for F1) by type.
+    :rtype: dict[ScoreType, float]
+    """
+    score_types = [ScoreType(score_type) for score_type in score_types]
+    scores = {}
+    if ScoreType.PRECISION in score_types or ScoreType.F1 in score_types:
+        scores[ScoreType.PRECISION] = texts_evaluate_precision(
+            expected, given, retry_on_error, fresh)
+    if ScoreType.RECALL in score_types or ScoreType.F1 in score_types:
+        scores[ScoreType.RECALL] = texts_evaluate_recall(
+            expected, given, retry_on_error, fresh)
+    if ScoreType.F1 in score_types:
+        scores[ScoreType.F1] = f1_score(scores[ScoreType.PRECISION],
+                                        scores[ScoreType.RECALL])
+    return scores
+
+
+def texts_multiple_scores(
+    expected: str,
+    given: str,
+    generate_questions: int,
+    generate_answers_per_questions: int,
+    score_types: list[ScoreType],
+    retry_on_error: bool = True,
+) -> dict[ScoreType, list[float]]:
+    """
+    Perform multiple evaluation runs of several scores at once.
+
+    A single set of runs serves all requested scores: with both sides needed
+    (for F1, or precision and recall together) every run evaluates both of
+    them once, otherwise only the requested side is evaluated.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param generate_questions: The number of times to generate a new set of questions.
+    :type generate_questions: int
+    :param generate_answers_per_questions: The number of times to evaluate answers for each set of questions.
+    :type generate_answers_per_questions: int
+    :param score_types: The scores to evaluate.
+    :type score_types: list[ScoreType]
+    :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
+    :type retry_on_error: bool
+    :return: The run scores of each evaluated score type.
+    :rtype: dict[ScoreType, list[float]]
+    :raises Exception: If the operation fails after the maximum number of retries.
+    """
+    score_types = [ScoreType(score_type) for score_type in score_types]
+    precision = ScoreType.PRECISION in score_types
+    recall = ScoreType.RECALL in score_types
+    if ScoreType.F1 in score_types or (precision and recall):
+        runs = texts_multiple_f1(expected, given, generate_questions,
+                                 generate_answers_per_questions, False,
+                                 retry_on_error)
+        return {
+            ScoreType.PRECISION: list(runs.column("precision")),
+            ScoreType.RECALL: list(runs.column("recall")),
+            ScoreType.F1: list(runs.column("f1")),
+        }
+    if precision:
+        return {
+            ScoreType.PRECISION:
+            texts_multiple_precision(expected, given, generate_questions,
+                                     generate_answers_per_questions, True,
+                                     retry_on_error)
+        }
+    return {
+        ScoreType.RECALL:
+        texts_multiple_recall(expected, given, generate_questions,
+                              generate_answers_per_questions, True,
+                              retry_on_error)
+    }
+
+
+def _stored_score_one_side(base_text: str,
+                           answer_text: str,
+                           retry_on_error: bool,
+                           fresh: bool,
+                           reference: bool = False) -> float:
+    """
+    Return the one-sided score of a directed pair, consulting the score store.
+
+    With ``llm_score_store`` enabled, a score already computed in this
+    session is reused unless ``fresh`` is set; new scores are stored. While a
+    question bank is in use, reference scores are stored per bank.
+
+    :param base_text: The text to generate questions from.
+    :type base_text: str
+    :param answer_text: The text to answer the questions with.
+    :type answer_text: str
+    :param retry_on_error: Whether to retry LLM calls on failure.
+    :type retry_on_error: bool
+    :param fresh: Whether to compute a new score even if one is stored.
+    :type fresh: bool
+    :param reference: Whether ``base_text`` is the reference text, whose
+                      questions may come from a question bank.
+    :type reference: bool
+    :return: The one-sided score.
+    :rtype: float
+    """
+    if not get_config()._llm_score_store:
+        return score_one_side(base_text,
+                              answer_text,
+                              retry_on_error=retry_on_error,
+                              reference=reference)
+    # Reference questions drawn from (or recorded into) a question bank
+    # differ from generated ones, so their scores are stored apart.
+    bank = active_question_bank() if reference else None
+    source = "" if bank is None else f"{bank.path}:{get_prompts_version()}"
+    if not fresh:
+        stored = score_store.get(base_text, answer_text, source)
+        if stored is not None:
+            session_stats.increment("scores_reused")
+            return stored
+    score = score_one_side(base_text,
+                           answer_text,
+                           retry_on_error=retry_on_error,
+                           reference=reference)
+    score_store.put(base_text, answer_text, score, source)
+    return score
+
+
+def _reference_questions(expected: str) -> str:
+    """
+    Return questions generated from a reference text.
+
+    Uses the active question bank if it holds the text; otherwise the
+    questions are generated (and recorded while the bank is being built).
+
+    :param expected: The reference text.
+    :type expected: str
+    :return: A JSON string containing the questions.
+    :rtype: str
+    """
+    bank = active_question_bank()
+    if bank is not None and not bank.build:
+        questions_text = bank.draw(expected)
+        if questions_text is not None:
+            session_stats.increment("bank_question_sets")
+            return questions_text
+    questions_text = make_questions(expected)
+    if bank is not None and bank.build:
+        bank.record(expected, questions_text)
+    return questions_text
+
+
+def _new_answer_cache() -> Optional[AnswerCache]:
+    """Return an answer cache for one evaluation if ``llm_answer_cache`` is on."""
+    return AnswerCache() if get_config()._llm_answer_cache else None
+
+
+def _answer_questions(answer_text: str, questions_text: str,
+                      cache: Optional[AnswerCache],
+                      run: int) -> list[dict[str, Any]]:
+    """
+    Answer questions, reusing answers from ``cache`` where possible.
+
+    Only questions without a cached answer are sent to the LLM; their answers
+    are stored in the cache and merged with the cached ones.
+
+    :param answer_text: The text to use for answering the questions.
+    :type answer_text: str
+    :param questions_text: A JSON string representing the list of questions.
+    :type questions_text: str
+    :param cache: The answer cache, or ``None`` to answer all questions.
+    :type cache: Optional[AnswerCache]
+    :param run: Index of the answer run.
+    :type run: int
+    :return: The answer items of all questions.
+    :rtype: list[dict[str, Any]]
+    """
+    if cache is None:
+        return evaluate_questions(answer_text, questions_text)
+    answers = []
+    missing = []
+    for question in parse_questions(questions_text):
+        cached = cache.get(answer_text, question, run)
+        if cached is None:
+            missing.append(question)
+        else:
+            answers.append({"question": question, "answer": cached.get("answer")})
+    session_stats.increment("answers_reused", len(answers))
+    if missing:
+        new_answers = evaluate_questions(answer_text, dump_questions(missing))
+        cache.put(answer_text, missing, new_answers, run)
+        answers.extend(new_answers)
+    return answers
 
 
 def score_one_side(base_text: str,
                    answer_text: str,
-                   retry_on_error: bool = True) -> float:
+                   retry_on_error: bool = True,
+                   reference: bool = False) -> float:
     """
     Calculate a one-sided score by generating questions from one text and answering with another.
 
@@ -327,33 +608,28 @@ def score_one_side(base_text: str,
     :type answer_text: str
     :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
     :type retry_on_error: bool
+    :param reference: Whether ``base_text`` is the reference text, whose
+                      questions may come from a question bank. Defaults to
+                      ``False``.
+    :type reference: bool
     :return: The average score from the evaluation.
     :rtype: float
     :raises Exception: If the operation fails after the maximum number of retries.
     """
-    # This function includes a retry loop to handle transient errors during LLM communication,
-    # making the scoring process more robust.
-    retries = 0
-    while True:
-        try:
-            qustions_text = make_questions(base_text)
-            answers_list = evaluate_questions(answer_text, qustions_text)
-            score_value_counts = [j.get("answer") for j in answers_list]
-            return sum(score_value_counts) / len(score_value_counts)
-        except Exception as e:
-            if not retry_on_error:
-                raise
-            print(f"Error on scoring; retrying: {e}")
-            retries += 1
-            if retries > MAXIMAL_RETRY_ON_ERROR:
-                raise Exception(
-                    f"Operation failed after {retries} retries. Last error: {e}"
-                ) from e
-            continue
+    # Retrying handles transient errors during LLM communication, making the
+    # scoring process more robust.
+
+    def attempt() -> float:
+        qustions_text = (_reference_questions(base_text)
+                         if reference else make_questions(base_text))
+        answers_list = evaluate_questions(answer_text, qustions_text)
+        return mean_answer(answers_list)
+
+    return RetryBudget(retry_on_error).run(attempt, "scoring")
 
 
 def scores_agg(
-    scores: list[float],
+    scores: list[float] | StreamingAggregator,
     agg_type: AggType |
     Literal["minimum", "maximum", "median", "average", "mean"],
 ) -> float:
@@ -364,8 +640,8 @@ def scores_agg(
     function (min, max, median, or mean/average) to produce a single
     summary score.
 
-    :param scores: A list of scores to aggregate.
-    :type scores: list[float]
+    :param scores: A list of scores to aggregate, or a streaming summary of them.
+    :type scores: list[float] | StreamingAggregator
     :param agg_type: The aggregation method to use.
     :type agg_type: AggType | Literal["minimum", "maximum", "median", "average", "mean"]
     :return: The aggregated score.
@@ -376,6 +652,9 @@ def scores_agg(
     if isinstance(agg_type, str):
         agg_type = AggType(agg_type)
 
+    if isinstance(scores, StreamingAggregator):
+        return scores.aggregate(agg_type)
+
     # Apply aggregation
     match agg_type:
         case AggType.MINIMUM:
@@ -520,6 +799,70 @@ def texts_agg_recall(
     return scores_agg(scores, agg_type)
 
 
+def texts_agg_auto(
+    expected: str,
+    given: str,
+    score_type: ScoreType | Literal["f1", "precision", "recall"],
+    agg_type: AggType |
+    Literal["minimum", "maximum", "median", "average", "mean"],
+    half_width: float,
+    retry_on_error: bool = True,
+) -> float:
+    """
+    Calculate an aggregated score with automatically chosen run counts.
+
+    The number of question runs and answer runs is planned from the variance
+    stored for the text pair in the pytest cache, so that the aggregated
+    score is within ``half_width`` of its expectation with the confidence of
+    ``llm_auto_confidence``, using at most ``llm_auto_max_runs`` runs. Without
+    history, ``DEFAULT_AUTO_RUNS`` are used. The variance of the new runs is
+    merged into the history.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The text to evaluate.
+    :type given: str
+    :param score_type: The score to evaluate.
+    :type score_type: ScoreType | Literal["f1", "precision", "recall"]
+    :param agg_type: The aggregation method to use on the collected scores.
+    :type agg_type: AggType | Literal["minimum", "maximum", "median", "average", "mean"]
+    :param half_width: Allowed deviation of the aggregated score.
+    :type half_width: float
+    :param retry_on_error: Whether to retry LLM calls on failure. Defaults to ``True``.
+    :type retry_on_error: bool
+    :return: The aggregated score.
+    :rtype: float
+    """
+    config = get_config()
+    score_type = ScoreType(score_type)
+    agg_type = AggType(agg_type)
+    key = history_key(expected, given, score_type.value)
+    history = load_history(config, key)
+    if history is None:
+        generate_questions, generate_answers = DEFAULT_AUTO_RUNS
+    else:
+        generate_questions, generate_answers = plan_runs(
+            history["between"],
+            history["within"],
+            half_width,
+            config._llm_auto_confidence,
+            config._llm_auto_max_runs,
+            median=agg_type == AggType.MEDIAN)
+    match score_type:
+        case ScoreType.F1:
+            multiple = texts_multiple_f1
+        case ScoreType.PRECISION:
+            multiple = texts_multiple_precision
+        case ScoreType.RECALL:
+            multiple = texts_multiple_recall
+    runs = multiple(expected, given, generate_questions, generate_answers,
+                    False, retry_on_error)
+    between, within = variance_components(runs, score_type.value)
+    update_history(config, key, between, within, len(runs))
+    session_stats.increment("auto_runs", len(runs))
+    return scores_agg(list(runs.column(score_type.value)), agg_type)
+
+
 def f1_score(precision: float, recall: float) -> float:
     """
     Calculate the F1 score from precision and recall.
@@ -0,0 +1,147 @@
+"""
+Hedged LLM requests.
+
+Occasional slow responses dominate the wall-clock time of aggregated tests.
+With hedging enabled, a request still running after the configured latency
+percentile of recent calls gets a duplicate request (sent to a different
+member when the backend is a :class:`~pytest_texts_score.pool.BackendPool`).
+The first successful reply wins and the other request is cancelled; a request
+that is already on the wire cannot be aborted, so its reply is discarded.
+"""
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+import math
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from pytest_texts_score.backends import LLMBackend
+from pytest_texts_score.pool import BackendPool, PoolMember
+from pytest_texts_score.stats import session_stats
+
+# Requests run on a shared executor so that the caller can wait with a timeout.
+_executor = ThreadPoolExecutor(max_workers=32,
+                               thread_name_prefix="texts-score-hedge")
+
+
+class LatencyTracker:
+    """
+    Recent latencies of successful LLM calls.
+
+    :param size: Number of most recent latencies kept.
+    :type size: int
+    """
+
+    def __init__(self, size: int = 200) -> None:
+        self._latencies: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a successful call in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def percentile(self, percentile: float,
+                   min_samples: int) -> Optional[float]:
+        """
+        Return the ``percentile``-th percentile of the recorded latencies.
+
+        :param percentile: The percentile, between 0 and 100.
+        :type percentile: float
+        :param min_samples: Minimum number of samples needed for an estimate.
+        :type min_samples: int
+        :return: The latency in seconds, or ``None`` with too few samples.
+        :rtype: Optional[float]
+        """
+        with self._lock:
+            if len(self._latencies) < max(1, min_samples):
+                return None
+            ordered = sorted(self._latencies)
+        index = math.ceil(percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+
+def _submit(backend: LLMBackend, request: dict[str, Any],
+            exclude: list[PoolMember]) -> tuple[Future, list[PoolMember]]:
+    """
+    Start ``request`` on the executor.
+
+    A pool member is reserved only once the request runs, so that a request
+    cancelled while still queued holds none.
+
+    :return: The future and the list the reserved pool member is added to.
+    :rtype: tuple[Future, list[PoolMember]]
+    """
+    if not isinstance(backend, BackendPool):
+        return _executor.submit(backend.complete, **request), []
+    reserved: list[PoolMember] = []
+
+    def run() -> str:
+        member = backend.acquire(exclude=exclude)
+        reserved.append(member)
+        return backend.complete_on(member, **request)
+
+    return _executor.submit(run), reserved
+
+
+def hedged_complete(backend: LLMBackend,
+                    request: dict[str, Any],
+                    tracker: LatencyTracker,
+                    percentile: float = 95,
+                    min_samples: int = 20,
+                    clock: Callable[[], float] = time.monotonic) -> str:
+    """
+    Send a chat request, hedging it when it is slower than usual.
+
+    The request is sent to ``backend``. If no reply arrived within the
+    ``percentile``-th percentile of the latencies recorded by ``tracker``, a
+    duplicate request is sent and the first successful reply is returned.
+    Until ``tracker`` holds ``min_samples`` latencies no hedging happens.
+
+    :param backend: The backend to send the request to.
+    :type backend: LLMBackend
+    :param request: Keyword arguments of :meth:`LLMBackend.complete`.
+    :type request: dict[str, Any]
+    :param tracker: Latencies of previous calls of the same kind.
+    :type tracker: LatencyTracker
+    :param percentile: Latency percentile after which the request is hedged.
+    :type percentile: float
+    :param min_samples: Number of latencies needed before hedging starts.
+    :type min_samples: int
+    :param clock: Monotonic clock, replaceable in tests.
+    :type clock: Callable[[], float]
+    :return: The reply content.
+    :rtype: str
+    :raises Exception: The error of the last request if none succeeded.
+    """
+    started = clock()
+    primary, reserved = _submit(backend, request, [])
+    threshold = tracker.percentile(percentile, min_samples)
+    done, _ = wait([primary], timeout=threshold)
+    if done:
+        result = primary.result()
+        tracker.record(clock() - started)
+        return result
+
+    hedge, _ = _submit(backend, request, reserved)
+    session_stats.increment("hedged_requests")
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is not None:
+                error = future.exception()
+                continue
+            for other in pending:
+                other.cancel()
+            if future is hedge:
+                session_stats.increment("hedge_wins")
+            tracker.record(clock() - started)
+            return future.result()
+    raise error
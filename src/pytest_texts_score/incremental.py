@@ -0,0 +1,167 @@
+"""
+Incremental evaluation: skip unchanged assertions that passed before.
+
+Between CI runs most compared texts do not change. With ``llm_incremental``
+enabled, every assertion decorated with :func:`incremental` stores a
+fingerprint of its call — the function, the texts, the bounds and run
+counts, the prompt templates, the endpoints and models, the question and
+answer settings and the question bank in use — together with its verdict in
+the pytest cache (``config.cache``). An assertion whose fingerprint matches a passing
+verdict younger than ``llm_incremental_max_age_days`` returns without
+calling the LLM. Failed, changed or expired assertions are scored as usual.
+"""
+from contextvars import ContextVar
+import functools
+import hashlib
+import inspect
+import json
+import time
+from typing import Any, Callable, TypeVar
+
+import pytest
+
+from pytest_texts_score.plugin import get_config
+from pytest_texts_score.prompts import get_prompts_version
+from pytest_texts_score.question_bank import active_question_bank
+from pytest_texts_score.stats import session_stats
+
+_CACHE_PREFIX = "texts_score/verdicts"
+
+#: Arguments that do not change the verdict of an assertion; a ``fresh``
+#: call re-scores and replaces the verdict of the same assertion.
+_IGNORED_ARGUMENTS = frozenset({"retry_on_error", "skip_warnings", "fresh"})
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Whether an incremental assertion is running, so that assertions it calls
+# (e.g. `texts_expect_f1_equal` calling `texts_expect_f1_range`) store no
+# verdicts of their own.
+_in_assertion: ContextVar[bool] = ContextVar("texts_score_in_assertion",
+                                             default=False)
+
+
+def scoring_settings(config: pytest.Config) -> dict[str, Any]:
+    """
+    Return the settings besides the texts and prompts that affect scores.
+
+    :param config: The pytest config object.
+    :type config: pytest.Config
+    :return: JSON-serializable settings.
+    :rtype: dict[str, Any]
+    """
+    bank = active_question_bank()
+    return {
+        "models": [
+            config._llm_backend,
+            config._llm_endpoint,
+            config._llm_base_url,
+            config._llm_questions_deployment,
+            config._llm_questions_model,
+            config._llm_answers_deployment,
+            config._llm_answers_model,
+        ],
+        "questions": [
+            config._llm_questions_max,
+            config._llm_questions_per_100_tokens,
+            config._llm_questions_dedupe_threshold,
+            config._llm_questions_chunk_tokens,
+            config._llm_questions_chunk_overlap,
+            config._llm_questions_by_paragraph,
+        ],
+        "answers": [
+            config._llm_answers_shards,
+            config._llm_answers_retrieval_top_k,
+            config._llm_answers_retrieval_shard_size,
+        ],
+        "question_bank": None if bank is None else bank.content_hash(),
+    }
+
+
+def settings_hash(config: pytest.Config) -> str:
+    """
+    Return a short hash of :func:`scoring_settings`.
+
+    :param config: The pytest config object.
+    :type config: pytest.Config
+    :return: The first 16 hex digits of the SHA-256 of the settings.
+    :rtype: str
+    """
+    encoded = json.dumps(scoring_settings(config), sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def assertion_fingerprint(name: str, arguments: dict[str, Any],
+                          config: pytest.Config) -> str:
+    """
+    Return the fingerprint of an assertion call.
+
+    :param name: The name of the assertion function.
+    :type name: str
+    :param arguments: The bound arguments of the call, defaults included.
+    :type arguments: dict[str, Any]
+    :param config: The pytest config object.
+    :type config: pytest.Config
+    :return: A hex SHA-256 digest.
+    :rtype: str
+    """
+    payload = {
+        "assertion": name,
+        "arguments": {
+            key: value
+            for key, value in arguments.items()
+            if key not in _IGNORED_ARGUMENTS
+        },
+        "prompts": get_prompts_version(),
+        **scoring_settings(config),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def incremental(function: _F) -> _F:
+    """
+    Skip a passing assertion whose fingerprint has not changed.
+
+    Inactive unless ``llm_incremental`` is enabled, while a question bank is
+    being built and for assertions called by another assertion; calls with
+    ``fresh=True`` are always evaluated.
+
+    :param function: The assertion function.
+    :type function: Callable
+    :return: The wrapped function.
+    :rtype: Callable
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        config = get_config()
+        cache = getattr(config, "cache", None)
+        if (not config._llm_incremental or cache is None
+                or config._llm_build_question_bank or _in_assertion.get()):
+            return function(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        fingerprint = assertion_fingerprint(function.__name__,
+                                            bound.arguments, config)
+        key = f"{_CACHE_PREFIX}/{fingerprint}"
+        verdict = cache.get(key, None)
+        max_age = config._llm_incremental_max_age_days * 86400
+        if (isinstance(verdict, dict) and verdict.get("passed")
+                and not bound.arguments.get("fresh")
+                and (not max_age
+                     or time.time() - verdict.get("time", 0) < max_age)):
+            session_stats.increment("assertions_skipped")
+            return None
+        token = _in_assertion.set(True)
+        try:
+            result = function(*args, **kwargs)
+        except pytest.fail.Exception:
+            cache.set(key, {"passed": False, "time": time.time()})
+            raise
+        finally:
+            _in_assertion.reset(token)
+        cache.set(key, {"passed": True, "time": time.time()})
+        return result
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,187 @@
+"""
+Variance-driven choice of the number of runs of aggregated evaluations.
+
+The score of an aggregated evaluation varies for two reasons: every question
+run generates a different question set, and every answer run answers it
+differently. The runs of an evaluation are a nested sample, so both variance
+components can be estimated from them (one-way analysis of variance). They
+are kept per text pair in the pytest cache (``config.cache``) and used the
+next time to choose the smallest number of runs that estimates the score to
+within the tolerance of the assertion at the configured confidence:
+
+* the answer runs per question set follow the cost-optimal nested design,
+  ``sqrt(within / between)`` — answer runs only pay off when answering is the
+  larger source of variance;
+* the question runs follow from the variance of the mean,
+  ``(between + within / answer_runs) / question_runs``.
+"""
+import hashlib
+import math
+from statistics import NormalDist, mean, variance
+from typing import Any, Optional
+
+import pytest
+
+from pytest_texts_score.records import RunScores
+
+#: Run counts used while no variance of the text pair is known. Two answer
+#: runs per question set let both variance components be estimated.
+DEFAULT_AUTO_RUNS = (3, 2)
+
+#: Cache key prefix of the variance history.
+_CACHE_PREFIX = "texts_score/variance"
+
+#: Number of past runs the history is weighted as at most, so that it follows
+#: changes of the texts, prompts or model.
+_HISTORY_RUNS_CAP = 100
+
+
+def history_key(expected: str, given: str, score_type: str) -> str:
+    """
+    Return the cache key of the variance history of a text pair.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The evaluated text.
+    :type given: str
+    :param score_type: The evaluated score (``"f1"``, ``"precision"`` or
+                       ``"recall"``).
+    :type score_type: str
+    :return: The ``config.cache`` key.
+    :rtype: str
+    """
+    digest = hashlib.sha256(
+        "\0".join((score_type, expected, given)).encode("utf-8")).hexdigest()
+    return f"{_CACHE_PREFIX}/{digest[:32]}"
+
+
+def variance_components(
+        runs: RunScores,
+        name: str) -> tuple[Optional[float], Optional[float]]:
+    """
+    Estimate the question-run and answer-run variance of a score.
+
+    :param runs: The runs of a ``texts_multiple_*`` evaluation.
+    :type runs: RunScores
+    :param name: The score column.
+    :type name: str
+    :return: The variance between question sets and the variance between
+             answer runs of one question set; ``None`` for a component the
+             runs cannot estimate (fewer than two question runs, or one
+             answer run per question set).
+    :rtype: tuple[Optional[float], Optional[float]]
+    """
+    groups: dict[int, list[float]] = {}
+    for question_run, score in zip(runs.question_runs, runs.column(name)):
+        groups.setdefault(question_run, []).append(score)
+    repeated = [scores for scores in groups.values() if len(scores) > 1]
+    within = mean(variance(scores) for scores in repeated) if repeated else None
+    if len(groups) < 2:
+        return None, within
+    answer_runs = len(runs) / len(groups)
+    between = (variance([mean(scores) for scores in groups.values()]) -
+               (within or 0.0) / answer_runs)
+    return max(0.0, between), within
+
+
+def plan_runs(between: float,
+              within: float,
+              half_width: float,
+              confidence: float = 0.95,
+              max_runs: int = 20,
+              median: bool = False) -> tuple[int, int]:
+    """
+    Return the run counts estimating the score within ``half_width``.
+
+    :param between: Variance of the score between question sets.
+    :type between: float
+    :param within: Variance of the score between answer runs of a set.
+    :type within: float
+    :param half_width: Allowed deviation of the estimate, e.g. the
+                       ``max_delta`` of the assertion.
+    :type half_width: float
+    :param confidence: Confidence of staying within ``half_width``.
+    :type confidence: float
+    :param max_runs: Maximum total number of runs.
+    :type max_runs: int
+    :param median: Whether the median is estimated instead of the mean; its
+                   variance is larger by a factor of about pi / 2.
+    :type median: bool
+    :return: The number of question runs and of answer runs per question set.
+    :rtype: tuple[int, int]
+    """
+    max_runs = max(2, max_runs)
+    if within <= 0:
+        answer_runs = 1
+    elif between <= 0:
+        answer_runs = max_runs // 2
+    else:
+        answer_runs = round(math.sqrt(within / between))
+    answer_runs = min(max(1, answer_runs), max_runs // 2)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    spread = between + within / answer_runs
+    if median:
+        spread *= math.pi / 2
+    question_runs = math.ceil(z * z * spread / max(half_width, 1e-6)**2)
+    question_runs = min(max(2, question_runs), max_runs // answer_runs)
+    return question_runs, answer_runs
+
+
+def load_history(config: pytest.Config, key: str) -> Optional[dict[str, Any]]:
+    """
+    Return the variance history stored under ``key``.
+
+    :param config: The pytest config object.
+    :type config: pytest.Config
+    :param key: The key from :func:`history_key`.
+    :type key: str
+    :return: ``between``, ``within`` and ``runs`` entries, or ``None`` if
+             there is no (complete) history or the cache is disabled.
+    :rtype: Optional[dict[str, Any]]
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return None
+    history = cache.get(key, None)
+    if (not isinstance(history, dict) or history.get("between") is None
+            or history.get("within") is None):
+        return None
+    return history
+
+
+def update_history(config: pytest.Config, key: str,
+                   between: Optional[float], within: Optional[float],
+                   runs: int) -> None:
+    """
+    Merge the variance components of new runs into the stored history.
+
+    Each component is averaged with the stored one, weighted by the number
+    of runs; a component the new runs could not estimate keeps its stored
+    value.
+
+    :param config: The pytest config object.
+    :type config: pytest.Config
+    :param key: The key from :func:`history_key`.
+    :type key: str
+    :param between: The new variance between question sets, if estimated.
+    :type between: Optional[float]
+    :param within: The new variance between answer runs, if estimated.
+    :type within: Optional[float]
+    :param runs: The number of new runs.
+    :type runs: int
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return
+    history = cache.get(key, None)
+    if not isinstance(history, dict):
+        history = {"between": None, "within": None, "runs": 0}
+    old_runs = min(int(history.get("runs", 0)), _HISTORY_RUNS_CAP)
+    for name, value in (("between", between), ("within", within)):
+        if value is None:
+            continue
+        old = history.get(name)
+        history[name] = (value if old is None else
+                         (old * old_runs + value * runs) / (old_runs + runs))
+    history["runs"] = old_runs + runs
+    cache.set(key, history)
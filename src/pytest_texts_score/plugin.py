@@ -1,6 +1,13 @@
-from openai import AzureOpenAI
+import argparse
+
 import pytest
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from openai import AzureOpenAI, OpenAI
+
+    from pytest_texts_score.backends import LLMBackend
+    from pytest_texts_score.snapshots import TextsSnapshot
 
 # A global variable to hold the pytest config object.
 _global_config: Optional[pytest.Config] = None
@@ -57,6 +64,293 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=None,
         help="Azure model indetifier (overrides ini)",
     )
+    for stage in ("questions", "answers"):
+        group.addoption(
+            f"--llm-{stage}-deployment",
+            action="store",
+            default=None,
+            help=f"Azure deployment used for {stage} (overrides ini, "
+            "default: --llm-deployment)",
+        )
+        group.addoption(
+            f"--llm-{stage}-model",
+            action="store",
+            default=None,
+            help=f"Model used for {stage} (overrides ini, default: "
+            "--llm-model)",
+        )
+        group.addoption(
+            f"--llm-{stage}-max-tokens",
+            action="store",
+            default=None,
+            type=int,
+            help=f"Maximum tokens of {stage} responses (overrides ini, "
+            "default: --llm-max-tokens)",
+        )
+    group.addoption(
+        "--llm-backend",
+        action="store",
+        default=None,
+        choices=("azure", "openai", "callable"),
+        help="LLM backend: azure, openai or callable (overrides ini, "
+        "default: azure)",
+    )
+    group.addoption(
+        "--llm-base-url",
+        action="store",
+        default=None,
+        help="Base URL of an OpenAI-compatible server (overrides ini)",
+    )
+    group.addoption(
+        "--llm-backend-callable",
+        action="store",
+        default=None,
+        help="Import path 'module:function' of the completion callable "
+        "(overrides ini)",
+    )
+    group.addoption(
+        "--llm-max-concurrency",
+        action="store",
+        default=None,
+        type=int,
+        help="Maximum concurrent LLM requests (overrides ini, default: "
+        "backend specific)",
+    )
+    group.addoption(
+        "--llm-pool",
+        action="append",
+        default=None,
+        help="Pool member as key=value pairs, repeatable (overrides ini)",
+    )
+    for toggle, description in (
+        ("score-store", "Reuse one-sided scores within the session"),
+        ("answer-cache", "Reuse answers to repeated questions"),
+        ("incremental", "Skip unchanged assertions that passed before"),
+    ):
+        group.addoption(
+            f"--llm-{toggle}",
+            action=argparse.BooleanOptionalAction,
+            default=None,
+            help=f"{description} (overrides ini, default: off)",
+        )
+    group.addoption(
+        "--llm-pool-eject-after",
+        action="store",
+        default=None,
+        type=int,
+        help="Consecutive errors after which a pool member is ejected "
+        "(overrides ini, default: 3)",
+    )
+    group.addoption(
+        "--llm-pool-eject-seconds",
+        action="store",
+        default=None,
+        type=float,
+        help="Seconds an ejected pool member stays out of routing (overrides "
+        "ini, default: 30)",
+    )
+    group.addoption(
+        "--llm-breaker-error-rate",
+        action="store",
+        default=None,
+        type=float,
+        help="Error rate of recent LLM calls that opens the circuit breaker "
+        "(overrides ini, default: 0.5; 0 disables it)",
+    )
+    group.addoption(
+        "--llm-breaker-window",
+        action="store",
+        default=None,
+        type=int,
+        help="Number of recent LLM calls the error rate is computed over "
+        "(overrides ini, default: 20)",
+    )
+    group.addoption(
+        "--llm-breaker-min-calls",
+        action="store",
+        default=None,
+        type=int,
+        help="Minimum number of LLM calls before the breaker may open "
+        "(overrides ini, default: 10)",
+    )
+    group.addoption(
+        "--llm-breaker-cooldown",
+        action="store",
+        default=None,
+        type=float,
+        help="Seconds the breaker stays open before probing recovery "
+        "(overrides ini, default: 60)",
+    )
+    group.addoption(
+        "--llm-breaker-action",
+        action="store",
+        default=None,
+        choices=("fail", "skip"),
+        help="What happens to LLM tests while the breaker is open (overrides "
+        "ini, default: fail)",
+    )
+    group.addoption(
+        "--llm-hedge",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Send a duplicate request when an LLM call is slow (overrides "
+        "ini, default: off)",
+    )
+    group.addoption(
+        "--llm-hedge-percentile",
+        action="store",
+        default=None,
+        type=float,
+        help="Latency percentile of recent calls after which a request is "
+        "hedged (overrides ini, default: 95)",
+    )
+    group.addoption(
+        "--llm-hedge-min-samples",
+        action="store",
+        default=None,
+        type=int,
+        help="Number of recorded latencies needed before hedging starts "
+        "(overrides ini, default: 20)",
+    )
+    group.addoption(
+        "--llm-questions-chunk-tokens",
+        action="store",
+        default=None,
+        type=int,
+        help="Split texts longer than this many tokens into chunks for "
+        "question generation (overrides ini, default: 0, no chunking)",
+    )
+    group.addoption(
+        "--llm-questions-chunk-overlap",
+        action="store",
+        default=None,
+        type=int,
+        help="Number of tokens repeated between neighbouring chunks "
+        "(overrides ini, default: 200)",
+    )
+    group.addoption(
+        "--llm-answers-retrieval-top-k",
+        action="store",
+        default=None,
+        type=int,
+        help="Answer questions against only the top-k most relevant "
+        "paragraphs (overrides ini, default: 0, the whole text)",
+    )
+    group.addoption(
+        "--llm-answers-retrieval-shard-size",
+        action="store",
+        default=None,
+        type=int,
+        help="Number of questions sharing one retrieved excerpt (overrides "
+        "ini, default: 10)",
+    )
+    group.addoption(
+        "--llm-answers-shards",
+        action="store",
+        default=None,
+        type=int,
+        help="Split question sets into this many shards answered "
+        "concurrently (overrides ini, default: 1, no sharding)",
+    )
+    group.addoption(
+        "--llm-adaptive-max-tokens",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Size max_tokens of each request from its expected output "
+        "(overrides ini, default: off)",
+    )
+    group.addoption(
+        "--llm-context-window",
+        action="store",
+        default=None,
+        type=int,
+        help="Context window of the model in tokens (overrides ini, default: "
+        "128000)",
+    )
+    group.addoption(
+        "--llm-questions-max",
+        action="store",
+        default=None,
+        type=int,
+        help="Maximum number of questions generated per text (overrides ini, "
+        "default: 0, no limit)",
+    )
+    group.addoption(
+        "--llm-questions-per-100-tokens",
+        action="store",
+        default=None,
+        type=float,
+        help="Maximum number of questions generated per 100 tokens of text "
+        "(overrides ini, default: 0, no limit)",
+    )
+    group.addoption(
+        "--llm-questions-dedupe-threshold",
+        action="store",
+        default=None,
+        type=float,
+        help="Drop generated questions at least this similar (0-1) to an "
+        "earlier question (overrides ini, default: 0, no de-duplication)",
+    )
+    group.addoption(
+        "--llm-coalesce-requests",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Share one request between identical LLM requests in flight "
+        "(overrides ini, default: on)",
+    )
+    group.addoption(
+        "--llm-auto-confidence",
+        action="store",
+        default=None,
+        type=float,
+        help="Confidence with which full_runs='auto' estimates the score "
+        "(overrides ini, default: 0.95)",
+    )
+    group.addoption(
+        "--llm-auto-max-runs",
+        action="store",
+        default=None,
+        type=int,
+        help="Maximum total number of runs chosen by full_runs='auto' "
+        "(overrides ini, default: 20)",
+    )
+    group.addoption(
+        "--llm-incremental-max-age-days",
+        action="store",
+        default=None,
+        type=float,
+        help="Re-score skipped assertions whose verdict is older than this "
+        "many days (overrides ini, default: 7; 0 never forces re-scoring)",
+    )
+    group.addoption(
+        "--llm-snapshot-tolerance",
+        action="store",
+        default=None,
+        type=float,
+        help="Allowed deviation of re-scored snapshot entries from their "
+        "baseline (overrides ini, default: 0.1)",
+    )
+    group.addoption(
+        "--llm-questions-by-paragraph",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Generate questions per paragraph and cache them (overrides "
+        "ini, default: off)",
+    )
+    group.addoption(
+        "--texts-score-build-question-bank",
+        action="store_true",
+        default=False,
+        help="Generate the questions of reference texts used with a question "
+        "bank and write them to the bank files",
+    )
+    group.addoption(
+        "--texts-score-update-snapshots",
+        action="store_true",
+        default=False,
+        help="Score texts checked with texts_score_snapshot and write the "
+        "scores to the snapshot files",
+    )
 
     # Add ini options
     parser.addini("llm_api_key",
@@ -72,6 +366,180 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addini("llm_max_tokens",
                   "Maximum tokens for LLM responses",
                   default="8192")
+    parser.addini("llm_backend",
+                  "LLM backend: azure, openai or callable",
+                  default="azure")
+    parser.addini("llm_base_url",
+                  "Base URL of an OpenAI-compatible server (openai backend)",
+                  default=None)
+    parser.addini(
+        "llm_backend_callable",
+        "Import path 'module:function' of the completion callable "
+        "(callable backend)",
+        default=None)
+    parser.addini("llm_max_concurrency",
+                  "Maximum concurrent LLM requests",
+                  default=None)
+    parser.addini(
+        "llm_pool",
+        "Pool members, one per line as key=value pairs "
+        "(endpoint, deployment, base_url, api_key, rpm)",
+        type="linelist",
+        default=[])
+    parser.addini("llm_pool_eject_after",
+                  "Consecutive errors after which a pool member is ejected",
+                  default="3")
+    parser.addini("llm_pool_eject_seconds",
+                  "Seconds an ejected pool member stays out of routing",
+                  default="30")
+    parser.addini(
+        "llm_breaker_error_rate",
+        "Error rate of recent LLM calls that opens the circuit breaker "
+        "(0 disables it)",
+        default="0.5")
+    parser.addini("llm_breaker_window",
+                  "Number of recent LLM calls the error rate is computed over",
+                  default="20")
+    parser.addini("llm_breaker_min_calls",
+                  "Minimum number of LLM calls before the breaker may open",
+                  default="10")
+    parser.addini("llm_breaker_cooldown",
+                  "Seconds the breaker stays open before probing recovery",
+                  default="60")
+    parser.addini("llm_breaker_action",
+                  "What happens to LLM tests while the breaker is open: "
+                  "fail or skip",
+                  default="fail")
+    parser.addini("llm_hedge",
+                  "Send a duplicate request when an LLM call is slow",
+                  type="bool",
+                  default=False)
+    parser.addini("llm_hedge_percentile",
+                  "Latency percentile of recent calls after which a request "
+                  "is hedged",
+                  default="95")
+    parser.addini("llm_hedge_min_samples",
+                  "Number of recorded latencies needed before hedging starts",
+                  default="20")
+    parser.addini(
+        "llm_questions_chunk_tokens",
+        "Split texts longer than this many tokens into chunks for question "
+        "generation (0 disables chunking)",
+        default="0")
+    parser.addini("llm_questions_chunk_overlap",
+                  "Number of tokens repeated between neighbouring chunks",
+                  default="200")
+    parser.addini(
+        "llm_questions_dedupe_threshold",
+        "Drop generated questions at least this similar (0-1) to an earlier "
+        "question (0 disables de-duplication)",
+        default="0")
+    parser.addini(
+        "llm_questions_by_paragraph",
+        "Generate questions per paragraph and keep them in the pytest cache, "
+        "so that only edited paragraphs need new questions",
+        type="bool",
+        default=False)
+    parser.addini("llm_questions_max",
+                  "Maximum number of questions generated per text (0 for "
+                  "no limit)",
+                  default="0")
+    parser.addini(
+        "llm_questions_per_100_tokens",
+        "Maximum number of questions generated per 100 tokens of text (0 for "
+        "no length-proportional limit)",
+        default="0")
+    parser.addini(
+        "llm_answers_shards",
+        "Split question sets into this many shards answered concurrently "
+        "(1 disables sharding)",
+        default="1")
+    parser.addini(
+        "llm_answers_retrieval_top_k",
+        "Answer questions against only the top-k most relevant paragraphs "
+        "of the answer text (0 sends the whole text)",
+        default="0")
+    parser.addini("llm_answers_retrieval_shard_size",
+                  "Number of questions sharing one retrieved excerpt",
+                  default="10")
+    parser.addini(
+        "llm_coalesce_requests",
+        "Share one request between identical LLM requests in flight at the "
+        "same time",
+        type="bool",
+        default=True)
+    parser.addini(
+        "llm_score_store",
+        "Compute each directed one-sided score once per session and reuse it "
+        "for precision, recall and F1 of single-run evaluations",
+        type="bool",
+        default=False)
+    parser.addini(
+        "llm_answer_cache",
+        "Reuse answers to questions repeated across the question runs of "
+        "texts_multiple_* and texts_agg_* evaluations",
+        type="bool",
+        default=False)
+    parser.addini(
+        "llm_incremental",
+        "Skip assertions that passed before if their texts, bounds, prompts "
+        "and models are unchanged",
+        type="bool",
+        default=False)
+    parser.addini(
+        "llm_incremental_max_age_days",
+        "Re-score skipped assertions whose verdict is older than this many "
+        "days (0 never forces re-scoring)",
+        default="7")
+    parser.addini(
+        "llm_snapshot_tolerance",
+        "Allowed deviation of re-scored snapshot entries from their baseline",
+        default="0.1")
+    parser.addini(
+        "llm_auto_confidence",
+        "Confidence with which full_runs='auto' estimates the aggregated "
+        "score within the tolerance of the assertion",
+        default="0.95")
+    parser.addini("llm_auto_max_runs",
+                  "Maximum total number of runs chosen by full_runs='auto'",
+                  default="20")
+    parser.addini(
+        "llm_adaptive_max_tokens",
+        "Size max_tokens of each request from its expected output instead "
+        "of reserving llm_max_tokens",
+        type="bool",
+        default=False)
+    parser.addini("llm_context_window",
+                  "Context window of the model in tokens",
+                  default="128000")
+    # Per-stage routing; each falls back to the general setting.
+    for stage in ("questions", "answers"):
+        parser.addini(f"llm_{stage}_deployment",
+                      f"Azure deployment used for {stage}",
+                      default=None)
+        parser.addini(f"llm_{stage}_model",
+                      f"Model used for {stage}",
+                      default=None)
+        parser.addini(f"llm_{stage}_max_tokens",
+                      f"Maximum tokens of {stage} responses",
+                      default=None)
+
+
+def _option(config: pytest.Config, name: str) -> Any:
+    """
+    Return the value of an option, from the CLI if given there.
+
+    :param config: The pytest config object.
+    :type config: pytest.Config
+    :param name: The ini name of the option; its CLI flag is the name with
+                 dashes, e.g. ``--llm-hedge`` for ``llm_hedge``.
+    :type name: str
+    :return: The CLI value, or the ini value (or default) if the flag was not
+             given.
+    :rtype: Any
+    """
+    value = config.getoption(f"--{name.replace('_', '-')}")
+    return config.getini(name) if value is None else value
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -89,7 +557,11 @@ def pytest_configure(config: pytest.Config) -> None:
     :return: None.
     :raises pytest.UsageError: If any required configuration values are missing.
     """
+    from .breaker import init_breaker
+    from .cache import paragraph_questions, score_store
+    from .question_bank import clear_question_banks
     from .client import init_client
+    from .stats import session_stats
 
     # Resolve final values
     config._llm_api_key = config.getoption("--llm-api-key") or config.getini(
@@ -107,16 +579,138 @@ def pytest_configure(config: pytest.Config) -> None:
     if config._llm_max_tokens is None:
         config._llm_max_tokens = int(config.getini("llm_max_tokens"))
 
-    # Validate required fields
-    missing = [
-        name for name, value in {
+    config._llm_backend = config.getoption("--llm-backend") or config.getini(
+        "llm_backend")
+    config._llm_base_url = config.getoption("--llm-base-url") or config.getini(
+        "llm_base_url")
+    config._llm_backend_callable = config.getoption(
+        "--llm-backend-callable") or config.getini("llm_backend_callable")
+    config._llm_max_concurrency = config.getoption("--llm-max-concurrency")
+    if config._llm_max_concurrency is None and config.getini(
+            "llm_max_concurrency"):
+        config._llm_max_concurrency = int(config.getini("llm_max_concurrency"))
+
+    config._llm_pool = config.getoption("--llm-pool") or config.getini(
+        "llm_pool")
+    config._llm_pool_eject_after = int(_option(config, "llm_pool_eject_after"))
+    config._llm_pool_eject_seconds = float(
+        _option(config, "llm_pool_eject_seconds"))
+
+    config._llm_breaker_error_rate = float(
+        _option(config, "llm_breaker_error_rate"))
+    config._llm_breaker_window = int(_option(config, "llm_breaker_window"))
+    config._llm_breaker_min_calls = int(
+        _option(config, "llm_breaker_min_calls"))
+    config._llm_breaker_cooldown = float(
+        _option(config, "llm_breaker_cooldown"))
+    config._llm_breaker_action = _option(config, "llm_breaker_action")
+    if config._llm_breaker_action not in ("fail", "skip"):
+        raise pytest.UsageError(
+            "[pytest-texts-score] `llm_breaker_action` must be 'fail' or "
+            f"'skip'; {config._llm_breaker_action!r} given.")
+
+    config._llm_hedge = _option(config, "llm_hedge")
+    config._llm_hedge_percentile = float(
+        _option(config, "llm_hedge_percentile"))
+    config._llm_hedge_min_samples = int(
+        _option(config, "llm_hedge_min_samples"))
+
+    config._llm_adaptive_max_tokens = _option(config, "llm_adaptive_max_tokens")
+    config._llm_context_window = int(_option(config, "llm_context_window"))
+    config._llm_questions_chunk_tokens = int(
+        _option(config, "llm_questions_chunk_tokens"))
+    config._llm_questions_chunk_overlap = int(
+        _option(config, "llm_questions_chunk_overlap"))
+    config._llm_questions_dedupe_threshold = float(
+        _option(config, "llm_questions_dedupe_threshold"))
+    config._llm_questions_by_paragraph = _option(config,
+                                                 "llm_questions_by_paragraph")
+    config._llm_questions_max = int(_option(config, "llm_questions_max"))
+    config._llm_questions_per_100_tokens = float(
+        _option(config, "llm_questions_per_100_tokens"))
+
+    config._llm_coalesce_requests = _option(config, "llm_coalesce_requests")
+    config._llm_score_store = _option(config, "llm_score_store")
+    config._llm_answer_cache = _option(config, "llm_answer_cache")
+    config._llm_incremental = _option(config, "llm_incremental")
+    config._llm_incremental_max_age_days = float(
+        _option(config, "llm_incremental_max_age_days"))
+    config._llm_build_question_bank = config.getoption(
+        "--texts-score-build-question-bank")
+    config._llm_update_snapshots = config.getoption(
+        "--texts-score-update-snapshots")
+    config._llm_snapshot_tolerance = float(
+        _option(config, "llm_snapshot_tolerance"))
+    config._llm_auto_confidence = float(_option(config, "llm_auto_confidence"))
+    if not 0 < config._llm_auto_confidence < 1:
+        raise pytest.UsageError(
+            "[pytest-texts-score] `llm_auto_confidence` must be in range 0 to "
+            f"1; {config._llm_auto_confidence} given.")
+    config._llm_auto_max_runs = int(_option(config, "llm_auto_max_runs"))
+    config._llm_answers_shards = int(_option(config, "llm_answers_shards"))
+    if config._llm_answers_shards < 1:
+        raise pytest.UsageError(
+            "[pytest-texts-score] `llm_answers_shards` must be at least 1; "
+            f"{config._llm_answers_shards} given.")
+    config._llm_answers_retrieval_top_k = int(
+        _option(config, "llm_answers_retrieval_top_k"))
+    config._llm_answers_retrieval_shard_size = int(
+        _option(config, "llm_answers_retrieval_shard_size"))
+    if config._llm_answers_retrieval_top_k < 0:
+        raise pytest.UsageError(
+            "[pytest-texts-score] `llm_answers_retrieval_top_k` must be at "
+            f"least 0; {config._llm_answers_retrieval_top_k} given.")
+    if config._llm_answers_retrieval_shard_size < 1:
+        raise pytest.UsageError(
+            "[pytest-texts-score] `llm_answers_retrieval_shard_size` must be "
+            f"at least 1; {config._llm_answers_retrieval_shard_size} given.")
+
+    # Resolve per-stage routing (stage CLI > stage ini > general value).
+    for stage in ("questions", "answers"):
+        setattr(
+            config, f"_llm_{stage}_deployment",
+            config.getoption(f"--llm-{stage}-deployment")
+            or config.getini(f"llm_{stage}_deployment")
+            or config._llm_deployment)
+        setattr(
+            config, f"_llm_{stage}_model",
+            config.getoption(f"--llm-{stage}-model")
+            or config.getini(f"llm_{stage}_model") or config._llm_model)
+        max_tokens = config.getoption(f"--llm-{stage}-max-tokens")
+        if max_tokens is None and config.getini(f"llm_{stage}_max_tokens"):
+            max_tokens = int(config.getini(f"llm_{stage}_max_tokens"))
+        setattr(config, f"_llm_{stage}_max_tokens", max_tokens or
+                config._llm_max_tokens)
+
+    # Validate required fields; which ones are required depends on the backend.
+    required = {
+        "azure": {
             "api_key": config._llm_api_key,
             "endpoint": config._llm_endpoint,
             "api_version": config._llm_api_version,
             "deployment": config._llm_deployment,
             "max_tokens": config._llm_max_tokens,
             "model": config._llm_model,
-        }.items() if not value
+        },
+        "openai": {
+            "base_url": config._llm_base_url,
+            "max_tokens": config._llm_max_tokens,
+            "model": config._llm_model,
+        },
+        "callable": {
+            "backend_callable": config._llm_backend_callable,
+            "max_tokens": config._llm_max_tokens,
+        },
+    }
+    if config._llm_backend not in required:
+        raise pytest.UsageError(
+            f"[pytest-texts-score] Unknown llm_backend {config._llm_backend!r}; "
+            f"expected one of: {', '.join(required)}.")
+    # Pool members may carry their own endpoints, so those are optional then.
+    pool_settings = ("endpoint", "deployment", "base_url")
+    missing = [
+        name for name, value in required[config._llm_backend].items()
+        if not value and not (config._llm_pool and name in pool_settings)
     ]
 
     if missing:
@@ -132,6 +726,16 @@ def pytest_configure(config: pytest.Config) -> None:
 
     # Initialize client only when all values are set
     init_client(config)
+    init_breaker(config)
+    session_stats.clear()
+    score_store.clear()
+    paragraph_questions.clear()
+    clear_question_banks()
+    config.addinivalue_line(
+        "markers",
+        "texts_score_question_bank(path=None): load the questions of "
+        "reference texts from a question bank (default: "
+        "__question_banks__/<test module>.json)")
     global _global_config
     _global_config = config
 
@@ -167,24 +771,76 @@ def pytest_report_header(config: pytest.Config) -> str:
     :rtype: str
     """
     return ("LLM config: "
-            f"endpoint={config._llm_endpoint!r}, "
+            f"backend={config._llm_backend}, "
+            f"pool_members={len(config._llm_pool)}, "
+            f"endpoint={config._llm_endpoint or config._llm_base_url!r}, "
             f"deployment={config._llm_deployment!r}, "
             f"api_version={config._llm_api_version!r}, "
             f"api_key={mask_api_key(config._llm_api_key)}, "
             f"max_tokens={config._llm_max_tokens}, "
-            f"model={config._llm_model}")
+            f"model={config._llm_model}, "
+            f"questions=({config._llm_questions_deployment}, "
+            f"{config._llm_questions_model}, "
+            f"{config._llm_questions_max_tokens}), "
+            f"answers=({config._llm_answers_deployment}, "
+            f"{config._llm_answers_model}, "
+            f"{config._llm_answers_max_tokens})")
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """
+    Report pytest-texts-score session statistics in the terminal summary.
+
+    Prints the non-zero counters collected during the session, such as the
+    number of hedged requests. Nothing is printed if no counter was used.
+
+    :param terminalreporter: The pytest terminal reporter.
+    :type terminalreporter: pytest.TerminalReporter
+    :return: None.
+    """
+    from .stats import session_stats
+
+    counters = session_stats.snapshot()
+    if not counters:
+        return
+    terminalreporter.write_sep("=", "texts-score summary")
+    for name, value in sorted(counters.items()):
+        terminalreporter.write_line(f"{name.replace('_', ' ')}: {value}")
 
 
 @pytest.fixture(scope="session")
-def texts_score_client() -> AzureOpenAI:
+def texts_score_client() -> "OpenAI | AzureOpenAI":
     """
     Provide access to the initialized LLM client as a fixture.
 
     This session-scoped fixture allows tests to get the configured
-    ``AzureOpenAI`` client instance.
+    ``AzureOpenAI`` client instance (an ``OpenAI`` client with
+    ``llm_backend = openai``). Use ``texts_score_backend`` for other backends.
+
+    :return: The initialized ``openai`` client.
+    :rtype: OpenAI | AzureOpenAI
+    :raises pytest.UsageError: If the backend does not wrap a single
+                               ``openai`` client (``callable`` backend or
+                               ``llm_pool``).
+    """
+    from .backends import OpenAIChatBackend
+    from .client import get_client
+
+    backend = get_client()
+    if not isinstance(backend, OpenAIChatBackend):
+        raise pytest.UsageError(
+            "texts_score_client requires the `azure` or `openai` backend "
+            "without `llm_pool`; use the texts_score_backend fixture instead.")
+    return backend.client
 
-    :return: The initialized ``AzureOpenAI`` client.
-    :rtype: AzureOpenAI
+
+@pytest.fixture(scope="session")
+def texts_score_backend() -> "LLMBackend":
+    """
+    Provide access to the initialized LLM backend as a fixture.
+
+    :return: The initialized LLM backend.
+    :rtype: LLMBackend
     """
     from .client import get_client
 
@@ -220,12 +876,16 @@ def texts_score() -> dict[str, Callable]:
         texts_agg_recall_mean,
         texts_agg_recall_median,
         texts_agg_recall_min,
+        texts_agg_ci,
+        texts_agg_runs,
+        texts_agg_scores,
         texts_expect_f1_equal,
         texts_expect_f1_range,
         texts_expect_precision_equal,
         texts_expect_precision_range,
         texts_expect_recall_equal,
         texts_expect_recall_range,
+        texts_expect_scores,
     )
     from .api_wrappers import (
         texts_agg_completeness_mean,
@@ -273,6 +933,9 @@ def texts_score() -> dict[str, Callable]:
         "agg_recall_mean": texts_agg_recall_mean,
         "agg_recall_median": texts_agg_recall_median,
         "agg_recall_min": texts_agg_recall_min,
+        "agg_ci": texts_agg_ci,
+        "agg_runs": texts_agg_runs,
+        "agg_scores": texts_agg_scores,
         "expect_completeness_equal": texts_expect_completeness_equal,
         "expect_completeness_range": texts_expect_completeness_range,
         "expect_correctness_equal": texts_expect_correctness_equal,
@@ -283,9 +946,58 @@ def texts_score() -> dict[str, Callable]:
         "expect_precision_range": texts_expect_precision_range,
         "expect_recall_equal": texts_expect_recall_equal,
         "expect_recall_range": texts_expect_recall_range,
+        "expect_scores": texts_expect_scores,
     }
 
 
+@pytest.fixture
+def texts_score_snapshot(request: pytest.FixtureRequest) -> "TextsSnapshot":
+    """
+    Provide score snapshot checks for the requesting test.
+
+    Scores are compared with ``__snapshots__/<test module>.json``; run pytest
+    with ``--texts-score-update-snapshots`` to write them.
+
+    :param request: The pytest fixture request.
+    :type request: pytest.FixtureRequest
+    :return: The snapshot checks of the test.
+    :rtype: TextsSnapshot
+    """
+    from .snapshots import TextsSnapshot, snapshot_path
+
+    config = request.config
+    # Keyed by the node id within the module, so that tests of the same name
+    # in different classes do not share entries.
+    test_id = request.node.nodeid.split("::", 1)[-1]
+    return TextsSnapshot(snapshot_path(request.path), test_id,
+                         config._llm_update_snapshots,
+                         config._llm_snapshot_tolerance)
+
+
+@pytest.fixture(autouse=True)
+def _texts_score_question_bank(
+        request: pytest.FixtureRequest) -> Iterator[None]:
+    """
+    Use a question bank in tests marked with ``texts_score_question_bank``.
+
+    :param request: The pytest fixture request.
+    :type request: pytest.FixtureRequest
+    :return: A generator active for the duration of the test.
+    :rtype: Iterator[None]
+    """
+    marker = request.node.get_closest_marker("texts_score_question_bank")
+    if marker is None:
+        yield
+        return
+    from .question_bank import question_bank_path, use_question_bank
+
+    path = marker.kwargs.get("path", marker.args[0] if marker.args else None)
+    # Relative bank paths are relative to the test module.
+    with use_question_bank(request.path.parent / path if path else
+                           question_bank_path(request.path)):
+        yield
+
+
 def mask_api_key(key: Optional[str]) -> Optional[str]:
     """
     Mask an API key for safe display.
@@ -0,0 +1,288 @@
+"""
+Pool of LLM backends serving the same model.
+
+A :class:`BackendPool` spreads requests over several endpoints or deployments
+so that throughput scales with the number of provisioned deployments. Each
+call is routed to the healthy member with the lowest expected latency, taking
+its in-flight requests into account. Members have optional per-minute request
+limits and are temporarily ejected after repeated consecutive errors.
+"""
+from collections import deque
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+import pytest
+
+from pytest_texts_score.backends import (
+    AzureBackend,
+    BackendType,
+    LLMBackend,
+    OpenAICompatibleBackend,
+)
+
+#: Smoothing factor of the exponentially weighted latency average.
+LATENCY_EWMA_ALPHA = 0.3
+
+
+class PoolMember:
+    """
+    One backend of a :class:`BackendPool` together with its health state.
+
+    :param backend: The backend serving requests.
+    :type backend: LLMBackend
+    :param name: Human readable name used in reports.
+    :type name: str
+    :param max_rpm: Maximum requests per minute; ``None`` means unlimited.
+    :type max_rpm: Optional[int]
+    """
+
+    def __init__(self,
+                 backend: LLMBackend,
+                 name: str,
+                 max_rpm: Optional[int] = None) -> None:
+        self.backend = backend
+        self.name = name
+        self.max_rpm = max_rpm
+        self.in_flight = 0
+        #: Exponentially weighted average latency in seconds; ``None`` until
+        #: the first successful call, so untried members are preferred.
+        self.latency: Optional[float] = None
+        self.consecutive_errors = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.errors = 0
+        self._request_times: deque[float] = deque()
+
+    def is_ejected(self, now: float) -> bool:
+        """Return whether the member is currently ejected from routing."""
+        return now < self.ejected_until
+
+    def rate_limit_wait(self, now: float) -> float:
+        """
+        Return how long the member must wait before accepting a request.
+
+        :param now: The current monotonic time.
+        :type now: float
+        :return: Seconds until the per-minute limit allows another request.
+        :rtype: float
+        """
+        while self._request_times and now - self._request_times[0] >= 60:
+            self._request_times.popleft()
+        if self.max_rpm is None or len(self._request_times) < self.max_rpm:
+            return 0.0
+        return 60 - (now - self._request_times[0])
+
+    def load_score(self) -> float:
+        """Return the expected latency of a new request on this member."""
+        return (self.latency or 0.0) * (self.in_flight + 1)
+
+
+class BackendPool(LLMBackend):
+    """
+    Backend routing each call to the least-loaded healthy pool member.
+
+    :param members: The pool members, all serving the same model.
+    :type members: Iterable[PoolMember]
+    :param max_concurrency: Maximum number of concurrent requests over the
+                            whole pool. Defaults to the sum of the members'
+                            concurrency.
+    :type max_concurrency: Optional[int]
+    :param eject_after: Consecutive errors after which a member is ejected.
+    :type eject_after: int
+    :param eject_seconds: How long an ejected member stays out of routing.
+    :type eject_seconds: float
+    """
+
+    supports_batching = True
+
+    def __init__(self,
+                 members: Iterable[PoolMember],
+                 max_concurrency: Optional[int] = None,
+                 eject_after: int = 3,
+                 eject_seconds: float = 30.0) -> None:
+        self.members = list(members)
+        if not self.members:
+            raise ValueError("BackendPool needs at least one member.")
+        super().__init__(max_concurrency or sum(
+            member.backend.max_concurrency for member in self.members))
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self._condition = threading.Condition()
+
+    def acquire(self, exclude: Iterable[PoolMember] = ()) -> PoolMember:
+        """
+        Reserve the best member for a new request.
+
+        Ejected and ``exclude``-d members are skipped unless no other member
+        exists. When every candidate is at its rate limit, the call blocks
+        until one of them frees up. The caller must pass the returned member
+        to :meth:`release`.
+
+        :param exclude: Members that should not be chosen if possible.
+        :type exclude: Iterable[PoolMember]
+        :return: The reserved member.
+        :rtype: PoolMember
+        """
+        excluded = set(map(id, exclude))
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = [
+                    member for member in self.members
+                    if id(member) not in excluded and not member.is_ejected(now)
+                ]
+                if not candidates:
+                    # Fail open: prefer an excluded member over none at all and
+                    # the member whose ejection ends first over blocking.
+                    candidates = [
+                        member for member in self.members
+                        if id(member) not in excluded
+                    ] or self.members
+                    candidates = [
+                        min(candidates, key=lambda member: member.ejected_until)
+                    ]
+                ready = [
+                    member for member in candidates
+                    if member.rate_limit_wait(now) == 0
+                ]
+                if ready:
+                    # Ties (e.g. members without latency data yet) go to the
+                    # member with fewer requests in flight.
+                    member = min(ready,
+                                 key=lambda member:
+                                 (member.load_score(), member.in_flight))
+                    member.in_flight += 1
+                    member.requests += 1
+                    member._request_times.append(now)
+                    return member
+                self._condition.wait(
+                    min(member.rate_limit_wait(now) for member in candidates))
+
+    def release(self, member: PoolMember, latency: Optional[float]) -> None:
+        """
+        Return a member reserved by :meth:`acquire` and record the outcome.
+
+        :param member: The member to release.
+        :type member: PoolMember
+        :param latency: Latency of the successful call in seconds, or
+                        ``None`` if the call failed.
+        :type latency: Optional[float]
+        """
+        with self._condition:
+            member.in_flight -= 1
+            if latency is None:
+                member.errors += 1
+                member.consecutive_errors += 1
+                if member.consecutive_errors >= self.eject_after:
+                    member.ejected_until = time.monotonic() + self.eject_seconds
+                    member.consecutive_errors = 0
+            else:
+                member.consecutive_errors = 0
+                member.latency = latency if member.latency is None else (
+                    LATENCY_EWMA_ALPHA * latency +
+                    (1 - LATENCY_EWMA_ALPHA) * member.latency)
+            self._condition.notify_all()
+
+    def complete_on(self, member: PoolMember, **request: Any) -> str:
+        """
+        Send a request to a member already reserved by :meth:`acquire`.
+
+        The member is released afterwards, whatever the outcome.
+
+        :param member: The reserved member.
+        :type member: PoolMember
+        :param request: Keyword arguments of :meth:`LLMBackend.complete`.
+        :return: The reply content.
+        :rtype: str
+        """
+        started = time.monotonic()
+        try:
+            result = member.backend.complete(**request)
+        except Exception:
+            self.release(member, None)
+            raise
+        self.release(member, time.monotonic() - started)
+        return result
+
+    def complete(self,
+                 messages: list[dict[str, str]],
+                 model: Optional[str],
+                 max_tokens: int,
+                 temperature: float = 0) -> str:
+        return self.complete_on(self.acquire(),
+                                messages=messages,
+                                model=model,
+                                max_tokens=max_tokens,
+                                temperature=temperature)
+
+
+def parse_pool_member(line: str) -> dict[str, str]:
+    """
+    Parse one ``llm_pool`` line of whitespace separated ``key=value`` pairs.
+
+    Recognised keys are ``endpoint``, ``deployment``, ``api_key`` and
+    ``rpm`` for the Azure backend, and ``base_url``, ``api_key`` and ``rpm``
+    for the OpenAI-compatible backend.
+
+    :param line: The line to parse.
+    :type line: str
+    :return: The parsed settings.
+    :rtype: dict[str, str]
+    :raises pytest.UsageError: If a token is not a ``key=value`` pair.
+    """
+    settings = {}
+    for token in line.split():
+        key, separator, value = token.partition("=")
+        if not separator or not value:
+            raise pytest.UsageError(
+                f"Invalid `llm_pool` entry {token!r} in line {line!r}; "
+                "expected key=value.")
+        settings[key] = value
+    return settings
+
+
+def create_pool(config: pytest.Config) -> BackendPool:
+    """
+    Create a :class:`BackendPool` from the ``llm_pool`` setting.
+
+    Settings missing on a pool line fall back to the general LLM settings.
+
+    :param config: The pytest config object containing LLM settings.
+    :type config: pytest.Config
+    :return: The configured pool.
+    :rtype: BackendPool
+    :raises pytest.UsageError: If the backend does not support pooling.
+    """
+    members = []
+    for line in config._llm_pool:
+        settings = parse_pool_member(line)
+        rpm = int(settings["rpm"]) if "rpm" in settings else None
+        match config._llm_backend:
+            case BackendType.AZURE:
+                endpoint = settings.get("endpoint", config._llm_endpoint)
+                deployment = settings.get("deployment",
+                                          config._llm_deployment)
+                backend = AzureBackend(
+                    api_key=settings.get("api_key", config._llm_api_key),
+                    endpoint=endpoint,
+                    api_version=config._llm_api_version,
+                    deployment=deployment,
+                    max_concurrency=config._llm_max_concurrency,
+                )
+                name = f"{endpoint}/{deployment}"
+            case BackendType.OPENAI:
+                name = settings.get("base_url", config._llm_base_url)
+                backend = OpenAICompatibleBackend(
+                    base_url=name,
+                    api_key=settings.get("api_key", config._llm_api_key),
+                    max_concurrency=config._llm_max_concurrency,
+                )
+            case _:
+                raise pytest.UsageError(
+                    "`llm_pool` is supported only by the azure and openai "
+                    f"backends; {config._llm_backend!r} configured.")
+        members.append(PoolMember(backend, name, rpm))
+    return BackendPool(members,
+                       eject_after=config._llm_pool_eject_after,
+                       eject_seconds=config._llm_pool_eject_seconds)
@@ -2,6 +2,8 @@
 Prompt templates used by pytest-texts-score.
 These prompts are carefully engineered to guide the LLM's behavior for question generation and evaluation. Modifying them may have significant impacts on the scoring results.
 """
+import hashlib
+from typing import Optional
 
 QUESTION_PROMPT = """You are a meticulous text analysis assistant. Your task is to generate **yes/no questions** that reflect the information explicitly or implicitly contained in a given text.
 
@@ -85,6 +87,13 @@ Use **double quotes only**, properly escaped with backslashes.
 Only return the final output as a valid JSON object (no explanation or extra text) with questions starting with “Does the text” and ending with a **question mark**.
 """
 
+# Line of QUESTION_PROMPT replaced when a question budget is set.
+_MAXIMISE_INSTRUCTION = """- Maximise the number of questions to cover **every sentence** and the whole text fully.
+"""
+
+QUESTION_BUDGET_INSTRUCTION = """- Generate **at most {max_questions} questions**. If the text holds more information than that, prioritise the most important information and spread the questions over the whole text.
+"""
+
 ANSWER_PROMPT = """You are a precise and attentive assistant. Your task is to assess how closely a given **list of questions** corresponds to a provided text. Your evaluation will help compare how well different pieces of information are **supported by the text**.
 
 # TASK
@@ -180,17 +189,27 @@ Only return the final output as a valid JSON object (no explanation or extra tex
 """
 
 
-def get_system_questions_prompt() -> str:
+def get_system_questions_prompt(max_questions: Optional[int] = None) -> str:
     """
     Get the system prompt for generating questions.
 
     This function returns the predefined system prompt that instructs the LLM
-    on how to generate factual yes/no questions from a given text.
+    on how to generate factual yes/no questions from a given text. With a
+    question budget, the instruction to maximise the number of questions is
+    replaced by an instruction to stay within the budget.
 
+    :param max_questions: Maximum number of questions to generate, or ``None``
+                          for no limit.
+    :type max_questions: Optional[int]
     :return: The question generation prompt string.
     :rtype: str
     """
-    return QUESTION_PROMPT
+    if max_questions is None:
+        return QUESTION_PROMPT
+    return QUESTION_PROMPT.replace(
+        _MAXIMISE_INSTRUCTION,
+        QUESTION_BUDGET_INSTRUCTION.format(max_questions=max_questions),
+    ).replace(' "200": ', f' "{max_questions}": ')
 
 
 def get_system_answers_prompt() -> str:
@@ -245,3 +264,18 @@ Questions to answer:
 
 {questions_text}
 """
+
+
+def get_prompts_version() -> str:
+    """
+    Get a short fingerprint of the prompt templates.
+
+    The fingerprint changes whenever a prompt template changes, so results
+    stored across sessions can be invalidated when prompts are edited.
+
+    :return: The first 12 hex digits of the SHA-256 of all templates.
+    :rtype: str
+    """
+    templates = (QUESTION_PROMPT, _MAXIMISE_INSTRUCTION,
+                 QUESTION_BUDGET_INSTRUCTION, ANSWER_PROMPT)
+    return hashlib.sha256("\0".join(templates).encode("utf-8")).hexdigest()[:12]
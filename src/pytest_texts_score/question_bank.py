@@ -0,0 +1,231 @@
+"""
+Question banks: committed question sets for static reference texts.
+
+Generating questions from the ``expected`` text is a large share of the LLM
+calls of recall and F1, and a source of nondeterminism, although golden
+reference texts never change. A question bank stores question sets of such
+texts in a JSON file next to the tests::
+
+    {
+      "format": 1,
+      "prompts": "<prompt version>",
+      "model": "<question model>",
+      "texts": {
+        "<text hash>": {"preview": "...", "question_sets": [["..."], ...]}
+      }
+    }
+
+While a bank is in use (:func:`use_question_bank` or the
+``texts_score_question_bank`` marker), the questions that recall and F1
+generate from the ``expected`` text are loaded from it, so recall needs only
+answer calls. Running pytest with ``--texts-score-build-question-bank``
+generates the questions instead and (re)writes the sets of every reference
+text evaluated.
+"""
+from collections import Counter
+import contextlib
+from contextvars import ContextVar
+import hashlib
+import json
+from pathlib import Path
+import threading
+from typing import Any, Iterator, Optional
+import warnings
+
+from pytest_texts_score.plugin import get_config
+from pytest_texts_score.prompts import get_prompts_version
+from pytest_texts_score.questions import dump_questions, parse_questions
+
+#: Version of the question bank file format.
+FORMAT_VERSION = 1
+
+_active_bank: ContextVar[Optional["QuestionBank"]] = ContextVar(
+    "texts_score_question_bank", default=None)
+
+# Banks opened in this session by resolved path, so that tests sharing a file
+# share its draws and, while building, its recorded sets.
+_banks: dict[Path, "QuestionBank"] = {}
+_banks_lock = threading.Lock()
+
+
+def question_bank_path(test_path: Path) -> Path:
+    """
+    Return the default question bank file of a test module.
+
+    :param test_path: Path of the test module.
+    :type test_path: Path
+    :return: ``__question_banks__/<module name>.json`` next to the module.
+    :rtype: Path
+    """
+    return test_path.parent / "__question_banks__" / f"{test_path.stem}.json"
+
+
+def text_key(text: str) -> str:
+    """
+    Return the key of a reference text in a question bank.
+
+    :param text: The reference text.
+    :type text: str
+    :return: The first 16 hex digits of the SHA-256 of the text.
+    :rtype: str
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class QuestionBank:
+    """
+    Question sets of reference texts, stored in a JSON file.
+
+    Successive draws of a text cycle through its stored sets, so that the
+    question runs of ``texts_multiple_*`` use different sets when the bank
+    holds several.
+
+    :param path: The question bank file.
+    :type path: Path
+    :param build: Whether to record generated question sets instead of
+                  loading stored ones.
+    :type build: bool
+    """
+
+    def __init__(self, path: Path, build: bool = False) -> None:
+        self.path = Path(path)
+        self.build = build
+        self._lock = threading.Lock()
+        self._draws: Counter[str] = Counter()
+        self._rebuilt: set[str] = set()
+        self.data = self._load()
+
+    def _load(self) -> dict[str, Any]:
+        """Load the bank file, ignoring it if it was built differently."""
+        config = get_config()
+        fresh = {
+            "format": FORMAT_VERSION,
+            "prompts": get_prompts_version(),
+            "model": config._llm_questions_model,
+            "texts": {},
+        }
+        if not self.path.exists():
+            return fresh
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        stale = [
+            field for field in ("format", "prompts", "model")
+            if data.get(field) != fresh[field]
+        ]
+        if stale and not self.build:
+            warnings.warn(
+                f"Question bank {self.path} was built with a different "
+                f"{', '.join(stale)} and is ignored; rebuild it with "
+                "--texts-score-build-question-bank.",
+                UserWarning,
+                stacklevel=2,
+            )
+            return fresh
+        if stale:
+            return fresh
+        return data
+
+    def content_hash(self) -> str:
+        """
+        Return a hash of the stored question sets.
+
+        :return: The first 16 hex digits of the SHA-256 of the bank content.
+        :rtype: str
+        """
+        with self._lock:
+            encoded = json.dumps(self.data, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+    def __contains__(self, text: str) -> bool:
+        with self._lock:
+            return text_key(text) in self.data["texts"]
+
+    def draw(self, text: str) -> Optional[str]:
+        """
+        Return the next stored question set of a text.
+
+        :param text: The reference text.
+        :type text: str
+        :return: A JSON string of questions, or ``None`` if the text is not
+                 in the bank.
+        :rtype: Optional[str]
+        """
+        key = text_key(text)
+        with self._lock:
+            entry = self.data["texts"].get(key)
+            if entry is None or not entry["question_sets"]:
+                return None
+            sets = entry["question_sets"]
+            questions = sets[self._draws[key] % len(sets)]
+            self._draws[key] += 1
+        return dump_questions(questions)
+
+    def record(self, text: str, questions_text: str) -> None:
+        """
+        Add a generated question set of a text and write the bank file.
+
+        The first set recorded for a text in a bank replaces its stored sets.
+
+        :param text: The reference text.
+        :type text: str
+        :param questions_text: The generated questions as a JSON string.
+        :type questions_text: str
+        :raises ValueError: If ``questions_text`` is not valid JSON.
+        """
+        key = text_key(text)
+        questions = parse_questions(questions_text)
+        with self._lock:
+            entry = self.data["texts"].setdefault(key, {
+                "preview": " ".join(text.split())[:60],
+                "question_sets": [],
+            })
+            if key not in self._rebuilt:
+                self._rebuilt.add(key)
+                entry["question_sets"] = []
+            entry["question_sets"].append(questions)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(self.data, indent=2, sort_keys=True) + "\n",
+                encoding="utf-8")
+
+
+@contextlib.contextmanager
+def use_question_bank(path: Path | str) -> Iterator[QuestionBank]:
+    """
+    Load recall-side questions from a question bank within the block.
+
+    With ``--texts-score-build-question-bank``, questions are generated and
+    recorded into the bank instead.
+
+    :param path: The question bank file.
+    :type path: Path | str
+    :return: A context manager yielding the bank.
+    :rtype: Iterator[QuestionBank]
+    """
+    resolved = Path(path).resolve()
+    with _banks_lock:
+        bank = _banks.get(resolved)
+        if bank is None:
+            bank = QuestionBank(resolved,
+                                get_config()._llm_build_question_bank)
+            _banks[resolved] = bank
+    token = _active_bank.set(bank)
+    try:
+        yield bank
+    finally:
+        _active_bank.reset(token)
+
+
+def active_question_bank() -> Optional[QuestionBank]:
+    """
+    Return the question bank in use, if any.
+
+    :return: The active bank, or ``None``.
+    :rtype: Optional[QuestionBank]
+    """
+    return _active_bank.get()
+
+
+def clear_question_banks() -> None:
+    """Forget the banks opened in this session."""
+    with _banks_lock:
+        _banks.clear()
@@ -0,0 +1,301 @@
+"""
+Helpers for working with generated question sets.
+
+The LLM returns question sets as a JSON object mapping running numbers to
+questions (``{"1": "Does the text ...?", ...}``). The functions here parse
+and serialize that format, split long texts into overlapping chunks for
+question generation, merge the per-chunk question sets back together, drop
+near-duplicate questions, limit question sets to a budget and split question sets into shards answered concurrently.
+"""
+import json
+import math
+import re
+from typing import Optional
+
+from pytest_texts_score.tokens import count_tokens
+
+# Sentence ends and line breaks are the preferred places to split a text.
+_SEGMENT_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+
+_WORD = re.compile(r"\w+")
+
+# The "Does the text state that ..." framing is shared by all questions and
+# says nothing about their content. Negations are deliberately kept.
+_FRAMING_WORDS = frozenset("""
+a an does doesn text the state states say says mention mentions
+refer refers indicate indicates that this
+""".split())
+
+
+def parse_questions(questions_text: str) -> list[str]:
+    """
+    Parse a JSON question set into a list of questions.
+
+    Markdown ```json fences around the JSON are tolerated.
+
+    :param questions_text: The JSON question set.
+    :type questions_text: str
+    :return: The questions in their original order.
+    :rtype: list[str]
+    :raises ValueError: If the text is not a valid JSON question set.
+    """
+    if "```json" in questions_text:
+        questions_text = questions_text.split("```json")[1].split("```")[0]
+    try:
+        parsed = json.loads(questions_text.strip())
+    except Exception as e:
+        raise ValueError(f"Invalid JSON in question set: {e}")
+    if isinstance(parsed, dict):
+        return [str(question) for question in parsed.values()]
+    if isinstance(parsed, list):
+        return [str(question) for question in parsed]
+    raise ValueError(
+        f"Invalid question set; expected a JSON object, got {parsed!r}")
+
+
+def dump_questions(questions: list[str]) -> str:
+    """
+    Serialize questions into the JSON question set format.
+
+    :param questions: The questions.
+    :type questions: list[str]
+    :return: JSON object mapping running numbers (from 1) to questions.
+    :rtype: str
+    """
+    return json.dumps(
+        {str(i): question for i, question in enumerate(questions, start=1)},
+        ensure_ascii=False,
+        indent=1)
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question for comparison.
+
+    Lowercases the question, collapses whitespace and strips surrounding
+    punctuation.
+
+    :param question: The question.
+    :type question: str
+    :return: The normalized question.
+    :rtype: str
+    """
+    return " ".join(question.lower().split()).strip(" ?.!")
+
+
+def merge_question_sets(question_sets: list[list[str]]) -> list[str]:
+    """
+    Merge question sets, dropping exact duplicates after normalization.
+
+    :param question_sets: The question sets to merge, e.g. one per chunk.
+    :type question_sets: list[list[str]]
+    :return: The merged questions, in first-seen order.
+    :rtype: list[str]
+    """
+    seen = set()
+    merged = []
+    for questions in question_sets:
+        for question in questions:
+            key = normalize_question(question)
+            if key not in seen:
+                seen.add(key)
+                merged.append(question)
+    return merged
+
+
+def question_shingles(question: str) -> frozenset[str]:
+    """
+    Return the shingles of a question used for similarity comparison.
+
+    The shingles are the content words of the question (without the
+    "Does the text state that" framing) and their adjacent pairs, so that
+    questions differing only in framing are identical while questions with
+    the same words in a different order are not.
+
+    :param question: The question.
+    :type question: str
+    :return: The set of word and word-pair shingles.
+    :rtype: frozenset[str]
+    """
+    words = [
+        word for word in _WORD.findall(question.lower())
+        if word not in _FRAMING_WORDS
+    ]
+    return frozenset(words + [f"{a} {b}" for a, b in zip(words, words[1:])])
+
+
+def question_similarity(first: frozenset[str], second: frozenset[str]) -> float:
+    """
+    Return the Jaccard similarity of two shingle sets.
+
+    :param first: Shingles of the first question.
+    :type first: frozenset[str]
+    :param second: Shingles of the second question.
+    :type second: frozenset[str]
+    :return: The similarity between 0 and 1.
+    :rtype: float
+    """
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def deduplicate_questions(questions: list[str], threshold: float) -> list[str]:
+    """
+    Drop questions too similar to an earlier question.
+
+    :param questions: The questions.
+    :type questions: list[str]
+    :param threshold: Similarity (see :func:`question_similarity`) at which a
+                      question counts as a duplicate of an earlier one.
+    :type threshold: float
+    :return: The remaining questions, in their original order.
+    :rtype: list[str]
+    """
+    kept: list[str] = []
+    kept_shingles: list[frozenset[str]] = []
+    for question in questions:
+        shingles = question_shingles(question)
+        if any(
+                question_similarity(shingles, other) >= threshold
+                for other in kept_shingles):
+            continue
+        kept.append(question)
+        kept_shingles.append(shingles)
+    return kept
+
+
+def question_budget(text_tokens: int, max_questions: int,
+                    per_100_tokens: float) -> Optional[int]:
+    """
+    Return the number of questions allowed for a text.
+
+    :param text_tokens: Number of tokens of the text.
+    :type text_tokens: int
+    :param max_questions: Absolute cap on the number of questions (0 for none).
+    :type max_questions: int
+    :param per_100_tokens: Questions allowed per 100 tokens of text (0 for no
+                           length-proportional limit).
+    :type per_100_tokens: float
+    :return: The budget, at least 1, or ``None`` if neither limit is set.
+    :rtype: Optional[int]
+    """
+    limits = []
+    if max_questions > 0:
+        limits.append(max_questions)
+    if per_100_tokens > 0:
+        limits.append(max(1, math.ceil(per_100_tokens * text_tokens / 100)))
+    return min(limits) if limits else None
+
+
+def subsample_questions(questions: list[str], budget: int) -> list[str]:
+    """
+    Reduce questions to ``budget`` evenly spaced ones.
+
+    Generated questions follow the order of the text, so evenly spaced
+    questions keep covering the whole text.
+
+    :param questions: The questions.
+    :type questions: list[str]
+    :param budget: Maximum number of questions to keep.
+    :type budget: int
+    :return: At most ``budget`` questions, in their original order.
+    :rtype: list[str]
+    """
+    if len(questions) <= budget:
+        return questions
+    step = len(questions) / budget
+    return [questions[math.floor(i * step)] for i in range(budget)]
+
+
+def split_evenly(questions: list[str], shards: int) -> list[list[str]]:
+    """
+    Split questions into at most ``shards`` contiguous, near-equal parts.
+
+    :param questions: The questions to split.
+    :type questions: list[str]
+    :param shards: The requested number of shards.
+    :type shards: int
+    :return: The non-empty shards, in question order.
+    :rtype: list[list[str]]
+    """
+    shards = max(1, min(shards, len(questions)))
+    size, remainder = divmod(len(questions), shards)
+    result = []
+    start = 0
+    for i in range(shards):
+        end = start + size + (1 if i < remainder else 0)
+        result.append(questions[start:end])
+        start = end
+    return [shard for shard in result if shard]
+
+
+def _segments(text: str, max_tokens: int,
+              model: Optional[str] = None) -> list[str]:
+    """Split ``text`` into sentences, breaking overlong ones into words."""
+    segments = []
+    for segment in _SEGMENT_SPLIT.split(text):
+        segment = segment.strip()
+        if not segment:
+            continue
+        if count_tokens(segment, model) <= max_tokens:
+            segments.append(segment)
+            continue
+        words: list[str] = []
+        for word in segment.split():
+            if words and count_tokens(" ".join(words + [word]),
+                                      model) > max_tokens:
+                segments.append(" ".join(words))
+                words = []
+            words.append(word)
+        if words:
+            segments.append(" ".join(words))
+    return segments
+
+
+def split_into_chunks(text: str,
+                      chunk_tokens: int,
+                      overlap_tokens: int,
+                      model: Optional[str] = None) -> list[str]:
+    """
+    Split a long text into overlapping chunks of at most ``chunk_tokens``.
+
+    Chunks are built from whole sentences where possible. Each chunk after
+    the first repeats trailing sentences of the previous chunk, up to
+    ``overlap_tokens``, so that information spanning a chunk border is seen
+    in one piece.
+
+    :param text: The text to split.
+    :type text: str
+    :param chunk_tokens: Maximum number of tokens per chunk.
+    :type chunk_tokens: int
+    :param overlap_tokens: Number of tokens repeated between chunks.
+    :type overlap_tokens: int
+    :param model: The model whose tokenizer counts the tokens.
+    :type model: Optional[str]
+    :return: The chunks; a single chunk if the text is short enough.
+    :rtype: list[str]
+    """
+    if count_tokens(text, model) <= chunk_tokens:
+        return [text]
+    overlap_tokens = min(overlap_tokens, chunk_tokens // 2)
+    chunks = []
+    current: list[str] = []
+    for segment in _segments(text, chunk_tokens, model):
+        if current and count_tokens(" ".join(current + [segment]),
+                                    model) > chunk_tokens:
+            chunks.append(" ".join(current))
+            overlap: list[str] = []
+            for previous in reversed(current):
+                if count_tokens(" ".join([previous] + overlap + [segment]),
+                                model) > chunk_tokens:
+                    break
+                if count_tokens(" ".join([previous] + overlap),
+                                model) > overlap_tokens:
+                    break
+                overlap.insert(0, previous)
+            current = overlap
+        current.append(segment)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
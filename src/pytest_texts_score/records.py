@@ -0,0 +1,311 @@
+"""
+Compact records of evaluation results.
+
+Large batch evaluations produce many per-run and per-question results.
+:class:`RunScores` and :class:`QuestionAnswers` store them in typed arrays,
+with every question stored once in a :class:`QuestionTable` shared by all
+answer runs of a question set, while still behaving like the lists of tuples
+and dictionaries used before. Their arrays can be exported to NumPy without
+copying when NumPy is installed.
+"""
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+import threading
+from typing import Any, Iterable, Optional
+
+from pytest_texts_score.questions import normalize_question, parse_questions
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
+
+def _to_numpy(values: array) -> Any:
+    """Return a NumPy array sharing memory with ``values``."""
+    if numpy is None:
+        raise ImportError("NumPy is required for to_numpy(); "
+                          "install it with `pip install numpy`.")
+    return numpy.frombuffer(values, dtype=numpy.int32 if values.typecode ==
+                            "i" else numpy.float64)
+
+
+class RunScores(Sequence):
+    """
+    Scores of the runs of a ``texts_multiple_*`` evaluation.
+
+    Each column is an ``array('d')``. Indexing returns the tuple
+    ``(question_run, answer_run, *scores)`` of a run, so the object can be
+    used like the list of tuples it replaces.
+
+    :param names: Names of the score columns, e.g.
+                  ``("precision", "recall", "f1")``.
+    :type names: Iterable[str]
+    """
+
+    __slots__ = ("names", "question_runs", "answer_runs", "_columns")
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names = tuple(names)
+        self.question_runs = array("i")
+        self.answer_runs = array("i")
+        self._columns = tuple(array("d") for _ in self.names)
+
+    def append(self, question_run: int, answer_run: int,
+               *scores: float) -> None:
+        """
+        Add the scores of one run.
+
+        :param question_run: Index of the question run.
+        :type question_run: int
+        :param answer_run: Index of the answer run.
+        :type answer_run: int
+        :param scores: One score per column, in column order.
+        :type scores: float
+        :raises ValueError: If the number of scores does not match the columns.
+        """
+        if len(scores) != len(self._columns):
+            raise ValueError(f"Expected {len(self._columns)} scores, "
+                             f"got {len(scores)}.")
+        self.question_runs.append(question_run)
+        self.answer_runs.append(answer_run)
+        for column, score in zip(self._columns, scores):
+            column.append(score)
+
+    def column(self, name: str) -> array:
+        """
+        Return the scores of one column.
+
+        :param name: The column name.
+        :type name: str
+        :return: The scores of all runs.
+        :rtype: array
+        :raises KeyError: If there is no such column.
+        """
+        if name not in self.names:
+            raise KeyError(name)
+        return self._columns[self.names.index(name)]
+
+    def to_numpy(self, name: str) -> Any:
+        """
+        Return one column as a NumPy array sharing its memory.
+
+        :param name: The column name.
+        :type name: str
+        :return: A ``float64`` NumPy array.
+        :rtype: numpy.ndarray
+        :raises ImportError: If NumPy is not installed.
+        """
+        return _to_numpy(self.column(name))
+
+    def __len__(self) -> int:
+        return len(self.question_runs)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return (self.question_runs[index], self.answer_runs[index],
+                *(column[index] for column in self._columns))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RunScores({self.names}, runs={len(self)})"
+
+
+class QuestionTable:
+    """
+    The questions of a question set, stored once and referenced by index.
+
+    :param questions: The questions.
+    :type questions: Iterable[str]
+    """
+
+    __slots__ = ("questions", "_index", "_lock")
+
+    def __init__(self, questions: Iterable[str] = ()) -> None:
+        self.questions: list[str] = []
+        self._index: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for question in questions:
+            self.add(question)
+
+    def add(self, question: str) -> int:
+        """
+        Append a question and return its index.
+
+        :param question: The question.
+        :type question: str
+        :return: The index of the new question.
+        :rtype: int
+        """
+        with self._lock:
+            self.questions.append(question)
+            self._index.setdefault(normalize_question(question),
+                                   len(self.questions) - 1)
+            return len(self.questions) - 1
+
+    def copy(self) -> "QuestionTable":
+        """
+        Return a private copy of the table.
+
+        :return: A table with the same questions.
+        :rtype: QuestionTable
+        """
+        with self._lock:
+            return QuestionTable(self.questions)
+
+    def find(self, question: str) -> Optional[int]:
+        """
+        Return the index of a question, compared after normalization.
+
+        :param question: The question.
+        :type question: str
+        :return: The index of its first occurrence, or ``None``.
+        :rtype: Optional[int]
+        """
+        return self._index.get(normalize_question(question))
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __getitem__(self, index: int) -> str:
+        return self.questions[index]
+
+
+@lru_cache(maxsize=128)
+def question_table(questions_text: str) -> QuestionTable:
+    """
+    Return the shared question table of a JSON question set.
+
+    All answer runs of the same question set reference one table. The table
+    is shared between threads and must not be modified.
+
+    :param questions_text: The JSON question set.
+    :type questions_text: str
+    :return: The table; empty if the question set cannot be parsed.
+    :rtype: QuestionTable
+    """
+    try:
+        return QuestionTable(parse_questions(questions_text))
+    except ValueError:
+        return QuestionTable()
+
+
+class QuestionAnswers(Sequence):
+    """
+    Answers to a question set, as an ``array('d')`` indexed into a table.
+
+    Indexing returns the ``{"question": ..., "answer": ...}`` dictionary of an
+    answer, so the object can be used like the list of dictionaries it
+    replaces.
+
+    :param table: The question table the answers refer to.
+    :type table: QuestionTable
+    """
+
+    __slots__ = ("table", "indices", "answers")
+
+    def __init__(self, table: QuestionTable) -> None:
+        self.table = table
+        self.indices = array("i")
+        self.answers = array("d")
+
+    @classmethod
+    def from_items(cls, table: QuestionTable,
+                   items: Iterable[dict[str, Any]]) -> "QuestionAnswers":
+        """
+        Build answers from the answer items returned by the LLM.
+
+        When the LLM answered every question of ``table``, the answers are
+        matched by position; otherwise by the echoed ``question``. Questions
+        not in the table are added to a private copy of it, so that the shared
+        table keeps the asked questions only.
+
+        :param table: The question table of the asked questions.
+        :type table: QuestionTable
+        :param items: Items with ``question`` and numeric ``answer`` keys.
+        :type items: Iterable[dict[str, Any]]
+        :return: The answers.
+        :rtype: QuestionAnswers
+        :raises TypeError: If an answer is not numeric.
+        :raises ValueError: If an answer is not numeric.
+        """
+        items = list(items)
+        result = cls(table)
+        positional = len(items) == len(table)
+        for position, item in enumerate(items):
+            if positional:
+                index = position
+            else:
+                question = str(item.get("question", ""))
+                index = result.table.find(question)
+                if index is None:
+                    if result.table is table:
+                        result.table = table.copy()
+                    index = result.table.add(question)
+            result.indices.append(index)
+            result.answers.append(float(item.get("answer")))
+        return result
+
+    def mean(self) -> float:
+        """
+        Return the mean answer, i.e. the one-sided score.
+
+        :raises ZeroDivisionError: If there are no answers.
+        """
+        return sum(self.answers) / len(self.answers)
+
+    def to_numpy(self) -> Any:
+        """
+        Return the answers as a NumPy array sharing their memory.
+
+        :return: A ``float64`` NumPy array.
+        :rtype: numpy.ndarray
+        :raises ImportError: If NumPy is not installed.
+        """
+        return _to_numpy(self.answers)
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {
+            "question": self.table[self.indices[index]],
+            "answer": self.answers[index],
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"QuestionAnswers(answers={len(self)})"
+
+
+def mean_answer(answers: Sequence[dict[str, Any]]) -> float:
+    """
+    Return the mean answer of a list of answers.
+
+    :param answers: The answers, as :class:`QuestionAnswers` or as a list of
+                    dictionaries with an ``answer`` key.
+    :type answers: Sequence[dict[str, Any]]
+    :return: The one-sided score.
+    :rtype: float
+    :raises ZeroDivisionError: If there are no answers.
+    """
+    if isinstance(answers, QuestionAnswers):
+        return answers.mean()
+    values = [answer.get("answer") for answer in answers]
+    return sum(values) / len(values)
@@ -0,0 +1,268 @@
+"""
+Result objects of aggregated evaluations.
+
+The ``texts_agg_*`` assertions reduce the run scores of an evaluation with a
+single aggregation. An :class:`AggregatedScores` keeps the raw run scores
+instead, so that one set of LLM runs can be checked against several
+aggregations (e.g. both the mean and the minimum), or against a confidence
+interval of the mean score.
+"""
+import math
+import re
+from statistics import mean, median
+from typing import Iterator, Optional, Sequence
+
+import pytest
+
+from pytest_texts_score.confidence import CIMethod, confidence_interval
+from pytest_texts_score.evaluate_score import AggType, ScoreType, scores_agg
+
+_PERCENTILE = re.compile(r"p(\d+(?:\.\d+)?)")
+
+
+class AggregatedScores:
+    """
+    Run scores of one score type from an aggregated evaluation.
+
+    :param scores: The score of every run.
+    :type scores: Sequence[float]
+    :param score_type: The type of the scores. Defaults to F1.
+    :type score_type: ScoreType
+    :param expected: The reference text, used for failure messages.
+    :type expected: str
+    :param given: The evaluated text, used for failure messages.
+    :type given: str
+    :param question_runs: The question run of every score. Answer runs of
+                          one question set are correlated, so confidence
+                          intervals are computed over the question runs.
+                          Defaults to one question run per score.
+    :type question_runs: Optional[Sequence[int]]
+    """
+
+    def __init__(self,
+                 scores: Sequence[float],
+                 score_type: ScoreType = ScoreType.F1,
+                 expected: str = "",
+                 given: str = "",
+                 question_runs: Optional[Sequence[int]] = None) -> None:
+        if not scores:
+            raise ValueError("At least one run score is required.")
+        if question_runs is not None and len(question_runs) != len(scores):
+            raise ValueError("Every run score needs its question run.")
+        self.scores = [float(score) for score in scores]
+        self.question_runs = (list(range(len(self.scores)))
+                              if question_runs is None else list(question_runs))
+        self.score_type = ScoreType(score_type)
+        self.expected = expected
+        self.given = given
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.scores)
+
+    def __repr__(self) -> str:
+        return (f"AggregatedScores({self.score_type.value}, runs={len(self)}, "
+                f"mean={self.mean():.3f}, min={self.min():.3f}, "
+                f"max={self.max():.3f})")
+
+    def min(self) -> float:
+        """Return the minimum run score."""
+        return min(self.scores)
+
+    def max(self) -> float:
+        """Return the maximum run score."""
+        return max(self.scores)
+
+    def median(self) -> float:
+        """Return the median run score."""
+        return float(median(self.scores))
+
+    def mean(self) -> float:
+        """Return the mean run score."""
+        return float(mean(self.scores))
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Return a percentile of the run scores.
+
+        Values between two runs are interpolated linearly.
+
+        :param percentile: The percentile, between 0 and 100.
+        :type percentile: float
+        :return: The percentile of the run scores.
+        :rtype: float
+        :raises ValueError: If ``percentile`` is outside [0, 100].
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(
+                f"`percentile` must be in range 0 to 100; {percentile} given.")
+        ordered = sorted(self.scores)
+        position = percentile / 100 * (len(ordered) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] -
+                                 ordered[lower]) * (position - lower)
+
+    def trimmed_mean(self, proportion: float = 0.1) -> float:
+        """
+        Return the mean of the run scores without the extreme runs.
+
+        :param proportion: Share of runs cut from each end. Defaults to 0.1.
+        :type proportion: float
+        :return: The trimmed mean.
+        :rtype: float
+        :raises ValueError: If ``proportion`` is outside [0, 0.5).
+        """
+        if not 0 <= proportion < 0.5:
+            raise ValueError(
+                f"`proportion` must be in range 0 to 0.5; {proportion} given.")
+        cut = math.floor(len(self.scores) * proportion)
+        ordered = sorted(self.scores)
+        return float(mean(ordered[cut:len(ordered) - cut]))
+
+    def aggregate(self, aggregation: str) -> float:
+        """
+        Return the run scores reduced by a named aggregation.
+
+        :param aggregation: An :class:`AggType` value (``"minimum"``,
+                            ``"maximum"``, ``"median"``, ``"mean"``,
+                            ``"average"``), ``"trimmed_mean"`` or ``"p<N>"``
+                            for the N-th percentile (e.g. ``"p10"``).
+        :type aggregation: str
+        :return: The aggregated score.
+        :rtype: float
+        :raises ValueError: If the aggregation is unknown.
+        """
+        if aggregation == "trimmed_mean":
+            return self.trimmed_mean()
+        match = _PERCENTILE.fullmatch(aggregation)
+        if match:
+            return self.percentile(float(match.group(1)))
+        return scores_agg(self.scores, AggType(aggregation))
+
+    def expect(self, **ranges: tuple[float, float]) -> "AggregatedScores":
+        """
+        Assert that aggregations of the run scores fall within ranges.
+
+        Every range is checked before failing and all violations are
+        reported together, e.g.
+        ``result.expect(mean=(0.8, 1.0), minimum=(0.6, 1.0), p10=(0.7, 1.0))``.
+
+        :param ranges: ``(min_score, max_score)`` ranges keyed by aggregation
+                       name (see :meth:`aggregate`).
+        :type ranges: tuple[float, float]
+        :return: This object, so that checks can be chained.
+        :rtype: AggregatedScores
+        :raises pytest.UsageError: If no range or an unknown aggregation is
+                                   given.
+        """
+        if not ranges:
+            raise pytest.UsageError("At least one aggregation range is required.")
+        violations = []
+        for aggregation, (min_score, max_score) in ranges.items():
+            try:
+                score = self.aggregate(aggregation)
+            except ValueError as e:
+                raise pytest.UsageError(
+                    f"Unknown aggregation `{aggregation}`: {e}") from e
+            if score < min_score:
+                violations.append(f"Text {self.score_type} {aggregation} below "
+                                  f"minimum: {score:.2f} < {min_score}.")
+            elif score > max_score:
+                violations.append(f"Text {self.score_type} {aggregation} above "
+                                  f"maximum: {score:.2f} > {max_score}.")
+        if violations:
+            pytest.fail("\n".join(violations) +
+                        f"\n`expected`: '{self.expected}'\n`given`: '{self.given}'")
+        return self
+
+    def question_run_means(self) -> list[float]:
+        """Return the mean score of every question run."""
+        groups: dict[int, list[float]] = {}
+        for question_run, score in zip(self.question_runs, self.scores):
+            groups.setdefault(question_run, []).append(score)
+        return [float(mean(scores)) for scores in groups.values()]
+
+    def confidence_interval(self,
+                            confidence: float = 0.95,
+                            method: CIMethod | str = CIMethod.T,
+                            resamples: int = 2000,
+                            seed: Optional[int] = None) -> tuple[float, float]:
+        """
+        Return a confidence interval of the mean run score.
+
+        The interval is computed over the mean score of every question run:
+        answer runs of the same question set are not independent samples, so
+        treating them as such would make the interval too narrow. The
+        bootstrap thus resamples whole question runs.
+
+        :param confidence: Confidence level, between 0 and 1. Defaults to 0.95.
+        :type confidence: float
+        :param method: ``"t"`` or ``"bootstrap"``. Defaults to ``"t"``.
+        :type method: CIMethod | str
+        :param resamples: Number of bootstrap resamples. Defaults to 2000.
+        :type resamples: int
+        :param seed: Seed of the bootstrap random generator.
+        :type seed: Optional[int]
+        :return: The lower and upper bound.
+        :rtype: tuple[float, float]
+        :raises ValueError: If there are fewer than two question runs.
+        """
+        return confidence_interval(self.question_run_means(), confidence,
+                                   method, resamples, seed)
+
+    def expect_ci(self,
+                  lower_bound: Optional[float] = None,
+                  upper_bound: Optional[float] = None,
+                  confidence: float = 0.95,
+                  method: CIMethod | str = CIMethod.T,
+                  resamples: int = 2000,
+                  seed: Optional[int] = None) -> "AggregatedScores":
+        """
+        Assert that the confidence interval of the mean lies within bounds.
+
+        The check passes only if the whole interval lies at or above
+        ``lower_bound`` and at or below ``upper_bound``, i.e. if the runs show
+        with the given confidence that the mean score meets the bounds.
+
+        :param lower_bound: Minimum lower bound of the interval.
+        :type lower_bound: Optional[float]
+        :param upper_bound: Maximum upper bound of the interval.
+        :type upper_bound: Optional[float]
+        :param confidence: Confidence level, between 0 and 1. Defaults to 0.95.
+        :type confidence: float
+        :param method: ``"t"`` or ``"bootstrap"``. Defaults to ``"t"``.
+        :type method: CIMethod | str
+        :param resamples: Number of bootstrap resamples. Defaults to 2000.
+        :type resamples: int
+        :param seed: Seed of the bootstrap random generator.
+        :type seed: Optional[int]
+        :return: This object, so that checks can be chained.
+        :rtype: AggregatedScores
+        :raises pytest.UsageError: If no bound is given, the method or
+                                   confidence is invalid or there are fewer
+                                   than two question runs.
+        """
+        if lower_bound is None and upper_bound is None:
+            raise pytest.UsageError(
+                "At least one of `lower_bound` or `upper_bound` is required.")
+        try:
+            low, high = self.confidence_interval(confidence, method, resamples,
+                                                 seed)
+        except ValueError as e:
+            raise pytest.UsageError(f"Invalid confidence interval: {e}") from e
+        label = (f"Text {self.score_type} mean {confidence:.0%} confidence "
+                 f"interval [{low:.2f}, {high:.2f}]")
+        violations = []
+        if lower_bound is not None and low < lower_bound:
+            violations.append(
+                f"{label} below minimum: {low:.2f} < {lower_bound}.")
+        if upper_bound is not None and high > upper_bound:
+            violations.append(
+                f"{label} above maximum: {high:.2f} > {upper_bound}.")
+        if violations:
+            pytest.fail("\n".join(violations) +
+                        f"\n`expected`: '{self.expected}'\n`given`: '{self.given}'")
+        return self
@@ -0,0 +1,148 @@
+"""
+Local lexical retrieval over the paragraphs of a text.
+
+For long answer texts, sending the whole text with every question list makes
+prompt size scale with text length times the number of runs. A
+:class:`BM25Index` built once over the paragraphs of the answer text lets each
+group of questions be answered against only its most relevant passages.
+"""
+from collections import Counter
+from functools import lru_cache
+import math
+import re
+
+# Function words and the fixed "Does the text state ..." question prefix carry
+# no information about which passage is relevant.
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because
+been before being below between both but by can could did do does doing down
+during each few for from further had has have having here how i if in into is
+it its itself just me mention mentions more most no nor not now of off on once
+only or other our out over own same say says should so some state states such
+text than that the their them then there these they this those through to too
+under until up very was we were what when where which while who whom why will
+with would you your
+""".split())
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase terms, dropping stopwords.
+
+    :param text: The text to tokenize.
+    :type text: str
+    :return: The terms, in order of appearance.
+    :rtype: list[str]
+    """
+    return [
+        word for word in _WORD.findall(text.lower()) if word not in STOPWORDS
+    ]
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """
+    Split text into paragraphs separated by blank lines.
+
+    A text without blank lines is split into its lines instead.
+
+    :param text: The text to split.
+    :type text: str
+    :return: The non-empty paragraphs.
+    :rtype: list[str]
+    """
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+    if len(paragraphs) <= 1:
+        paragraphs = [line.strip() for line in text.splitlines() if line.strip()]
+    return paragraphs
+
+
+class BM25Index:
+    """
+    Okapi BM25 index over a list of passages.
+
+    :param passages: The passages to index.
+    :type passages: list[str]
+    :param k1: Term frequency saturation parameter. Defaults to 1.5.
+    :type k1: float
+    :param b: Length normalization parameter. Defaults to 0.75.
+    :type b: float
+    """
+
+    def __init__(self,
+                 passages: list[str],
+                 k1: float = 1.5,
+                 b: float = 0.75) -> None:
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+        self._term_counts = [Counter(tokenize(p)) for p in passages]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._average_length = (sum(self._lengths) / len(self._lengths)
+                                if self._lengths else 0.0) or 1.0
+        document_frequency: Counter[str] = Counter()
+        for counts in self._term_counts:
+            document_frequency.update(counts.keys())
+        total = len(passages)
+        self._idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> list[float]:
+        """
+        Return the BM25 score of every passage for ``query``.
+
+        :param query: The query text.
+        :type query: str
+        :return: One score per passage.
+        :rtype: list[float]
+        """
+        terms = Counter(tokenize(query))
+        result = []
+        for counts, length in zip(self._term_counts, self._lengths):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * length /
+                              self._average_length)
+            for term, query_count in terms.items():
+                frequency = counts.get(term)
+                if frequency:
+                    score += (query_count * self._idf[term] * frequency *
+                              (self.k1 + 1) / (frequency + norm))
+            result.append(score)
+        return result
+
+    def search(self, query: str, top_k: int) -> list[int]:
+        """
+        Return indices of the ``top_k`` passages most relevant to ``query``.
+
+        The indices are returned in document order, so that the selected
+        passages can be joined back into a coherent excerpt.
+
+        :param query: The query text.
+        :type query: str
+        :param top_k: Number of passages to return.
+        :type top_k: int
+        :return: Passage indices in ascending order.
+        :rtype: list[int]
+        """
+        scores = self.scores(query)
+        best = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+        return sorted(best[:top_k])
+
+
+@lru_cache(maxsize=32)
+def get_index(text: str) -> BM25Index:
+    """
+    Return the paragraph index of ``text``, building it on first use.
+
+    The index is cached, so all runs of an aggregated evaluation answering
+    questions against the same text share one index.
+
+    :param text: The text to index.
+    :type text: str
+    :return: The index over the paragraphs of ``text``.
+    :rtype: BM25Index
+    """
+    return BM25Index(split_paragraphs(text))
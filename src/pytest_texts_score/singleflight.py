@@ -0,0 +1,122 @@
+"""
+Coalescing of identical in-flight calls.
+
+When tests run concurrently, several of them often request the same thing at
+the same moment, e.g. questions for a shared golden text. A
+:class:`SingleFlight` lets the first caller of a key (the leader) run the
+call while later callers of the same key wait for the leader's result instead
+of issuing their own call. Callers may be threads (:meth:`SingleFlight.call`)
+or asyncio tasks (:meth:`SingleFlight.acall`); both share the same in-flight
+calls.
+"""
+import asyncio
+from concurrent.futures import CancelledError, Future
+import threading
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from pytest_texts_score.stats import session_stats
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Registry of in-flight calls, keyed by a hashable description of the call.
+
+    Only calls running at the same time are coalesced; a key is forgotten as
+    soon as its call finishes, so nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        """Return the future of ``key`` and whether the caller leads it."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                session_stats.increment("coalesced_requests")
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: Hashable) -> None:
+        """Forget ``key`` so that later calls run again."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def call(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Run ``function`` unless a call of ``key`` is in flight.
+
+        :param key: Identifies the call; equal keys mean identical calls.
+        :type key: Hashable
+        :param function: The call to run.
+        :type function: Callable[[], T]
+        :return: The result of this call or of the in-flight call of ``key``.
+        :rtype: T
+        :raises BaseException: The error raised by the call of ``key``.
+        """
+        future, leader = self._join(key)
+        while not leader:
+            try:
+                return future.result()
+            except CancelledError:
+                if not future.cancelled():
+                    raise
+            # The leader was cancelled; run the call again.
+            future, leader = self._join(key)
+        try:
+            result = function()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    async def acall(self, key: Hashable,
+                    function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``function()`` unless a call of ``key`` is in flight.
+
+        Waiting for a call led by another thread does not block the event
+        loop. If the leading task is cancelled, a waiting caller runs the
+        call itself instead of being cancelled too.
+
+        :param key: Identifies the call; equal keys mean identical calls.
+        :type key: Hashable
+        :param function: Returns the awaitable to run.
+        :type function: Callable[[], Awaitable[T]]
+        :return: The result of this call or of the in-flight call of ``key``.
+        :rtype: T
+        :raises BaseException: The error raised by the call of ``key``.
+        """
+        future, leader = self._join(key)
+        while not leader:
+            try:
+                # Shielded, so that a cancelled follower does not cancel the
+                # shared call.
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The leader was cancelled; run the call again.
+            future, leader = self._join(key)
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            # Only the leader was cancelled: its followers run the call again.
+            self._finish(key)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
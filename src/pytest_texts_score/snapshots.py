@@ -0,0 +1,212 @@
+"""
+Score snapshots: golden scores checked into the repository.
+
+The ``texts_score_snapshot`` fixture compares the scores of a text pair with
+a baseline stored in ``__snapshots__/<test module>.json`` next to the tests.
+Each entry records the precision, recall and F1 together with a hash of the
+texts, the version of the prompt templates and a hash of the scoring
+settings (see :func:`~pytest_texts_score.incremental.scoring_settings`):
+
+* with ``--texts-score-update-snapshots`` the texts are scored and the entry
+  is (re)written;
+* otherwise an entry whose texts, prompts and settings are unchanged passes
+  without calling the LLM, and only changed entries are re-scored and
+  compared with the baseline within a tolerance.
+"""
+import hashlib
+import json
+from pathlib import Path
+import threading
+from typing import Any, Optional
+
+import pytest
+
+from pytest_texts_score.evaluate_score import (
+    ScoreType,
+    texts_evaluate_scores,
+    texts_multiple_scores,
+)
+from pytest_texts_score.incremental import settings_hash
+from pytest_texts_score.plugin import get_config
+from pytest_texts_score.prompts import get_prompts_version
+from pytest_texts_score.stats import session_stats
+
+_SCORE_TYPES = [ScoreType.PRECISION, ScoreType.RECALL, ScoreType.F1]
+
+_lock = threading.Lock()
+
+
+def snapshot_path(test_path: Path) -> Path:
+    """
+    Return the snapshot file of a test module.
+
+    :param test_path: Path of the test module.
+    :type test_path: Path
+    :return: ``__snapshots__/<module name>.json`` next to the module.
+    :rtype: Path
+    """
+    return test_path.parent / "__snapshots__" / f"{test_path.stem}.json"
+
+
+def texts_hash(expected: str, given: str) -> str:
+    """
+    Return a short hash identifying a pair of texts.
+
+    :param expected: The reference text.
+    :type expected: str
+    :param given: The evaluated text.
+    :type given: str
+    :return: The first 16 hex digits of the SHA-256 of both texts.
+    :rtype: str
+    """
+    digest = hashlib.sha256(f"{expected}\0{given}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_snapshots(path: Path) -> dict[str, Any]:
+    """
+    Load a snapshot file.
+
+    :param path: The snapshot file.
+    :type path: Path
+    :return: The entries by key; empty if the file does not exist.
+    :rtype: dict[str, Any]
+    """
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_snapshot(path: Path, key: str, entry: dict[str, Any]) -> None:
+    """
+    Write one entry into a snapshot file, keeping the other entries.
+
+    :param path: The snapshot file.
+    :type path: Path
+    :param key: The entry key.
+    :type key: str
+    :param entry: The entry.
+    :type entry: dict[str, Any]
+    """
+    with _lock:
+        snapshots = load_snapshots(path)
+        snapshots[key] = entry
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(snapshots, indent=2, sort_keys=True) + "\n",
+                        encoding="utf-8")
+
+
+class TextsSnapshot:
+    """
+    Snapshot checks of one test, provided by the ``texts_score_snapshot``
+    fixture.
+
+    :param path: The snapshot file of the test module.
+    :type path: Path
+    :param test_name: The node id of the test within its module (e.g.
+                      ``TestClass::test_name[param]``), prefixing the entry
+                      keys.
+    :type test_name: str
+    :param update: Whether to write the snapshots instead of comparing.
+    :type update: bool
+    :param tolerance: The default allowed deviation from the baseline.
+    :type tolerance: float
+    """
+
+    def __init__(self, path: Path, test_name: str, update: bool,
+                 tolerance: float) -> None:
+        self.path = path
+        self.test_name = test_name
+        self.update = update
+        self.tolerance = tolerance
+        self._calls = 0
+
+    def check(self,
+              expected: str,
+              given: str,
+              name: Optional[str] = None,
+              tolerance: Optional[float] = None,
+              full_runs: int = 1,
+              each_question_runs: int = 1,
+              retry_on_error: bool = True) -> dict[str, float]:
+        """
+        Compare the scores of a pair of texts with the stored snapshot.
+
+        :param expected: The reference text.
+        :type expected: str
+        :param given: The text to evaluate.
+        :type given: str
+        :param name: Name of the entry within the test. Defaults to the index
+                     of the check within the test.
+        :type name: Optional[str]
+        :param tolerance: Allowed deviation of each score from the baseline.
+                          Defaults to ``llm_snapshot_tolerance``.
+        :type tolerance: Optional[float]
+        :param full_runs: Number of question runs; more than one compares
+                          the mean scores. Defaults to 1.
+        :type full_runs: int
+        :param each_question_runs: Number of answer runs per question set.
+                                   Defaults to 1.
+        :type each_question_runs: int
+        :param retry_on_error: If ``True``, retries LLM calls on failure.
+        :type retry_on_error: bool
+        :return: The scores by score type; the baseline if the entry is
+                 unchanged.
+        :rtype: dict[str, float]
+        """
+        key = f"{self.test_name}::{name if name is not None else self._calls}"
+        self._calls += 1
+        tolerance = self.tolerance if tolerance is None else tolerance
+        fingerprint = {
+            "texts": texts_hash(expected, given),
+            "prompts": get_prompts_version(),
+            "settings": settings_hash(get_config()),
+            "runs": [full_runs, each_question_runs],
+        }
+        baseline = load_snapshots(self.path).get(key)
+        if (not self.update and baseline is not None and all(
+                baseline.get(field) == value
+                for field, value in fingerprint.items())):
+            session_stats.increment("snapshots_unchanged")
+            return dict(baseline["scores"])
+        if not self.update and baseline is None:
+            pytest.fail(f"No texts-score snapshot `{key}` in {self.path}; "
+                        "run with --texts-score-update-snapshots to create it.")
+
+        scores = self._score(expected, given, full_runs, each_question_runs,
+                             retry_on_error)
+        if self.update:
+            save_snapshot(self.path, key, {**fingerprint, "scores": scores})
+            session_stats.increment("snapshots_updated")
+            return scores
+
+        violations = [
+            f"Text {score_type} deviates from snapshot `{key}`: "
+            f"{scores[score_type]:.2f} vs baseline {value:.2f} "
+            f"(tolerance {tolerance})."
+            for score_type, value in baseline["scores"].items()
+            if abs(scores[score_type] - value) > tolerance
+        ]
+        if violations:
+            pytest.fail("\n".join(violations) +
+                        f"\n`expected`: '{expected}'\n`given`: '{given}'")
+        return scores
+
+    def _score(self, expected: str, given: str, full_runs: int,
+               each_question_runs: int,
+               retry_on_error: bool) -> dict[str, float]:
+        """Score a pair of texts; the mean of the runs if there are several."""
+        if full_runs * each_question_runs == 1:
+            scores = texts_evaluate_scores(expected, given, _SCORE_TYPES,
+                                           retry_on_error)
+            return {
+                score_type.value: float(score)
+                for score_type, score in scores.items()
+            }
+        runs = texts_multiple_scores(expected, given, full_runs,
+                                     each_question_runs, _SCORE_TYPES,
+                                     retry_on_error)
+        return {
+            score_type.value: sum(scores) / len(scores)
+            for score_type, scores in runs.items()
+        }
@@ -0,0 +1,63 @@
+"""
+Session statistics reported by pytest-texts-score.
+
+Features such as hedged requests count what they did in the session-wide
+:data:`session_stats` counter; the plugin prints the non-zero counters in the
+terminal summary at the end of the test session.
+"""
+from collections import Counter
+import threading
+
+
+class SessionStats:
+    """Thread-safe named counters collected during a test session."""
+
+    def __init__(self) -> None:
+        self._counters: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """
+        Increase the counter ``name`` by ``amount``.
+
+        :param name: The counter name.
+        :type name: str
+        :param amount: The increment. Defaults to 1.
+        :type amount: int
+        """
+        with self._lock:
+            self._counters[name] += amount
+
+    def get(self, name: str) -> int:
+        """
+        Return the value of the counter ``name``.
+
+        :param name: The counter name.
+        :type name: str
+        :return: The counter value, 0 if it was never incremented.
+        :rtype: int
+        """
+        with self._lock:
+            return self._counters[name]
+
+    def snapshot(self) -> dict[str, int]:
+        """
+        Return a copy of all non-zero counters.
+
+        :return: Counter names mapped to their values.
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return {
+                name: value
+                for name, value in self._counters.items() if value
+            }
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._counters.clear()
+
+
+#: Counters of the running test session.
+session_stats = SessionStats()
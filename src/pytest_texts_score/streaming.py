@@ -0,0 +1,227 @@
+"""
+Streaming aggregation of run scores.
+
+Soak evaluations may run thousands of times. Instead of storing every score,
+a :class:`StreamingAggregator` updates constant-size summaries with each
+score: Welford's algorithm for the mean and variance, the running minimum and
+maximum, and the P² algorithm (Jain & Chlamtac, 1985) for the median and
+other percentiles of streams longer than a hundred scores. Pass one as
+``aggregator`` to ``texts_multiple_*`` and reduce it with ``scores_agg`` like
+a list of scores.
+"""
+import bisect
+import math
+from typing import Iterable, Optional
+
+
+class RunningStats:
+    """Count, mean, variance, minimum and maximum of a stream of values."""
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, value: float) -> None:
+        """Add a value (Welford's update)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def variance(self) -> float:
+        """The sample variance, 0 for fewer than two values."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """The sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """
+    Estimate of one quantile of a stream of values in constant memory.
+
+    The first ``exact_size`` values are kept, so that the quantile of short
+    streams is exact; the P² estimate is poor for few values. Once more values
+    arrive, the five P² markers are placed on the kept values and the values
+    are dropped.
+
+    :param quantile: The quantile to estimate, between 0 and 1.
+    :type quantile: float
+    :param exact_size: Number of values kept for an exact quantile. Defaults
+                       to 100.
+    :type exact_size: int
+    :raises ValueError: If ``quantile`` is outside [0, 1].
+    """
+
+    __slots__ = ("quantile", "exact_size", "_values", "_heights",
+                 "_positions", "_desired", "_increments")
+
+    def __init__(self, quantile: float, exact_size: int = 100) -> None:
+        if not 0 <= quantile <= 1:
+            raise ValueError(
+                f"`quantile` must be in range 0 to 1; {quantile} given.")
+        self.quantile = quantile
+        self.exact_size = max(5, exact_size)
+        self._values: Optional[list[float]] = []
+        self._heights: list[float] = []
+        self._positions: list[float] = []
+        self._desired: list[float] = []
+        p = quantile
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def update(self, value: float) -> None:
+        """Add a value."""
+        if self._values is not None:
+            bisect.insort(self._values, value)
+            if len(self._values) > self.exact_size:
+                self._place_markers()
+            return
+        q = self._heights
+        n = self._positions
+        if value < q[0]:
+            q[0] = value
+            cell = 0
+        elif value >= q[4]:
+            q[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if q[i] <= value < q[i + 1])
+        for i in range(cell + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        for i in range(1, 4):
+            offset = self._desired[i] - n[i]
+            if ((offset >= 1 and n[i + 1] - n[i] > 1)
+                    or (offset <= -1 and n[i - 1] - n[i] < -1)):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] -
+                                            q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _place_markers(self) -> None:
+        """Start the P² markers at their desired positions in the values."""
+        values, self._values = self._values, None
+        count = len(values)
+        self._desired = [
+            1 + (count - 1) * increment for increment in self._increments
+        ]
+        # Marker positions must be distinct whole positions.
+        self._positions = []
+        for i, desired in enumerate(self._desired):
+            lowest = self._positions[-1] + 1 if self._positions else 1
+            self._positions.append(
+                float(min(max(round(desired), lowest), count - 4 + i)))
+        self._heights = [values[int(n) - 1] for n in self._positions]
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Piecewise-parabolic prediction of marker ``i`` moved by ``step``."""
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self) -> float:
+        """
+        Return the current estimate.
+
+        :raises ValueError: If no value was added.
+        """
+        values = self._values
+        if values is None:
+            return self._heights[2]
+        if not values:
+            raise ValueError("No values were added.")
+        # Exact, linearly interpolated quantile of the values seen.
+        position = self.quantile * (len(values) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position -
+                                                                  lower)
+
+
+class StreamingAggregator:
+    """
+    Constant-memory summary of run scores supporting all aggregations.
+
+    :param percentiles: Percentiles (0-100) to track besides the median.
+    :type percentiles: Iterable[float]
+    """
+
+    def __init__(self, percentiles: Iterable[float] = ()) -> None:
+        self.stats = RunningStats()
+        self._quantiles = {
+            float(p): P2Quantile(p / 100)
+            for p in {50.0, *(float(p) for p in percentiles)}
+        }
+
+    def __len__(self) -> int:
+        return self.stats.count
+
+    def update(self, score: float) -> None:
+        """Add the score of one run."""
+        self.stats.update(score)
+        for quantile in self._quantiles.values():
+            quantile.update(score)
+
+    def extend(self, scores: Iterable[float]) -> None:
+        """Add the scores of several runs."""
+        for score in scores:
+            self.update(score)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Return the estimate of a tracked percentile.
+
+        :param percentile: The percentile, between 0 and 100.
+        :type percentile: float
+        :return: The estimated percentile of the scores.
+        :rtype: float
+        :raises ValueError: If the percentile is not tracked or no score was
+                            added.
+        """
+        quantile: Optional[P2Quantile] = self._quantiles.get(float(percentile))
+        if quantile is None:
+            raise ValueError(
+                f"Percentile {percentile} is not tracked; tracked: "
+                f"{sorted(self._quantiles)}.")
+        return quantile.value()
+
+    def aggregate(self, agg_type: str) -> float:
+        """
+        Return the scores reduced by an aggregation.
+
+        :param agg_type: ``"minimum"``, ``"maximum"``, ``"median"``,
+                         ``"average"`` or ``"mean"`` (an ``AggType``).
+        :type agg_type: str
+        :return: The aggregated score.
+        :rtype: float
+        :raises ValueError: If the aggregation is unknown or no score was
+                            added.
+        """
+        if not self.stats.count:
+            raise ValueError("No scores were added.")
+        match agg_type:
+            case "minimum":
+                return float(self.stats.minimum)
+            case "maximum":
+                return float(self.stats.maximum)
+            case "median":
+                return self.percentile(50)
+            case "average" | "mean":
+                return float(self.stats.mean)
+            case _:
+                raise ValueError(f"Unknown aggregation type: {agg_type}")
@@ -0,0 +1,179 @@
+"""
+Token counting helpers.
+
+Prompt sizes are counted locally, without a round trip to the LLM. When the
+optional ``tiktoken`` package is installed (it is a dependency of
+``langchain-openai``) and the encoding of the model is available, tokens are
+counted exactly; otherwise they are estimated using the common rule of thumb
+of about four characters per token of English text.
+
+The counts are used to size ``max_tokens`` of each request from its expected
+output and to fail early when a prompt would not fit into the context window.
+"""
+from functools import lru_cache
+import math
+import threading
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on the environment
+    tiktoken = None
+
+#: Average number of characters per token used for estimates.
+CHARS_PER_TOKEN = 4
+#: Tokens added by the chat format for each message.
+TOKENS_PER_MESSAGE = 4
+#: Encoding used for models unknown to ``tiktoken``.
+DEFAULT_ENCODING = "o200k_base"
+#: Seconds to wait for a ``tiktoken`` encoding before estimating instead.
+ENCODING_LOAD_TIMEOUT = 10.0
+#: Output tokens per answered question besides the question itself
+#: (JSON keys, quotes and the numeric answer).
+ANSWER_OVERHEAD_TOKENS = 16
+#: Output tokens expected per token of the text questions are generated from.
+QUESTION_TOKENS_PER_TEXT_TOKEN = 6
+#: Output tokens expected per generated question.
+TOKENS_PER_QUESTION = 32
+#: Fixed output tokens reserved for every response (JSON braces, slack).
+RESPONSE_BASE_TOKENS = 256
+
+
+class PromptTooLongError(ValueError):
+    """Raised when a prompt and its expected output exceed the context window."""
+
+
+def _load_encoding(model: Optional[str], loaded: list[Any]) -> None:
+    """Add the ``tiktoken`` encoding of ``model`` (or ``None``) to ``loaded``."""
+    try:
+        loaded.append(tiktoken.encoding_for_model(model or ""))
+        return
+    except Exception:
+        pass
+    try:
+        loaded.append(tiktoken.get_encoding(DEFAULT_ENCODING))
+    except Exception:
+        loaded.append(None)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: Optional[str]) -> Any:
+    """
+    Return the ``tiktoken`` encoding of ``model``, or ``None``.
+
+    The encoding files are downloaded on first use. Offline, the download
+    fails or stalls, so the encoding is loaded in a daemon thread for at most
+    :data:`ENCODING_LOAD_TIMEOUT` seconds and token counts fall back to the
+    estimate otherwise.
+    """
+    if tiktoken is None:
+        return None
+    loaded: list[Any] = []
+    thread = threading.Thread(target=_load_encoding,
+                              args=(model, loaded),
+                              daemon=True)
+    thread.start()
+    thread.join(ENCODING_LOAD_TIMEOUT)
+    return loaded[0] if loaded else None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens of ``text``.
+
+    :param text: The text to measure.
+    :type text: str
+    :param model: The model whose tokenizer to use, if known.
+    :type model: Optional[str]
+    :return: The exact token count if a tokenizer is available, otherwise an
+             estimate.
+    :rtype: int
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: list[dict[str, str]],
+                         model: Optional[str] = None) -> int:
+    """
+    Count the prompt tokens of a list of chat messages.
+
+    :param messages: The chat messages.
+    :type messages: list[dict[str, str]]
+    :param model: The model whose tokenizer to use, if known.
+    :type model: Optional[str]
+    :return: The prompt token count.
+    :rtype: int
+    """
+    return sum(
+        TOKENS_PER_MESSAGE + count_tokens(message["content"], model)
+        for message in messages) + 3
+
+
+def estimate_questions_output_tokens(text_tokens: int,
+                                     max_questions: Optional[int] = None
+                                     ) -> int:
+    """
+    Estimate the output tokens needed to generate questions for a text.
+
+    :param text_tokens: Number of tokens of the text.
+    :type text_tokens: int
+    :param max_questions: The question budget, if any.
+    :type max_questions: Optional[int]
+    :return: The expected number of output tokens.
+    :rtype: int
+    """
+    expected = QUESTION_TOKENS_PER_TEXT_TOKEN * text_tokens
+    if max_questions is not None:
+        expected = min(expected, TOKENS_PER_QUESTION * max_questions)
+    return RESPONSE_BASE_TOKENS + expected
+
+
+def estimate_answers_output_tokens(questions: list[str],
+                                   model: Optional[str] = None) -> int:
+    """
+    Estimate the output tokens needed to answer a list of questions.
+
+    The answer echoes every question followed by its numeric answer.
+
+    :param questions: The questions to answer.
+    :type questions: list[str]
+    :param model: The model whose tokenizer to use, if known.
+    :type model: Optional[str]
+    :return: The expected number of output tokens.
+    :rtype: int
+    """
+    return RESPONSE_BASE_TOKENS + sum(
+        count_tokens(question, model) + ANSWER_OVERHEAD_TOKENS
+        for question in questions)
+
+
+def fit_max_tokens(prompt_tokens: int, max_tokens: int, context_window: int,
+                   required_tokens: int) -> int:
+    """
+    Fit ``max_tokens`` of a request into the context window.
+
+    :param prompt_tokens: Number of prompt tokens of the request.
+    :type prompt_tokens: int
+    :param max_tokens: The desired maximum number of output tokens.
+    :type max_tokens: int
+    :param context_window: Context window of the model in tokens.
+    :type context_window: int
+    :param required_tokens: Output tokens the request needs at least.
+    :type required_tokens: int
+    :return: ``max_tokens``, lowered to what is left of the context window.
+    :rtype: int
+    :raises PromptTooLongError: If the prompt and ``required_tokens`` do not
+                                fit into the context window.
+    """
+    available = context_window - prompt_tokens
+    if available < required_tokens:
+        raise PromptTooLongError(
+            f"Prompt of {prompt_tokens} tokens plus {required_tokens} expected "
+            f"output tokens exceeds the context window of {context_window} "
+            "tokens. Shorten the texts, or enable chunking "
+            "(llm_questions_chunk_tokens) or retrieval "
+            "(llm_answers_retrieval_top_k).")
+    return min(max_tokens, available)
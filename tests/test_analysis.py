@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+
+from pytest_texts_score.analysis import ScoreAnalysis, texts_analyze_one_side
+from pytest_texts_score.records import (
+    QuestionAnswers,
+    QuestionTable,
+    mean_answer,
+)
+
+numpy = pytest.importorskip("numpy")
+
+
+def make_answers(answers: dict[str, float]) -> QuestionAnswers:
+    """Build answers to the questions in ``answers``."""
+    return QuestionAnswers.from_items(
+        QuestionTable(answers), [{
+            "question": question,
+            "answer": answer
+        } for question, answer in answers.items()])
+
+
+# Test for ScoreAnalysis
+# Expected behavior: The matrix aligns questions across the answer runs of a set and finds unstable ones
+def test_score_analysis():
+    analysis = ScoreAnalysis([
+        make_answers({"Does it say A?": 1, "Does it say B?": 1}),
+        make_answers({"does it say a": 1, "Does it say B?": 0}),
+        make_answers({"Does it say A?": 1, "Does it say C?": 0}),
+        make_answers({"Does it say D?": 1}),
+    ], question_runs=[0, 0, 0, 1])
+
+    assert analysis.questions == [
+        "Does it say A?", "Does it say B?", "Does it say C?", "Does it say D?"
+    ]
+    assert [matrix.shape for matrix in analysis.matrices] == [(3, 3), (1, 1)]
+    assert list(analysis.run_scores) == [1.0, 0.5, 0.5, 1.0]
+    aggregates = analysis.aggregates(percentiles=(50,))
+    assert aggregates["minimum"] == 0.5 and aggregates["p50"] == 0.75
+    variance = analysis.question_variance()
+    assert list(variance[:2]) == [0.0, 0.25]
+    assert all(numpy.isnan(variance[2:]))
+    assert analysis.unstable_questions() == [("Does it say B?", 0.25, 0.5)]
+    low, high = analysis.bootstrap_ci(seed=1)
+    assert 0.5 <= low <= high <= 1.0
+
+
+# Test for ScoreAnalysis row means
+# Expected behavior: A repeated question keeps one column per occurrence, so a row mean is the run score
+def test_score_analysis_row_mean_is_run_score():
+    table = QuestionTable(["Does it say A?", "Does it say B?"])
+    answers = QuestionAnswers.from_items(table, [
+        {"question": "Does it say A?", "answer": 1},
+        {"question": "Does it say A?", "answer": 1},
+        {"question": "Does it say B?", "answer": 0},
+    ])
+
+    analysis = ScoreAnalysis([answers])
+
+    assert analysis.matrices[0].shape == (1, 3)
+    assert numpy.nanmean(analysis.matrices[0], axis=1)[0] == mean_answer(answers)
+    assert analysis.run_scores[0] == mean_answer(answers)
+
+
+# Test for texts_analyze_one_side
+# Expected behavior: Every answer run of every question set becomes a matrix row
+@patch('pytest_texts_score.analysis.evaluate_questions')
+@patch('pytest_texts_score.analysis.make_questions')
+def test_texts_analyze_one_side(mock_make_questions, mock_evaluate_questions):
+    mock_make_questions.return_value = "questions"
+    mock_evaluate_questions.return_value = make_answers({"Does it say A?": 1})
+
+    analysis = texts_analyze_one_side("base", "answer", 2, 3)
+
+    assert [matrix.shape for matrix in analysis.matrices] == [(3, 1), (3, 1)]
+    assert mock_make_questions.call_count == 2
+    assert mock_evaluate_questions.call_count == 6
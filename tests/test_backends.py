@@ -0,0 +1,476 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pytest_texts_score.backends import (
+    CallableBackend,
+    OpenAIChatBackend,
+    create_backend,
+    load_callable,
+)
+from pytest_texts_score.breaker import BreakerState, CircuitBreaker
+from pytest_texts_score.communication import (
+    acomplete,
+    evaluate_questions,
+    make_questions,
+)
+from pytest_texts_score.hedging import LatencyTracker, hedged_complete
+from pytest_texts_score.pool import BackendPool, PoolMember, parse_pool_member
+from pytest_texts_score.singleflight import SingleFlight
+from pytest_texts_score.stats import session_stats
+
+
+def echo_completion(messages, model, max_tokens, temperature):
+    """Completion callable returning the user message content."""
+    return messages[-1]["content"]
+
+
+# Test for CallableBackend
+# Expected behavior: The callable receives the chat request and its reply is returned
+def test_callable_backend_complete():
+    backend = CallableBackend(echo_completion)
+
+    result = backend.complete(messages=[{
+        "role": "user",
+        "content": "hello"
+    }],
+                              model="m",
+                              max_tokens=10)
+
+    assert result == "hello"
+    assert backend.max_concurrency == 1
+
+
+# Test for LLMBackend
+# Expected behavior: The base class cannot be used without implementing complete
+def test_llm_backend_is_abstract():
+    from pytest_texts_score.backends import LLMBackend
+
+    with pytest.raises(TypeError):
+        LLMBackend()
+
+
+# Test for the texts_score_client and texts_score_backend fixtures
+# Expected behavior: The client fixture keeps returning the openai client
+def test_texts_score_fixtures(texts_score_client, texts_score_backend):
+    from openai import AzureOpenAI
+
+    assert isinstance(texts_score_client, AzureOpenAI)
+    assert texts_score_backend.client is texts_score_client
+
+
+# Test for OpenAIChatBackend
+# Expected behavior: Empty model content is returned as an empty string
+def test_openai_chat_backend_empty_content():
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices[
+        0].message.content = None
+    backend = OpenAIChatBackend(client)
+
+    assert backend.complete(messages=[], model="m", max_tokens=10) == ""
+    client.chat.completions.create.assert_called_once_with(model="m",
+                                                           messages=[],
+                                                           max_tokens=10,
+                                                           temperature=0)
+
+
+# Test for load_callable
+# Expected behavior: Valid paths are imported, malformed ones raise UsageError
+def test_load_callable():
+    assert load_callable("json:dumps").__name__ == "dumps"
+    with pytest.raises(pytest.UsageError):
+        load_callable("json.dumps")
+    with pytest.raises(pytest.UsageError):
+        load_callable("json:does_not_exist")
+
+
+# Test for create_backend
+# Expected behavior: An unknown backend type raises UsageError
+def test_create_backend_unknown():
+    config = MagicMock(_llm_backend="bedrock")
+    with pytest.raises(pytest.UsageError, match="bedrock"):
+        create_backend(config)
+
+
+# Test for communication through the backend
+# Expected behavior: make_questions and evaluate_questions use backend.complete
+@patch('pytest_texts_score.communication.get_client')
+def test_communication_uses_backend(mock_get_client):
+    mock_get_client.return_value.complete.side_effect = [
+        '{"1": "Does the text say foo?"}',
+        '{"list": [{"question": "Does the text say foo?", "answer": 1}]}',
+    ]
+
+    questions = make_questions("foo")
+    answers = evaluate_questions("foo", questions)
+
+    assert questions == '{"1": "Does the text say foo?"}'
+    assert answers == [{"question": "Does the text say foo?", "answer": 1}]
+    assert mock_get_client.return_value.complete.call_count == 2
+
+
+# Test for per-stage model routing
+# Expected behavior: Questions and answers use their own backend, model and max_tokens
+@patch('pytest_texts_score.communication.get_client')
+def test_stage_routing(mock_get_client, monkeypatch):
+    from pytest_texts_score.client import LLMStage
+    from pytest_texts_score.plugin import get_config
+
+    config = get_config()
+    monkeypatch.setattr(config, "_llm_questions_model", "big-model")
+    monkeypatch.setattr(config, "_llm_questions_max_tokens", 4000)
+    monkeypatch.setattr(config, "_llm_answers_model", "fast-model")
+    monkeypatch.setattr(config, "_llm_answers_max_tokens", 1000)
+    mock_get_client.return_value.complete.side_effect = [
+        '{"1": "Does the text say foo?"}',
+        '{"list": []}',
+    ]
+
+    evaluate_questions("foo", make_questions("foo"))
+
+    stages = [c.args for c in mock_get_client.call_args_list]
+    assert stages == [(LLMStage.QUESTIONS,), (LLMStage.ANSWERS,)]
+    calls = mock_get_client.return_value.complete.call_args_list
+    assert calls[0].kwargs["model"] == "big-model"
+    assert calls[0].kwargs["max_tokens"] == 4000
+    assert calls[1].kwargs["model"] == "fast-model"
+    assert calls[1].kwargs["max_tokens"] == 1000
+
+
+# Test for init_client with a dedicated answers deployment
+# Expected behavior: Only the stage with its own deployment gets a new backend
+def test_init_client_stage_deployments(monkeypatch):
+    from pytest_texts_score.client import LLMStage, get_client, init_client
+    from pytest_texts_score.plugin import get_config
+
+    config = get_config()
+    monkeypatch.setattr(config, "_llm_answers_deployment", "fast-deployment")
+    try:
+        default = init_client(config)
+        assert get_client(LLMStage.QUESTIONS) is default
+        assert get_client(LLMStage.ANSWERS) is not default
+    finally:
+        monkeypatch.undo()
+        init_client(config)
+
+
+# Test for init_client with a stage deployment and another backend
+# Expected behavior: Stage deployments that would be ignored are rejected
+@pytest.mark.parametrize("setting, value", [("_llm_backend", "openai"),
+                                            ("_llm_pool", ["endpoint=https://a"])])
+def test_init_client_rejects_ignored_stage_deployment(monkeypatch, setting,
+                                                      value):
+    from pytest_texts_score.client import init_client
+    from pytest_texts_score.plugin import get_config
+
+    config = get_config()
+    monkeypatch.setattr(config, "_llm_answers_deployment", "fast-deployment")
+    monkeypatch.setattr(config, setting, value)
+
+    with pytest.raises(pytest.UsageError, match="llm_answers_deployment"):
+        init_client(config)
+
+
+def make_pool_member(name, reply="ok", max_rpm=None):
+    """Create a pool member backed by a callable returning ``reply``."""
+    backend = CallableBackend(MagicMock(return_value=reply))
+    return PoolMember(backend, name, max_rpm)
+
+
+# Test for BackendPool routing
+# Expected behavior: Untried members are used first, then the fastest one
+def test_pool_routes_to_lowest_latency():
+    slow, fast = make_pool_member("slow"), make_pool_member("fast")
+    pool = BackendPool([slow, fast])
+
+    assert pool.acquire() is slow
+    assert pool.acquire() is fast
+    pool.release(slow, 2.0)
+    pool.release(fast, 0.5)
+
+    assert pool.acquire() is fast
+    assert pool.acquire(exclude=[fast]) is slow
+
+
+# Test for BackendPool ejection
+# Expected behavior: A member failing repeatedly is skipped until ejection ends
+def test_pool_ejects_failing_member():
+    broken, healthy = make_pool_member("broken"), make_pool_member("healthy")
+    broken.backend.function.side_effect = Exception("Always fails")
+    pool = BackendPool([broken, healthy], eject_after=2, eject_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="Always fails"):
+            pool.complete_on(pool.acquire(exclude=[healthy]),
+                             messages=[],
+                             model="m",
+                             max_tokens=10)
+
+    assert broken.is_ejected(time.monotonic())
+    assert pool.complete(messages=[], model="m", max_tokens=10) == "ok"
+    assert healthy.requests == 1
+
+
+# Test for BackendPool rate limits
+# Expected behavior: A member at its per-minute limit is not chosen
+def test_pool_respects_rate_limit():
+    limited, other = make_pool_member("limited", max_rpm=1), make_pool_member(
+        "other")
+    pool = BackendPool([limited, other])
+    pool.release(pool.acquire(exclude=[limited]), 5.0)
+
+    assert pool.acquire() is limited
+    pool.release(limited, 0.1)
+    assert pool.acquire() is other
+
+
+# Test for parse_pool_member
+# Expected behavior: key=value pairs are parsed, other tokens are rejected
+def test_parse_pool_member():
+    assert parse_pool_member("endpoint=https://a deployment=d rpm=60") == {
+        "endpoint": "https://a",
+        "deployment": "d",
+        "rpm": "60",
+    }
+    with pytest.raises(pytest.UsageError):
+        parse_pool_member("https://a d")
+
+
+# Test for CircuitBreaker opening
+# Expected behavior: After the error rate is reached, calls fail without reaching the LLM
+def test_circuit_breaker_opens_and_fails_fast():
+    breaker = CircuitBreaker(error_rate=0.5, window=4, min_calls=4, cooldown=60)
+    function = MagicMock(side_effect=Exception("Endpoint down"))
+
+    for _ in range(4):
+        with pytest.raises(Exception, match="Endpoint down"):
+            breaker.call(function)
+
+    assert breaker.state == BreakerState.OPEN
+    with pytest.raises(pytest.fail.Exception, match="circuit breaker is open"):
+        breaker.call(function)
+    assert function.call_count == 4
+
+
+# Test for CircuitBreaker skip action
+# Expected behavior: An open breaker skips the test instead of failing it
+def test_circuit_breaker_skip_action():
+    breaker = CircuitBreaker(error_rate=1, window=1, min_calls=1, action="skip")
+    with pytest.raises(Exception):
+        breaker.call(MagicMock(side_effect=Exception("Endpoint down")))
+
+    with pytest.raises(pytest.skip.Exception):
+        breaker.call(MagicMock())
+
+
+# Test for CircuitBreaker half-open probing
+# Expected behavior: After the cooldown one probe is let through and closes the breaker
+def test_circuit_breaker_half_open_recovers():
+    breaker = CircuitBreaker(error_rate=1, window=1, min_calls=1, cooldown=0)
+    with pytest.raises(Exception):
+        breaker.call(MagicMock(side_effect=Exception("Endpoint down")))
+    assert breaker.state == BreakerState.OPEN
+
+    assert breaker.call(MagicMock(return_value="ok")) == "ok"
+    assert breaker.state == BreakerState.CLOSED
+
+
+class StatusError(Exception):
+    """API error carrying an HTTP status code."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+# Test for CircuitBreaker error classification
+# Expected behavior: Only transient errors count towards the error rate
+def test_circuit_breaker_ignores_client_errors():
+    from pytest_texts_score.tokens import PromptTooLongError
+
+    breaker = CircuitBreaker(error_rate=0.5, window=4, min_calls=2, cooldown=60)
+
+    for error in (StatusError(400), StatusError(401),
+                  PromptTooLongError("Prompt too long")):
+        with pytest.raises(type(error)):
+            breaker.call(MagicMock(side_effect=error))
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.current_error_rate() == 0
+
+    for error in (StatusError(429), StatusError(503)):
+        with pytest.raises(StatusError):
+            breaker.call(MagicMock(side_effect=error))
+    assert breaker.state == BreakerState.OPEN
+
+
+# Test for CircuitBreaker half-open probing
+# Expected behavior: A probe interrupted by a BaseException lets the next call probe
+def test_circuit_breaker_probe_interrupted():
+    breaker = CircuitBreaker(error_rate=1, window=1, min_calls=1, cooldown=0)
+    with pytest.raises(Exception):
+        breaker.call(MagicMock(side_effect=Exception("Endpoint down")))
+
+    with pytest.raises(KeyboardInterrupt):
+        breaker.call(MagicMock(side_effect=KeyboardInterrupt))
+
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.call(MagicMock(return_value="ok")) == "ok"
+    assert breaker.state == BreakerState.CLOSED
+
+
+# Test for hedged requests without enough latency samples
+# Expected behavior: The request is sent once and its latency recorded
+def test_hedged_complete_without_samples():
+    backend = CallableBackend(MagicMock(return_value="ok"))
+    tracker = LatencyTracker()
+
+    result = hedged_complete(backend, {
+        "messages": [],
+        "model": "m",
+        "max_tokens": 10
+    },
+                             tracker,
+                             min_samples=1)
+
+    assert result == "ok"
+    assert backend.function.call_count == 1
+    assert tracker.percentile(50, 1) is not None
+
+
+# Test for hedged requests to a pool
+# Expected behavior: A slow request is duplicated to another member, which wins
+def test_hedged_complete_uses_other_pool_member():
+    slow = make_pool_member("slow")
+    slow.backend.function.side_effect = lambda **kwargs: time.sleep(1) or "slow"
+    fast = make_pool_member("fast", reply="fast")
+    pool = BackendPool([slow, fast])
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.record(0.01)
+    hedges = session_stats.get("hedged_requests")
+
+    result = hedged_complete(pool, {
+        "messages": [],
+        "model": "m",
+        "max_tokens": 10
+    },
+                             tracker,
+                             min_samples=5)
+
+    assert result == "fast"
+    assert session_stats.get("hedged_requests") == hedges + 1
+
+
+class FirstTaskExecutor:
+    """Executor running its first task and queuing the others forever."""
+
+    def __init__(self):
+        self.queued = []
+        self.started = False
+
+    def submit(self, function, *args, **kwargs):
+        if self.started:
+            self.queued.append(Future())
+            return self.queued[-1]
+        self.started = True
+        return ThreadPoolExecutor(max_workers=1).submit(function, *args, **kwargs)
+
+
+# Test for hedged requests to a pool
+# Expected behavior: A hedge cancelled while queued reserves no pool member
+def test_hedged_complete_cancelled_hedge_releases_nothing():
+    slow = make_pool_member("slow")
+    slow.backend.function.side_effect = lambda **kwargs: time.sleep(0.2) or "slow"
+    fast = make_pool_member("fast", reply="fast")
+    pool = BackendPool([slow, fast])
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.record(0.01)
+
+    executor = FirstTaskExecutor()
+
+    with patch("pytest_texts_score.hedging._executor", executor):
+        result = hedged_complete(pool, {
+            "messages": [],
+            "model": "m",
+            "max_tokens": 10
+        },
+                                 tracker,
+                                 min_samples=5)
+
+    assert result == "slow"
+    assert [future.cancelled() for future in executor.queued] == [True]
+    assert [member.in_flight for member in pool.members] == [0, 0]
+
+
+# Test for SingleFlight.call
+# Expected behavior: Concurrent identical calls run once and share the result or error
+def test_single_flight_threads():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    before = session_stats.get("coalesced_requests")
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flight.call, "key", slow) for _ in range(4)]
+        while session_stats.get("coalesced_requests") < before + 3:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    with pytest.raises(ZeroDivisionError):
+        flight.call("key", lambda: 1 / 0)
+    assert flight.call("key", lambda: "again") == "again"
+
+
+# Test for SingleFlight.acall
+# Expected behavior: Asyncio tasks join a call led by another task
+def test_single_flight_asyncio():
+    flight = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*(flight.acall("key", slow)
+                                      for _ in range(3)))
+
+    assert asyncio.run(run()) == ["result"] * 3
+    assert len(calls) == 1
+
+
+# Test for SingleFlight.acall with a cancelled leader
+# Expected behavior: A follower of a cancelled leader sends the request itself
+@patch('pytest_texts_score.communication._send')
+def test_acomplete_leader_cancelled(mock_send):
+    from pytest_texts_score.client import LLMStage
+
+    mock_send.side_effect = lambda *args: time.sleep(0.05) or "reply"
+
+    async def run():
+        first = asyncio.create_task(
+            acomplete(LLMStage.ANSWERS, "system", "user", 10))
+        second = asyncio.create_task(
+            acomplete(LLMStage.ANSWERS, "system", "user", 10))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "reply"
+    assert mock_send.call_count == 2
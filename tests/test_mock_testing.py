@@ -36,6 +36,7 @@ from pytest_texts_score.evaluate_score import (
     texts_multiple_precision,
     texts_multiple_recall,
 )
+from pytest_texts_score.tokens import PromptTooLongError
 
 
 # Test for texts_agg_f1_mean
@@ -508,6 +509,28 @@ def test_texts_multiple_precision_retry_succeeds(mock_make_questions,
                                                     "successful questions")
 
 
+# Test for retry mechanism in texts_multiple_precision
+# Expected behavior: A question run failing after some answer runs is retried
+# as a whole and its earlier answer runs are not kept twice
+@patch('pytest_texts_score.evaluate_score.evaluate_questions')
+@patch('pytest_texts_score.evaluate_score.make_questions')
+def test_texts_multiple_precision_retry_partial_run(mock_make_questions,
+                                                    mock_evaluate_questions):
+    mock_make_questions.return_value = "questions"
+    mock_evaluate_questions.side_effect = [[{
+        "answer": 1.0
+    }], Exception("Answering failed"), [{
+        "answer": 0.5
+    }], [{
+        "answer": 0.25
+    }]]
+
+    result = texts_multiple_precision("expected", "given", 1, 2,
+                                      score_only=False)
+
+    assert list(result) == [(0, 0, 0.5), (0, 1, 0.25)]
+
+
 # Test for retry mechanism in texts_multiple_precision when it always fails
 # Expected behavior: Retries until max retries and then raises an exception
 @patch('pytest_texts_score.evaluate_score.make_questions')
@@ -562,3 +585,609 @@ def test_texts_multiple_recall_retry_fails(mock_make_questions):
 
     # Verify make_questions was called MAXIMAL_RETRY_ON_ERROR + 1 times
     assert mock_make_questions.call_count == MAXIMAL_RETRY_ON_ERROR + 1
+
+
+# Test for retry mechanism in score_one_side with a prompt that is too long
+# Expected behavior: The error is raised at once, without retries
+@patch('pytest_texts_score.evaluate_score.make_questions')
+def test_score_one_side_prompt_too_long_not_retried(mock_make_questions):
+    # Configure make_questions to fail the context window check
+    mock_make_questions.side_effect = PromptTooLongError("Too long")
+
+    with pytest.raises(PromptTooLongError):
+        score_one_side("base", "answer", retry_on_error=True)
+
+    # Verify make_questions was called only once
+    assert mock_make_questions.call_count == 1
+
+
+# Test for the answer cache of texts_multiple_recall
+# Expected behavior: Only questions new in a regenerated set are sent for answering
+@patch('pytest_texts_score.evaluate_score.evaluate_questions')
+@patch('pytest_texts_score.evaluate_score.make_questions')
+def test_texts_multiple_recall_answer_cache(mock_make_questions,
+                                            mock_evaluate_questions,
+                                            monkeypatch):
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.questions import dump_questions, parse_questions
+
+    monkeypatch.setattr(get_config(), "_llm_answer_cache", True)
+    mock_make_questions.side_effect = [
+        dump_questions(["Does the text say A?", "Does the text say B?"]),
+        dump_questions(["Does the text say a?", "Does the text say C?"]),
+    ]
+    mock_evaluate_questions.side_effect = lambda text, questions: [{
+        "question": q,
+        "answer": 1 if q.endswith("A?") else 0
+    } for q in parse_questions(questions)]
+
+    scores = texts_multiple_recall("expected", "given", 2, 1)
+
+    assert scores == [0.5, 0.5]
+    assert mock_evaluate_questions.call_args_list[1] == call(
+        "given", dump_questions(["Does the text say C?"]))
+
+
+# Test for the session score store
+# Expected behavior: Each directed pair is scored once unless a fresh score is requested
+@patch('pytest_texts_score.evaluate_score.score_one_side')
+def test_score_store_reuses_directed_pairs(mock_score_one_side, monkeypatch):
+    from pytest_texts_score.cache import score_store
+    from pytest_texts_score.evaluate_score import (
+        texts_evaluate_f1,
+        texts_evaluate_precision,
+        texts_evaluate_recall,
+    )
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_score_store", True)
+    score_store.clear()
+    mock_score_one_side.side_effect = [0.5, 1.0, 0.25]
+
+    assert texts_evaluate_precision("store A", "store B") == 0.5
+    assert texts_evaluate_recall("store B", "store A") == 0.5
+    assert texts_evaluate_f1("store A", "store B") == pytest.approx(2 / 3)
+    assert texts_evaluate_precision("store A", "store B", fresh=True) == 0.25
+
+    assert mock_score_one_side.call_args_list == [
+        call("store B", "store A", retry_on_error=True, reference=False),
+        call("store A", "store B", retry_on_error=True, reference=True),
+        call("store B", "store A", retry_on_error=True, reference=False),
+    ]
+    score_store.clear()
+
+
+# Test for the session score store with a question bank
+# Expected behavior: Reference scores with bank questions are not shared with
+# scores of generated questions
+@patch('pytest_texts_score.evaluate_score.score_one_side')
+def test_score_store_separates_question_bank(mock_score_one_side, monkeypatch,
+                                             tmp_path):
+    from pytest_texts_score.cache import score_store
+    from pytest_texts_score.evaluate_score import (
+        texts_evaluate_precision,
+        texts_evaluate_recall,
+    )
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.question_bank import use_question_bank
+
+    monkeypatch.setattr(get_config(), "_llm_score_store", True)
+    score_store.clear()
+    mock_score_one_side.side_effect = [0.5, 0.75]
+
+    assert texts_evaluate_precision("store A", "store B") == 0.5
+    with use_question_bank(tmp_path / "bank.json"):
+        assert texts_evaluate_recall("store B", "store A") == 0.75
+        assert texts_evaluate_recall("store B", "store A") == 0.75
+        assert texts_evaluate_precision("store A", "store B") == 0.5
+
+    assert mock_score_one_side.call_count == 2
+    score_store.clear()
+
+
+# Test for texts_expect_scores
+# Expected behavior: Each side is scored once and all violated ranges are reported
+@patch('pytest_texts_score.evaluate_score.score_one_side')
+def test_texts_expect_scores_mock(mock_score_one_side):
+    from pytest_texts_score import texts_expect_scores
+    from pytest_texts_score.evaluate_score import ScoreType
+
+    mock_score_one_side.side_effect = [0.5, 1.0]
+
+    with pytest.raises(pytest.fail.Exception) as excinfo:
+        texts_expect_scores("expected",
+                            "given",
+                            precision=(0.8, 1.0),
+                            recall=(0.0, 0.9),
+                            f1=(0.5, 1.0))
+
+    assert mock_score_one_side.call_count == 2
+    message = str(excinfo.value)
+    assert f"{ScoreType.PRECISION} below minimum: 0.50 < 0.8" in message
+    assert f"{ScoreType.RECALL} above maximum: 1.00 > 0.9" in message
+    assert f"{ScoreType.F1}" not in message
+    with pytest.raises(pytest.UsageError):
+        texts_expect_scores("expected", "given")
+
+
+# Test for texts_agg_scores
+# Expected behavior: One set of runs is aggregated for every requested score
+@patch('pytest_texts_score.evaluate_score.texts_multiple_f1')
+def test_texts_agg_scores_mock(mock_texts_multiple_f1):
+    from pytest_texts_score import texts_agg_scores
+
+    from pytest_texts_score.records import RunScores
+
+    runs = RunScores(("precision", "recall", "f1"))
+    runs.append(0, 0, 1.0, 0.5, 2 / 3)
+    runs.append(1, 0, 0.5, 0.5, 0.5)
+    mock_texts_multiple_f1.return_value = runs
+
+    texts_agg_scores("expected",
+                     "given",
+                     "minimum",
+                     precision=(0.5, 1.0),
+                     f1=(0.5, 1.0),
+                     full_runs=2)
+
+    mock_texts_multiple_f1.assert_called_once_with("expected", "given", 2, 1,
+                                                   False, True)
+    with pytest.raises(pytest.fail.Exception, match="below minimum: 0.50"):
+        texts_agg_scores("expected",
+                         "given",
+                         "mean",
+                         precision=(0.5, 1.0),
+                         recall=(0.6, 1.0),
+                         full_runs=2)
+
+
+# Test for AggregatedScores
+# Expected behavior: Several aggregations are computed from the same run scores
+def test_aggregated_scores():
+    from pytest_texts_score import AggregatedScores
+
+    scores = AggregatedScores([0.2, 0.6, 0.8, 0.9, 1.0])
+
+    assert scores.min() == 0.2
+    assert scores.aggregate("median") == 0.8
+    assert scores.mean() == pytest.approx(0.7)
+    assert scores.percentile(25) == pytest.approx(0.6)
+    assert scores.percentile(10) == pytest.approx(0.36)
+    assert scores.trimmed_mean(0.2) == pytest.approx(0.7667, abs=1e-4)
+    assert scores.aggregate("p50") == 0.8
+    with pytest.raises(ValueError):
+        scores.aggregate("mode")
+
+
+# Test for texts_agg_runs
+# Expected behavior: One set of runs is checked against several aggregations
+@patch('pytest_texts_score.evaluate_score.texts_multiple_precision')
+def test_texts_agg_runs_mock(mock_texts_multiple_precision):
+    from pytest_texts_score import texts_agg_runs
+
+    mock_texts_multiple_precision.return_value = [1, 1, 0.5, 0.75]
+
+    result = texts_agg_runs("expected", "given", "precision", full_runs=4)
+    result.expect(mean=(0.8, 1.0), maximum=(1.0, 1.0))
+
+    with pytest.raises(pytest.fail.Exception) as excinfo:
+        result.expect(minimum=(0.6, 1.0), p25=(0.7, 1.0), median=(0.85, 1.0))
+    message = str(excinfo.value)
+    assert "minimum below minimum: 0.50 < 0.6" in message
+    assert "p25" in message and "median" not in message
+    mock_texts_multiple_precision.assert_called_once()
+
+
+# Test for confidence intervals
+# Expected behavior: t quantiles match tables and both intervals cover the mean
+def test_confidence_interval():
+    from pytest_texts_score.confidence import confidence_interval, t_quantile
+
+    assert t_quantile(0.975, 1) == pytest.approx(12.706, abs=1e-3)
+    assert t_quantile(0.975, 2) == pytest.approx(4.303, abs=1e-3)
+    assert t_quantile(0.995, 3) == pytest.approx(5.841, abs=1e-3)
+    assert t_quantile(0.975, 4) == pytest.approx(2.776, abs=1e-3)
+    assert t_quantile(0.995, 9) == pytest.approx(3.250, abs=1e-3)
+    assert t_quantile(0.025, 5) == pytest.approx(-2.571, abs=1e-3)
+
+    scores = [0.8, 0.85, 0.9, 0.75, 0.8]
+    low, high = confidence_interval(scores)
+    assert low == pytest.approx(0.82 - 2.776 * 0.0570 / 5**0.5, abs=1e-3)
+    assert high == pytest.approx(0.82 + 2.776 * 0.0570 / 5**0.5, abs=1e-3)
+    boot_low, boot_high = confidence_interval(scores, method="bootstrap",
+                                              seed=1)
+    assert low <= boot_low < 0.82 < boot_high <= high
+    with pytest.raises(ValueError):
+        confidence_interval([0.8])
+    with pytest.raises(ValueError):
+        confidence_interval(scores, method="jackknife")
+
+
+# Test for texts_agg_ci
+# Expected behavior: Assertion passes only if the whole interval meets the bound
+@patch('pytest_texts_score.evaluate_score.texts_multiple_precision')
+def test_texts_agg_ci_mock(mock_texts_multiple_precision):
+    from pytest_texts_score import texts_agg_ci
+
+    mock_texts_multiple_precision.return_value = [0.8, 0.85, 0.9, 0.75, 0.8]
+
+    result = texts_agg_ci("expected", "given", 0.7, score_type="precision")
+    assert result.mean() == pytest.approx(0.82)
+
+    with pytest.raises(pytest.fail.Exception) as excinfo:
+        texts_agg_ci("expected", "given", 0.8, score_type="precision")
+    assert "95% confidence interval [0.75, 0.89] below minimum" in str(
+        excinfo.value)
+    with pytest.raises(pytest.UsageError):
+        texts_agg_ci("expected", "given")
+    with pytest.raises(pytest.UsageError):
+        texts_agg_ci("expected", "given", lower_bound=0.7, full_runs=1,
+                     each_question_runs=5)
+
+
+# Test for texts_agg_ci with several answer runs per question set
+# Expected behavior: The interval is computed over the question run means
+@patch('pytest_texts_score.evaluate_score.texts_multiple_precision')
+def test_texts_agg_ci_question_runs_mock(mock_texts_multiple_precision):
+    from pytest_texts_score import texts_agg_ci
+    from pytest_texts_score.confidence import confidence_interval
+
+    mock_texts_multiple_precision.return_value = [
+        0.9, 0.9, 0.5, 0.5, 0.7, 0.7
+    ]
+
+    result = texts_agg_ci("expected", "given", 0.1, score_type="precision",
+                          full_runs=3, each_question_runs=2)
+
+    assert result.question_run_means() == pytest.approx([0.9, 0.5, 0.7])
+    assert result.confidence_interval() == pytest.approx(
+        confidence_interval([0.9, 0.5, 0.7]))
+    assert result.confidence_interval()[0] < confidence_interval(
+        result.scores)[0]
+
+
+# Test for texts_multiple_f1 with score_only=False
+# Expected behavior: Run scores are array-backed and compare equal to the tuples
+@patch('pytest_texts_score.evaluate_score.evaluate_questions')
+@patch('pytest_texts_score.evaluate_score.make_questions')
+def test_texts_multiple_f1_run_scores(mock_make_questions,
+                                      mock_evaluate_questions):
+    from array import array
+
+    mock_make_questions.return_value = "questions"
+    mock_evaluate_questions.side_effect = [[{"answer": 1.0}], [{"answer": 0.5}],
+                                           [{"answer": 0.5}], [{"answer": 0.5}]]
+
+    runs = texts_multiple_f1("expected", "given", 1, 2, score_only=False)
+
+    assert runs == [(0, 0, 1.0, 0.5, pytest.approx(2 / 3)),
+                    (0, 1, 0.5, 0.5, 0.5)]
+    assert runs[-1] == (0, 1, 0.5, 0.5, 0.5)
+    assert runs.column("precision") == array("d", [1.0, 0.5])
+    pytest.importorskip("numpy")
+    view = runs.to_numpy("f1")
+    assert not view.flags.owndata and list(view) == list(runs.column("f1"))
+
+
+# Test for StreamingAggregator
+# Expected behavior: Streaming aggregates match the exact ones in constant memory
+def test_streaming_aggregator():
+    import random
+    from statistics import mean, quantiles, stdev
+
+    from pytest_texts_score.evaluate_score import scores_agg
+    from pytest_texts_score.streaming import StreamingAggregator
+
+    rng = random.Random(0)
+    scores = [rng.random() for _ in range(5000)]
+    aggregator = StreamingAggregator(percentiles=(10, 90))
+    aggregator.extend(scores)
+
+    assert len(aggregator) == 5000
+    assert scores_agg(aggregator, "minimum") == min(scores)
+    assert scores_agg(aggregator, "mean") == pytest.approx(mean(scores))
+    assert aggregator.stats.std == pytest.approx(stdev(scores))
+    deciles = quantiles(scores, n=10)
+    assert scores_agg(aggregator, "median") == pytest.approx(deciles[4], abs=0.02)
+    assert aggregator.percentile(10) == pytest.approx(deciles[0], abs=0.02)
+    assert aggregator.percentile(90) == pytest.approx(deciles[8], abs=0.02)
+    with pytest.raises(ValueError):
+        aggregator.percentile(25)
+
+    small = StreamingAggregator()
+    small.extend([0.0, 1.0, 0.5])
+    assert scores_agg(small, "median") == 0.5
+
+
+# Test for P2Quantile with short streams
+# Expected behavior: The median of up to the exact size is exact, then estimated
+def test_p2_quantile_small_streams():
+    import random
+    from statistics import median
+
+    from pytest_texts_score.streaming import P2Quantile
+
+    rng = random.Random(1)
+    for count in range(1, 120):
+        values = [0.1 * i for i in range(count)]
+        rng.shuffle(values)
+        estimate = P2Quantile(0.5)
+        for value in values:
+            estimate.update(value)
+        if count <= 100:
+            assert estimate.value() == pytest.approx(median(values))
+        else:
+            assert estimate.value() == pytest.approx(median(values), abs=0.3)
+
+
+# Test for texts_multiple_recall with a streaming aggregator
+# Expected behavior: Scores are fed to the aggregator instead of being stored
+@patch('pytest_texts_score.evaluate_score.evaluate_questions')
+@patch('pytest_texts_score.evaluate_score.make_questions')
+def test_texts_multiple_recall_streaming(mock_make_questions,
+                                         mock_evaluate_questions):
+    from pytest_texts_score.streaming import StreamingAggregator
+
+    mock_make_questions.return_value = "questions"
+    mock_evaluate_questions.side_effect = [[{"answer": 1.0}], [{"answer": 0.0}],
+                                           [{"answer": 0.5}]]
+    aggregator = StreamingAggregator()
+
+    result = texts_multiple_recall("expected", "given", 3, 1,
+                                   aggregator=aggregator)
+
+    assert result is aggregator
+    assert aggregator.aggregate("median") == 0.5
+    assert aggregator.aggregate("maximum") == 1.0
+
+
+class _DictCache:
+    """In-memory stand-in for ``config.cache``."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, default):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+# Test for run planning
+# Expected behavior: Variance components are separated and answer runs are
+# only added when answering contributes most of the variance
+def test_variance_components_and_plan_runs():
+    from pytest_texts_score.planning import plan_runs, variance_components
+    from pytest_texts_score.records import RunScores
+
+    runs = RunScores(("recall",))
+    for q_i, scores in enumerate([(0.6, 0.8), (0.7, 0.9), (0.5, 0.7)]):
+        for a_i, score in enumerate(scores):
+            runs.append(q_i, a_i, score)
+    between, within = variance_components(runs, "recall")
+    assert within == pytest.approx(0.02)
+    assert between == pytest.approx(0.01 - 0.02 / 2)
+
+    assert plan_runs(0.01, 0.0, 0.1) == (4, 1)
+    assert plan_runs(0.0025, 0.01, 0.1) == (3, 2)
+    assert plan_runs(0.01, 0.0, 0.01, max_runs=20) == (20, 1)
+    assert plan_runs(0.01, 0.0, 0.1, median=True)[0] > 4
+
+
+# Test for texts_agg_recall_mean with full_runs="auto"
+# Expected behavior: Default runs without history, planned runs from the stored
+# variance afterwards
+@patch('pytest_texts_score.evaluate_score.texts_multiple_recall')
+def test_texts_agg_recall_mean_auto(mock_texts_multiple_recall, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.records import RunScores
+
+    def runs(expected, given, questions, answers, score_only, retry_on_error):
+        result = RunScores(("recall",))
+        for q_i in range(questions):
+            for a_i in range(answers):
+                result.append(q_i, a_i, 0.8 + 0.05 * (q_i % 2))
+        return result
+
+    cache = _DictCache()
+    monkeypatch.setattr(get_config(), "cache", cache, raising=False)
+    mock_texts_multiple_recall.side_effect = runs
+
+    texts_agg_recall_mean("expected", "given", 0.8, 0.1, full_runs="auto")
+    texts_agg_recall_mean("expected", "given", 0.8, 0.1, full_runs="auto")
+
+    run_counts = [
+        c.args[2:4] for c in mock_texts_multiple_recall.call_args_list
+    ]
+    assert run_counts == [(3, 2), (2, 1)]
+    (history,) = cache.values.values()
+    assert history["within"] == 0.0 and history["runs"] == 8
+
+
+# Test for incremental evaluation
+# Expected behavior: Unchanged passing assertions are skipped; failures, changed
+# bounds, fresh calls and expired verdicts are re-scored
+@patch('pytest_texts_score.api.texts_evaluate_recall')
+def test_incremental_skips_unchanged_passing(mock_texts_evaluate_recall,
+                                             monkeypatch):
+    import time
+
+    from pytest_texts_score.api import texts_expect_recall_range
+    from pytest_texts_score.plugin import get_config
+
+    cache = _DictCache()
+    monkeypatch.setattr(get_config(), "cache", cache, raising=False)
+    monkeypatch.setattr(get_config(), "_llm_incremental", True)
+    mock_texts_evaluate_recall.return_value = 0.9
+
+    texts_expect_recall_range("expected", "given", 0.8, 1.0)
+    texts_expect_recall_range("expected", "given", 0.8, 1.0)
+    texts_expect_recall_range("expected", "given", min_score=0.8, max_score=1.0)
+    assert mock_texts_evaluate_recall.call_count == 1
+
+    texts_expect_recall_range("expected", "given", 0.7, 1.0)
+    texts_expect_recall_range("expected", "given", 0.8, 1.0, fresh=True)
+    assert mock_texts_evaluate_recall.call_count == 3
+
+    for verdict in cache.values.values():
+        verdict["time"] = time.time() - 8 * 86400
+    texts_expect_recall_range("expected", "given", 0.8, 1.0)
+    assert mock_texts_evaluate_recall.call_count == 4
+
+    mock_texts_evaluate_recall.return_value = 0.5
+    with pytest.raises(pytest.fail.Exception):
+        texts_expect_recall_range("expected", "changed", 0.8, 1.0)
+    with pytest.raises(pytest.fail.Exception):
+        texts_expect_recall_range("expected", "changed", 0.8, 1.0)
+    assert mock_texts_evaluate_recall.call_count == 6
+
+
+# Test for incremental evaluation
+# Expected behavior: Nested assertions store no verdicts, and changed question
+# settings, endpoints or question bank content and verdicts without a time
+# re-score the assertion
+@patch('pytest_texts_score.api.texts_evaluate_recall')
+def test_incremental_fingerprint_settings(mock_texts_evaluate_recall,
+                                          monkeypatch, tmp_path):
+    from pytest_texts_score.api import texts_expect_recall_equal
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.question_bank import use_question_bank
+
+    cache = _DictCache()
+    monkeypatch.setattr(get_config(), "cache", cache, raising=False)
+    monkeypatch.setattr(get_config(), "_llm_incremental", True)
+    mock_texts_evaluate_recall.return_value = 0.9
+
+    texts_expect_recall_equal("expected", "given", 0.9)
+    assert len(cache.values) == 1
+    texts_expect_recall_equal("expected", "given", 0.9)
+    assert mock_texts_evaluate_recall.call_count == 1
+
+    monkeypatch.setattr(get_config(), "_llm_questions_max", 7)
+    texts_expect_recall_equal("expected", "given", 0.9)
+    assert mock_texts_evaluate_recall.call_count == 2
+
+    monkeypatch.setattr(get_config(), "_llm_endpoint", "https://other.invalid")
+    texts_expect_recall_equal("expected", "given", 0.9)
+    assert mock_texts_evaluate_recall.call_count == 3
+
+    for verdict in cache.values.values():
+        del verdict["time"]
+    texts_expect_recall_equal("expected", "given", 0.9)
+    assert mock_texts_evaluate_recall.call_count == 4
+
+    with use_question_bank(tmp_path / "bank.json") as bank:
+        texts_expect_recall_equal("expected", "given", 0.9)
+        bank.data["texts"]["key"] = {"preview": "", "question_sets": [["Q?"]]}
+        texts_expect_recall_equal("expected", "given", 0.9)
+    assert mock_texts_evaluate_recall.call_count == 6
+
+
+# Test for score snapshots
+# Expected behavior: Update mode writes scores; unchanged entries pass without
+# scoring, changed ones are re-scored and compared within the tolerance
+@patch('pytest_texts_score.snapshots.texts_evaluate_scores')
+def test_texts_snapshot(mock_texts_evaluate_scores, tmp_path):
+    from pytest_texts_score.evaluate_score import ScoreType
+    from pytest_texts_score.snapshots import TextsSnapshot, load_snapshots
+
+    path = tmp_path / "__snapshots__" / "test_module.json"
+    mock_texts_evaluate_scores.return_value = {
+        ScoreType.PRECISION: 1.0,
+        ScoreType.RECALL: 0.5,
+        ScoreType.F1: 2 / 3,
+    }
+
+    TextsSnapshot(path, "test_a", True, 0.1).check("expected", "given")
+    assert load_snapshots(path)["test_a::0"]["scores"]["recall"] == 0.5
+
+    snapshot = TextsSnapshot(path, "test_a", False, 0.1)
+    assert snapshot.check("expected", "given")["f1"] == pytest.approx(2 / 3)
+    assert mock_texts_evaluate_scores.call_count == 1
+
+    mock_texts_evaluate_scores.return_value = {
+        ScoreType.PRECISION: 1.0,
+        ScoreType.RECALL: 0.3,
+        ScoreType.F1: 0.46,
+    }
+    with pytest.raises(pytest.fail.Exception) as excinfo:
+        TextsSnapshot(path, "test_a", False, 0.1).check("expected", "edited")
+    assert "recall deviates from snapshot `test_a::0`: 0.30 vs baseline 0.50" in str(
+        excinfo.value)
+    assert "precision" not in str(excinfo.value).split("`expected`")[0]
+    TextsSnapshot(path, "test_a", False, 0.25).check("expected", "edited")
+    with pytest.raises(pytest.fail.Exception, match="update-snapshots"):
+        TextsSnapshot(path, "test_b", False, 0.1).check("expected", "given")
+
+
+# Test for score snapshots
+# Expected behavior: A changed model re-scores an entry with unchanged texts
+@patch('pytest_texts_score.snapshots.texts_evaluate_scores')
+def test_texts_snapshot_model_change(mock_texts_evaluate_scores, tmp_path,
+                                     monkeypatch):
+    from pytest_texts_score.evaluate_score import ScoreType
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.snapshots import TextsSnapshot
+
+    path = tmp_path / "__snapshots__" / "test_module.json"
+    mock_texts_evaluate_scores.return_value = {
+        ScoreType.PRECISION: 1.0,
+        ScoreType.RECALL: 0.5,
+        ScoreType.F1: 2 / 3,
+    }
+    TextsSnapshot(path, "test_a", True, 0.1).check("expected", "given")
+
+    monkeypatch.setattr(get_config(), "_llm_answers_model", "other-model")
+    TextsSnapshot(path, "test_a", False, 0.1).check("expected", "given")
+
+    assert mock_texts_evaluate_scores.call_count == 2
+
+
+# Test for the texts_score_snapshot fixture
+# Expected behavior: Entries are keyed by the test id within the module
+class TestSnapshotFixture:
+
+    def test_key(self, texts_score_snapshot):
+        assert texts_score_snapshot.test_name == "TestSnapshotFixture::test_key"
+
+
+# Test for question banks
+# Expected behavior: Building records the reference questions; using the bank
+# loads them for recall instead of generating them, but not for precision
+@patch('pytest_texts_score.evaluate_score.evaluate_questions')
+@patch('pytest_texts_score.evaluate_score.make_questions')
+def test_question_bank(mock_make_questions, mock_evaluate_questions, tmp_path,
+                       monkeypatch):
+    import json
+
+    from pytest_texts_score import use_question_bank
+    from pytest_texts_score.evaluate_score import texts_evaluate_precision
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.question_bank import clear_question_banks
+    from pytest_texts_score.questions import parse_questions
+
+    path = tmp_path / "__question_banks__" / "test_module.json"
+    mock_make_questions.side_effect = ['["Q1?"]', '["Q2?"]', '["P?"]']
+    mock_evaluate_questions.return_value = [{"answer": 1.0}]
+
+    monkeypatch.setattr(get_config(), "_llm_build_question_bank", True)
+    clear_question_banks()
+    with use_question_bank(path):
+        texts_multiple_recall("expected", "given", 2, 1)
+    (entry,) = json.loads(path.read_text())["texts"].values()
+    assert entry["question_sets"] == [["Q1?"], ["Q2?"]]
+
+    monkeypatch.setattr(get_config(), "_llm_build_question_bank", False)
+    clear_question_banks()
+    with use_question_bank(path):
+        texts_multiple_recall("expected", "given", 3, 1)
+        texts_evaluate_precision("expected", "given")
+    assert mock_make_questions.call_args_list == [
+        call("expected"), call("expected"), call("given")
+    ]
+    assert [
+        parse_questions(c.args[1])
+        for c in mock_evaluate_questions.call_args_list[2:5]
+    ] == [["Q1?"], ["Q2?"], ["Q1?"]]
+    clear_question_banks()
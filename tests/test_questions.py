@@ -0,0 +1,391 @@
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pytest_texts_score.communication import evaluate_questions, make_questions
+from pytest_texts_score.questions import (
+    deduplicate_questions,
+    dump_questions,
+    merge_question_sets,
+    parse_questions,
+    question_budget,
+    split_evenly,
+    split_into_chunks,
+    subsample_questions,
+)
+from pytest_texts_score.records import QuestionAnswers, question_table
+from pytest_texts_score.retrieval import get_index
+from pytest_texts_score.tokens import (
+    PromptTooLongError,
+    count_tokens,
+    estimate_answers_output_tokens,
+    fit_max_tokens,
+)
+
+long_text = " ".join(f"Sentence number {i} describes fact {i}." for i in range(60))
+
+
+# Test for parse_questions and dump_questions
+# Expected behavior: A question set survives a round trip, fenced JSON is accepted
+def test_parse_dump_round_trip():
+    questions = ["Does the text say A?", "Does the text say B?"]
+
+    assert parse_questions(dump_questions(questions)) == questions
+    assert parse_questions('```json\n{"1": "Does the text say A?"}\n```') == [
+        "Does the text say A?"
+    ]
+    with pytest.raises(ValueError):
+        parse_questions("not json")
+
+
+# Test for merge_question_sets
+# Expected behavior: Questions differing only in case or spacing are merged
+def test_merge_question_sets():
+    merged = merge_question_sets([["Does the text say A?"],
+                                  ["does the  text say A?", "Does it say B?"]])
+
+    assert merged == ["Does the text say A?", "Does it say B?"]
+
+
+# Test for split_into_chunks
+# Expected behavior: Chunks respect the size limit and neighbours overlap
+def test_split_into_chunks():
+    chunks = split_into_chunks(long_text, chunk_tokens=100, overlap_tokens=20)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.split(". ")[-1] in current
+    assert split_into_chunks("Short text.", 100, 20) == ["Short text."]
+
+
+# Test for count_tokens without tokenizer files
+# Expected behavior: Failing or stalled encoding downloads fall back to the estimate
+@pytest.mark.parametrize("load", [ConnectionError, lambda name: time.sleep(1)])
+def test_count_tokens_offline(load, monkeypatch):
+    from pytest_texts_score import tokens
+
+    fake_tiktoken = MagicMock()
+    fake_tiktoken.encoding_for_model.side_effect = load
+    fake_tiktoken.get_encoding.side_effect = load
+    monkeypatch.setattr(tokens, "tiktoken", fake_tiktoken)
+    monkeypatch.setattr(tokens, "ENCODING_LOAD_TIMEOUT", 0.05)
+    tokens._get_encoding.cache_clear()
+    try:
+        assert count_tokens("abcdefgh", "offline-model") == 2
+    finally:
+        tokens._get_encoding.cache_clear()
+
+
+# Test for chunked question generation
+# Expected behavior: Each chunk gets its own request and the sets are merged
+@patch('pytest_texts_score.communication.complete')
+def test_make_questions_chunked(mock_complete, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_questions_chunk_tokens", 100)
+    monkeypatch.setattr(get_config(), "_llm_questions_chunk_overlap", 20)
+    mock_complete.side_effect = lambda stage, system, user, max_tokens: json.dumps(
+        {
+            "1": "Does the text mention sentences?",
+            "2": f"Does the text contain {len(user)} characters?",
+        })
+
+    questions = parse_questions(make_questions(long_text))
+
+    chunks = split_into_chunks(long_text, 100, 20)
+    assert mock_complete.call_count == len(chunks)
+    assert questions.count("Does the text mention sentences?") == 1
+    assert len(questions) == 1 + len({len(chunk) for chunk in chunks})
+
+
+# Test for chunked question generation
+# Expected behavior: Tokens are counted with the tokenizer of the questions model
+@patch('pytest_texts_score.questions.count_tokens', return_value=1)
+@patch('pytest_texts_score.communication.count_tokens', return_value=1000)
+@patch('pytest_texts_score.communication.complete')
+def test_make_questions_chunked_counts_with_model(mock_complete,
+                                                  mock_count_tokens,
+                                                  mock_chunk_count_tokens,
+                                                  monkeypatch):
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_questions_chunk_tokens", 100)
+    monkeypatch.setattr(get_config(), "_llm_questions_model", "questions-model")
+    mock_complete.return_value = json.dumps({"1": "Does the text say A?"})
+
+    make_questions(long_text)
+
+    assert mock_count_tokens.call_args_list[0].args == (long_text,
+                                                        "questions-model")
+    models = {c.args[1] for c in mock_chunk_count_tokens.call_args_list}
+    assert models == {"questions-model"}
+
+
+# Test for deduplicate_questions
+# Expected behavior: Rephrased framing is dropped, negations and other facts are kept
+def test_deduplicate_questions():
+    questions = [
+        "Does the text state that Marie Curie discovered radium?",
+        "Does the text say that Marie Curie discovered radium?",
+        "Does the text mention Marie Curie discovered radium?",
+        "Does the text state that Marie Curie did not discover radium?",
+        "Does the text state that Marie Curie discovered polonium?",
+    ]
+
+    assert deduplicate_questions(questions, 0.8) == [
+        questions[0], questions[3], questions[4]
+    ]
+    assert deduplicate_questions(questions, 0.5) == [questions[0], questions[3]]
+
+
+# Test for de-duplication in make_questions
+# Expected behavior: Near-duplicates are dropped and counted in the session stats
+@patch('pytest_texts_score.communication.complete')
+def test_make_questions_deduplicated(mock_complete, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+    from pytest_texts_score.stats import session_stats
+
+    monkeypatch.setattr(get_config(), "_llm_questions_dedupe_threshold", 0.8)
+    mock_complete.return_value = dump_questions([
+        "Does the text state that RAM is fast?",
+        "Does the text say RAM is fast?",
+        "Does the text state that disks are slow?",
+    ])
+    before = session_stats.get("questions_deduplicated")
+
+    questions = parse_questions(make_questions("RAM is fast. Disks are slow."))
+
+    assert questions == [
+        "Does the text state that RAM is fast?",
+        "Does the text state that disks are slow?",
+    ]
+    assert session_stats.get("questions_deduplicated") == before + 1
+
+
+# Test for question_budget and subsample_questions
+# Expected behavior: The tighter limit wins and subsampling spreads over the set
+def test_question_budget():
+    assert question_budget(1000, 0, 0) is None
+    assert question_budget(1000, 25, 0) == 25
+    assert question_budget(1000, 25, 1.5) == 15
+    assert question_budget(10, 0, 2) == 1
+    assert subsample_questions(list("abcdefgh"), 4) == list("aceg")
+    assert subsample_questions(list("ab"), 4) == list("ab")
+
+
+# Test for the question budget in make_questions
+# Expected behavior: The prompt states the budget and extra questions are dropped
+@patch('pytest_texts_score.communication.complete')
+def test_make_questions_budget(mock_complete, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_questions_max", 3)
+    mock_complete.return_value = dump_questions(
+        [f"Does the text say {i}?" for i in range(6)])
+
+    questions = parse_questions(make_questions(long_text))
+
+    assert questions == [f"Does the text say {i}?" for i in (0, 2, 4)]
+    system_prompt = mock_complete.call_args.args[1]
+    assert "at most 3 questions" in system_prompt
+    assert "Maximise the number" not in system_prompt
+
+
+paragraphs_text = """The kernel controls hardware and manages system resources.
+
+A load balancer spreads traffic across servers to keep them stable.
+
+Ethernet is a wired method to connect devices in a network.
+
+RAM stores temporary data used by active programs."""
+
+
+# Test for paragraph-wise question generation
+# Expected behavior: Only edited paragraphs are sent to the LLM in a new session,
+# while repeated draws within a session get new question sets
+@patch('pytest_texts_score.communication.complete')
+def test_make_questions_by_paragraph(mock_complete, monkeypatch):
+    from pytest_texts_score.cache import paragraph_questions
+    from pytest_texts_score.plugin import get_config
+
+    class DictCache(dict):
+
+        def set(self, key, value):
+            self[key] = json.loads(json.dumps(value))
+
+    monkeypatch.setattr(get_config(), "cache", DictCache(), raising=False)
+    monkeypatch.setattr(get_config(), "_llm_questions_by_paragraph", True)
+    mock_complete.side_effect = lambda stage, system, user, max_tokens: (
+        dump_questions([f"Does the text mention {user.split()[2]}?"]))
+    paragraph_questions.clear()
+
+    first = parse_questions(make_questions(paragraphs_text))
+    assert len(first) == 4 and mock_complete.call_count == 4
+    make_questions(paragraphs_text)
+    assert mock_complete.call_count == 8
+
+    paragraph_questions.clear()
+    edited = paragraphs_text.replace("Ethernet is", "Ethernet was")
+    assert parse_questions(make_questions(edited)) == first
+    assert mock_complete.call_count == 9
+    assert "Ethernet was" in mock_complete.call_args.args[2]
+    paragraph_questions.clear()
+
+
+# Test for BM25Index.search
+# Expected behavior: The most relevant paragraphs are returned in document order
+def test_bm25_search():
+    index = get_index(paragraphs_text)
+
+    assert len(index.passages) == 4
+    assert index.search("Does the text state that RAM stores data?", 1) == [3]
+    assert index.search("kernel hardware traffic servers", 2) == [0, 1]
+    assert get_index(paragraphs_text) is index
+
+
+# Test for retrieval-scoped answering
+# Expected behavior: Each shard of questions is answered against its top-k paragraphs
+@patch('pytest_texts_score.communication.complete')
+def test_evaluate_questions_retrieval(mock_complete, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_answers_retrieval_top_k", 1)
+    monkeypatch.setattr(get_config(), "_llm_answers_retrieval_shard_size", 1)
+    mock_complete.side_effect = lambda stage, system, user, max_tokens: json.dumps(
+        {"list": [{
+            "question": "q",
+            "answer": 1
+        }]})
+    questions = dump_questions([
+        "Does the text state that Ethernet is wired?",
+        "Does the text state that the kernel manages resources?",
+    ])
+
+    answers = evaluate_questions(paragraphs_text, questions)
+
+    assert len(answers) == 2
+    prompts = [c.args[2] for c in mock_complete.call_args_list]
+    assert "Ethernet" in prompts[0] and "kernel" not in prompts[0]
+    assert "kernel" in prompts[1] and "Ethernet" not in prompts[1]
+
+
+# Test for split_evenly
+# Expected behavior: Shards differ in size by at most one and keep question order
+def test_split_evenly():
+    assert split_evenly(list("abcdefg"), 3) == [list("abc"), list("de"), list("fg")]
+    assert split_evenly(list("ab"), 5) == [["a"], ["b"]]
+
+
+# Test for sharded answering
+# Expected behavior: Shards are answered with the full text and merged in order
+@patch('pytest_texts_score.communication.complete')
+def test_evaluate_questions_sharded(mock_complete, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_answers_shards", 3)
+
+    def answer(stage, system, user, max_tokens):
+        questions = parse_questions(user.split("Questions to answer:")[1])
+        return json.dumps({
+            "list": [{
+                "question": q,
+                "answer": 1
+            } for q in questions]
+        })
+
+    mock_complete.side_effect = answer
+    questions = [f"Does the text say {i}?" for i in range(7)]
+
+    answers = evaluate_questions("The text.", dump_questions(questions))
+
+    assert [a["question"] for a in answers] == questions
+    assert mock_complete.call_count == 3
+    assert all("The text." in c.args[2] for c in mock_complete.call_args_list)
+
+
+# Test for fit_max_tokens
+# Expected behavior: max_tokens is lowered to the free context, overflow raises early
+def test_fit_max_tokens():
+    assert fit_max_tokens(100, 8192, 1000, 1) == 900
+    assert fit_max_tokens(100, 500, 1000, 500) == 500
+    with pytest.raises(PromptTooLongError, match="context window"):
+        fit_max_tokens(900, 500, 1000, 500)
+
+
+# Test for adaptive max_tokens
+# Expected behavior: Answer requests reserve tokens proportional to the question count
+@patch('pytest_texts_score.communication.complete')
+def test_adaptive_max_tokens(mock_complete, monkeypatch):
+    from pytest_texts_score.plugin import get_config
+
+    monkeypatch.setattr(get_config(), "_llm_adaptive_max_tokens", True)
+    mock_complete.return_value = '{"list": []}'
+
+    evaluate_questions("text", dump_questions(["Does the text say A?"]))
+    evaluate_questions("text",
+                       dump_questions(["Does the text say A?"] * 20))
+
+    small, large = [c.args[3] for c in mock_complete.call_args_list]
+    assert small < large <= get_config()._llm_answers_max_tokens
+    assert small == estimate_answers_output_tokens(["Does the text say A?"])
+
+
+# Test for QuestionAnswers
+# Expected behavior: Answers reference the shared question table and read like dicts
+@patch('pytest_texts_score.communication.complete')
+def test_evaluate_questions_question_answers(mock_complete):
+    questions_text = dump_questions(["Does the text say A?", "Does the text say B?"])
+    mock_complete.return_value = json.dumps(
+        {"list": [{
+            "question": "Does the text say B?",
+            "answer": 0
+        }]})
+
+    answers = evaluate_questions("text", questions_text)
+    again = evaluate_questions("text", questions_text)
+
+    assert isinstance(answers, QuestionAnswers)
+    assert answers == [{"question": "Does the text say B?", "answer": 0.0}]
+    assert list(answers.indices) == [1]
+    assert answers.table is again.table is question_table(questions_text)
+    assert answers.mean() == 0.0
+
+
+# Test for QuestionAnswers
+# Expected behavior: Unknown echoed questions do not leak into the shared table
+@patch('pytest_texts_score.communication.complete')
+def test_evaluate_questions_unknown_question_keeps_table(mock_complete):
+    questions_text = dump_questions(["Does the text say A?", "Does the text say B?"])
+    mock_complete.side_effect = [
+        json.dumps({"list": [{
+            "question": "Does the text say C?",
+            "answer": 1
+        }]}),
+        json.dumps({
+            "list": [{
+                "question": "Does the text say A?",
+                "answer": 1
+            }, {
+                "question": "Does the text say B?",
+                "answer": 0
+            }]
+        }),
+    ]
+
+    first = evaluate_questions("text", questions_text)
+    second = evaluate_questions("text", questions_text)
+
+    assert first == [{"question": "Does the text say C?", "answer": 1.0}]
+    assert first.table is not question_table(questions_text)
+    assert len(question_table(questions_text)) == 2
+    assert list(second.indices) == [0, 1]
+    assert second == [{
+        "question": "Does the text say A?",
+        "answer": 1.0
+    }, {
+        "question": "Does the text say B?",
+        "answer": 0.0
+    }]
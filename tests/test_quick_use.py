@@ -1,3 +1,6 @@
+import pytest
+
+
 # Test for texts_compare_fixture
 # Expected behavior: Verifies that the texts_score fixture is properly registered and works in pytest
 def test_texts_compare_fixture(pytester):
@@ -70,3 +73,72 @@ def test_import(pytester):
 
     # Verify that we get a '0' exit code for the testsuite (success)
     assert result.ret == 0
+
+
+# Test for the CLI toggles
+# Expected behavior: CLI flags override the ini value, which overrides the default
+def test_cli_toggles_override_ini(pytester):
+    """Make sure that CLI toggles take precedence over ini values."""
+    pytester.makeini("""
+        [pytest]
+        llm_score_store = true
+        llm_answer_cache = true
+        llm_answers_shards = 2
+        llm_breaker_action = skip
+    """)
+    pytester.makepyfile("""
+    from pytest_texts_score.plugin import get_config
+
+    def test_sth():
+        config = get_config()
+        assert config._llm_score_store is False
+        assert config._llm_answer_cache is True
+        assert config._llm_incremental is True
+        assert config._llm_answers_shards == 4
+        assert config._llm_breaker_action == "skip"
+    """)
+
+    result = pytester.runpytest_subprocess(
+        '-v',
+        '--llm-api-key=key',
+        '--llm-endpoint=https://example.invalid',
+        '--llm-deployment=deployment',
+        '--llm-model=model',
+        '--no-llm-score-store',
+        '--llm-incremental',
+        '--llm-answers-shards=4',
+    )
+
+    result.stdout.fnmatch_lines([
+        '*::test_sth PASSED*',
+    ])
+    assert result.ret == 0
+
+
+# Test for the validation of numeric settings
+# Expected behavior: Out-of-range values are rejected as usage errors
+@pytest.mark.parametrize("setting, value", [
+    ("llm_answers_retrieval_top_k", "-1"),
+    ("llm_answers_retrieval_shard_size", "0"),
+    ("llm_answers_shards", "0"),
+])
+def test_invalid_setting_is_usage_error(pytester, setting, value):
+    """Make sure that out-of-range settings stop the session."""
+    pytester.makeini(f"""
+        [pytest]
+        {setting} = {value}
+    """)
+    pytester.makepyfile("""
+    def test_sth():
+        pass
+    """)
+
+    result = pytester.runpytest_subprocess(
+        '--llm-api-key=key',
+        '--llm-endpoint=https://example.invalid',
+        '--llm-deployment=deployment',
+        '--llm-model=model',
+    )
+
+    result.stderr.fnmatch_lines([f'*`{setting}` must be at least*'])
+    assert result.ret == pytest.ExitCode.USAGE_ERROR